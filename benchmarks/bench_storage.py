@@ -0,0 +1,73 @@
+"""
+Сравнение производительности JSONSaver и SQLiteSaver.
+
+Запуск из корня проекта:
+python benchmarks/bench_storage.py 10000 100000 1000000
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path[:0] = [os.path.join(os.path.dirname(__file__), '..'),
+                os.path.join(os.path.dirname(__file__), '..', 'src')]
+
+from jsonsaver import JSONSaver  # noqa: E402
+from sqlitesaver import SQLiteSaver  # noqa: E402
+from vacancy import Vacancy  # noqa: E402
+
+WORDS = ['python', 'django', 'sql', 'docker', 'linux', 'git', 'english',
+         'fastapi', 'asyncio', 'postgresql', 'redis', 'kafka', 'опыт',
+         'работы', 'знание', 'команде']
+
+
+def make_vacancies(size: int) -> list[Vacancy]:
+    """Создает детерминированный набор вакансий заданного размера."""
+    rnd = random.Random(size)
+    return [Vacancy(f"Разработчик {i}", f"https://example.ru/vacancy/{i}",
+                    rnd.randrange(20_000, 500_000, 1000),
+                    ' '.join(rnd.sample(WORDS, 6)))
+            for i in range(size)]
+
+
+def timed(func, *args) -> float:
+    """Возвращает время выполнения функции в секундах."""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def run(saver, vacancies: list[Vacancy]) -> dict:
+    """Выполняет сценарий операций над хранилищем."""
+    links = [vacancy.link for vacancy in vacancies[::100]]
+    return {
+        'add_vacancy': timed(saver.add_vacancy, vacancies),
+        'get_salary': timed(saver.get_salary, 100_000),
+        'get_requirement': timed(saver.get_requirement, ['python', 'sql']),
+        'delete_vacancies': timed(saver.delete_vacancies, links),
+    }
+
+
+def main(sizes: list[int]) -> None:
+    for size in sizes:
+        vacancies = make_vacancies(size)
+        with tempfile.TemporaryDirectory() as directory:
+            results = {
+                'JSONSaver': run(JSONSaver(os.path.join(directory,
+                                                        'v.json')),
+                                 vacancies),
+                'SQLiteSaver': run(SQLiteSaver(os.path.join(directory,
+                                                            'v.sqlite')),
+                                   vacancies),
+            }
+        print(f"{size} вакансий:")
+        for name, timings in results.items():
+            line = ', '.join(f"{operation}={seconds:.3f}s"
+                             for operation, seconds in timings.items())
+            print(f"  {name}: {line}")
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or [10_000, 100_000,
+                                                   1_000_000])
@@ -0,0 +1,53 @@
+"""
+Сравнение способов выбора лучших N вакансий по зарплате:
+полная сортировка, ограниченная куча (sort_vacancies)
+и чтение из индекса зарплат JSONSaver.
+
+Запуск из корня проекта:
+python benchmarks/bench_top_n.py 1000000 10
+"""
+import os
+import random
+import sys
+import time
+
+sys.path[:0] = [os.path.join(os.path.dirname(__file__), '..'),
+                os.path.join(os.path.dirname(__file__), '..', 'src')]
+
+from main_utils import sort_vacancies  # noqa: E402
+from salaryindex import SalaryIndex  # noqa: E402
+
+
+def timed(func, *args) -> float:
+    """Возвращает время выполнения функции в секундах."""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main(size: int, top_n: int) -> None:
+    rnd = random.Random(size)
+    items = [{'title': f"Разработчик {i}",
+              'link': f"https://example.ru/vacancy/{i}",
+              'salary': rnd.randrange(20_000, 500_000, 1000),
+              'requirement': 'python'} for i in range(size)]
+
+    index = SalaryIndex()
+    build = timed(index.add, items)
+
+    results = {
+        'full_sort': timed(lambda: sorted(items, key=lambda x: x['salary'],
+                                          reverse=True)[:top_n]),
+        'heap': timed(sort_vacancies, items, '2', top_n),
+        'index': timed(index.top, top_n, True),
+        'index_range': timed(index.range, 100_000, 200_000),
+    }
+    print(f"top-{top_n} из {size} вакансий "
+          f"(построение индекса {build:.3f}s):")
+    for name, seconds in results.items():
+        print(f"  {name}: {seconds * 1000:.3f} ms")
+
+
+if __name__ == '__main__':
+    arguments = [int(argument) for argument in sys.argv[1:]]
+    main(*(arguments or [1_000_000, 10]))
@@ -0,0 +1,60 @@
+"""
+Сравнение памяти и времени построения вакансий:
+список экземпляров Vacancy со словарями to_dict()
+и колоночный VacancyBatch.
+
+Запуск из корня проекта:
+python benchmarks/bench_vacancy.py 100000
+"""
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path[:0] = [os.path.join(os.path.dirname(__file__), '..'),
+                os.path.join(os.path.dirname(__file__), '..', 'src')]
+
+from vacancy import Vacancy  # noqa: E402
+from vacancybatch import VacancyBatch  # noqa: E402
+
+REQUIREMENTS = ['знание python, опыт работы с django',
+                'опыт работы от 3 лет, sql', 'Нет данных.']
+
+
+def make_rows(size: int) -> list[tuple]:
+    """Создает строки вакансий так, как их возвращает organize_rows."""
+    rnd = random.Random(size)
+    return [(f"Python-разработчик {i % 50}", f"https://hh.ru/vacancy/{i}",
+             rnd.randrange(20_000, 500_000, 1000),
+             rnd.choice(REQUIREMENTS)) for i in range(size)]
+
+
+def measure(build, rows: list[tuple]) -> tuple[float, int]:
+    """Возвращает время построения и объем выделенной памяти."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build(rows)
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, size
+
+
+def build_objects(rows: list[tuple]) -> list:
+    """Прежний путь: Vacancy для каждой записи и словарь to_dict()."""
+    vacancies = [Vacancy(*row) for row in rows]
+    return [vacancies, [vacancy.to_dict() for vacancy in vacancies]]
+
+
+def main(size: int) -> None:
+    rows = make_rows(size)
+    for name, build in (('Vacancy + to_dict', build_objects),
+                        ('VacancyBatch', VacancyBatch.from_rows)):
+        elapsed, memory = measure(build, rows)
+        print(f"{name}: {elapsed:.3f}s, {memory / size:.0f} байт/вакансия")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
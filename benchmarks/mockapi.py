@@ -0,0 +1,144 @@
+"""
+Локальная заглушка API HeadHunter и SuperJob для замеров.
+
+Отвечает на те же адреса, что и настоящие API
+(/vacancies и /2.0/vacancies/), с заданной задержкой
+и количеством страниц поиска. Ответы строятся генератором synthetic.
+
+Запуск из корня проекта:
+python benchmarks/mockapi.py --port 8000 --latency 50 --pages 10
+"""
+import argparse
+import json
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from synthetic import hh_page, sj_page
+
+
+class MockAPIHandler(BaseHTTPRequestHandler):
+    """Обработчик запросов к заглушке API."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        """Возвращает страницу поиска HeadHunter или SuperJob."""
+        server = self.server
+        parts = urlsplit(self.path)
+        params = parse_qs(parts.query)
+        page = int(params.get('page', ['0'])[0])
+        server.count_request()
+
+        if parts.path.rstrip('/') == '/vacancies':
+            body = server.render('hh', page)
+        elif parts.path.rstrip('/') == '/2.0/vacancies':
+            body = server.render('sj', page)
+        else:
+            self.send_error(404)
+            return
+
+        if server.latency:
+            time.sleep(server.latency)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        """Не выводит журнал запросов, чтобы не искажать замеры."""
+
+
+class MockAPIServer(ThreadingHTTPServer):
+    """
+    Многопоточный HTTP-сервер заглушки API.
+    Используется как контекстный менеджер: сервер запускается
+    в фоновом потоке и останавливается при выходе из блока.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, latency: float = 0.0,
+                 pages: int = 5, per_page: int = 100,
+                 seed: int = 0) -> None:
+        """
+        Создание экземпляра класса MockAPIServer.
+
+        :param port: Порт сервера (0 - любой свободный).
+        :param latency: Задержка перед каждым ответом (секунды).
+        :param pages: Количество страниц поиска на каждой платформе.
+        :param per_page: Количество вакансий на странице.
+        :param seed: Начальное значение генератора вакансий.
+        """
+        super().__init__(('127.0.0.1', port), MockAPIHandler)
+        self.latency = latency
+        self.pages = pages
+        self.per_page = per_page
+        self.seed = seed
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Базовый адрес сервера для атрибута url клиентов PageAPI."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count_request(self) -> None:
+        """Увеличивает счетчик обработанных запросов."""
+        with self._lock:
+            self.requests += 1
+
+    @lru_cache(maxsize=256)
+    def render(self, platform: str, page: int) -> bytes:
+        """
+        Возвращает тело ответа для страницы поиска.
+        Страницы за пределами pages пустые, как у настоящих API.
+        """
+        build = hh_page if platform == 'hh' else sj_page
+        payload = build(page, self.pages, self.per_page, self.seed)
+        if page >= self.pages:
+            payload['items' if platform == 'hh' else 'objects'] = []
+        return json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+    def __enter__(self) -> 'MockAPIServer':
+        """Запускает сервер в фоновом потоке."""
+        self._thread = threading.Thread(target=self.serve_forever,
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Останавливает сервер и закрывает сокет."""
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Заглушка API HeadHunter и SuperJob."
+    )
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=50,
+                        help="Задержка ответа (миллисекунды).")
+    parser.add_argument('--pages', type=int, default=10,
+                        help="Количество страниц поиска.")
+    arguments = parser.parse_args()
+
+    with MockAPIServer(arguments.port, arguments.latency / 1000,
+                       arguments.pages) as server:
+        print(f"Заглушка API запущена: {server.url}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,429 @@
+"""
+Набор замеров производительности проекта.
+
+Команда run выполняет сценарии на синтетических данных и заглушке API
+и сохраняет результаты в JSON, команда compare сравнивает два файла
+результатов и завершается с кодом 1, если какой-либо сценарий
+замедлился больше допустимого.
+
+Запуск из корня проекта:
+python benchmarks/suite.py run --size 10000 --output results.json
+python benchmarks/suite.py compare baseline.json results.json --tolerance 0.1
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+SRC_DIR = os.path.join(ROOT_DIR, 'src')
+sys.path[:0] = [ROOT_DIR, SRC_DIR]
+
+from synthetic import hh_items, sj_items  # noqa: E402
+from mockapi import MockAPIServer  # noqa: E402
+from hhapi import HeadHunterAPI  # noqa: E402
+from sjapi import SuperJobAPI  # noqa: E402
+from vacancy import Vacancy  # noqa: E402
+from jsonsaver import JSONSaver  # noqa: E402
+from main_utils import sort_vacancies  # noqa: E402
+from pipeline import run_pipeline  # noqa: E402
+from transport import HTTPTransport  # noqa: E402
+from cache import ResponseCache  # noqa: E402
+from scheduler import RequestScheduler  # noqa: E402
+from codec import CODECS, get_codec  # noqa: E402
+
+# Сценарии по именам. Сценарий получает контекст замера, выполняет
+# подготовку и возвращает функцию, время выполнения которой замеряется.
+SCENARIOS = {}
+
+
+def scenario(name: str):
+    """Регистрирует функцию подготовки сценария под именем name."""
+    def register(func):
+        SCENARIOS[name] = func
+        return func
+    return register
+
+
+class Context:
+    """Общие данные сценариев: входные данные, каталог и заглушка API."""
+
+    def __init__(self, size: int, directory: str, latency: float,
+                 pages: int) -> None:
+        self.size = size
+        self.directory = directory
+        self.latency = latency
+        self.pages = pages
+        self.hh_items = hh_items(size)
+        self.sj_items = sj_items(size)
+        self.rows = list(HeadHunterAPI.organize_rows(self.hh_items))
+        self.dicts = HeadHunterAPI.data_organize(self.hh_items)
+        # Страницы поиска размером size в виде ответов API.
+        self.hh_body = json.dumps({'items': self.hh_items, 'pages': 1},
+                                  ensure_ascii=False).encode('utf-8')
+        self.sj_body = json.dumps({'objects': self.sj_items,
+                                   'total': size},
+                                  ensure_ascii=False).encode('utf-8')
+        self._server = None
+
+    def path(self, name: str) -> str:
+        """Возвращает путь к файлу во временном каталоге замера."""
+        return os.path.join(self.directory, name)
+
+    def vacancies(self) -> list[Vacancy]:
+        """Возвращает новый список экземпляров Vacancy."""
+        return [Vacancy(*row) for row in self.rows]
+
+    def saver(self, name: str = 'vacancies.json') -> JSONSaver:
+        """Возвращает JSONSaver, заполненный всеми вакансиями."""
+        saver = JSONSaver(self.path(name))
+        saver.add_vacancy(self.vacancies())
+        return saver
+
+    def server(self) -> MockAPIServer:
+        """Запускает заглушку API при первом обращении."""
+        if self._server is None:
+            self._server = MockAPIServer(latency=self.latency,
+                                         pages=self.pages).__enter__()
+        return self._server
+
+    def close(self) -> None:
+        """Останавливает заглушку API."""
+        if self._server is not None:
+            self._server.__exit__()
+            self._server = None
+
+
+@scenario('pageapi.data_organize.hh')
+def data_organize_hh(ctx: Context):
+    return lambda: HeadHunterAPI.data_organize(ctx.hh_items)
+
+
+@scenario('pageapi.data_organize.sj')
+def data_organize_sj(ctx: Context):
+    return lambda: SuperJobAPI.data_organize(ctx.sj_items)
+
+
+@scenario('pageapi.batch_organize.hh')
+def batch_organize_hh(ctx: Context):
+    return lambda: HeadHunterAPI.batch_organize(ctx.hh_items)
+
+
+@scenario('vacancy.init')
+def vacancy_init(ctx: Context):
+    return ctx.vacancies
+
+
+@scenario('vacancy.to_dict')
+def vacancy_to_dict(ctx: Context):
+    vacancies = ctx.vacancies()
+    return lambda: [vacancy.to_dict() for vacancy in vacancies]
+
+
+@scenario('jsonsaver.add_vacancy')
+def jsonsaver_add_vacancy(ctx: Context):
+    saver = JSONSaver(ctx.path('add.json'))
+    vacancies = ctx.vacancies()
+    return lambda: saver.add_vacancy(vacancies)
+
+
+@scenario('jsonsaver.upsert_vacancy')
+def jsonsaver_upsert_vacancy(ctx: Context):
+    saver = ctx.saver()
+    # Половина вакансий обновляет сохраненные, половина - новые.
+    vacancies = [Vacancy(title, f"{link}?v=2" if number % 2 else link,
+                         salary + 1000, requirement)
+                 for number, (title, link, salary, requirement)
+                 in enumerate(ctx.rows)]
+    return lambda: saver.upsert_vacancy(vacancies)
+
+
+@scenario('jsonsaver.load_data')
+def jsonsaver_load_data(ctx: Context):
+    ctx.saver('load.json')
+    saver = JSONSaver(ctx.path('load.json'))
+    return saver.load_data
+
+
+@scenario('jsonsaver.save_data')
+def jsonsaver_save_data(ctx: Context):
+    return ctx.saver().save_data
+
+
+@scenario('jsonsaver.save_data.compact')
+def jsonsaver_save_data_compact(ctx: Context):
+    saver = ctx.saver('compact.json')
+    saver.compact = True
+    return saver.save_data
+
+
+@scenario('jsonsaver.load_data.compact')
+def jsonsaver_load_data_compact(ctx: Context):
+    saver = ctx.saver('load-compact.json')
+    saver.compact = True
+    saver.save_data()
+    return JSONSaver(ctx.path('load-compact.json')).load_data
+
+
+@scenario('jsonsaver.get_salary')
+def jsonsaver_get_salary(ctx: Context):
+    saver = ctx.saver()
+    return lambda: saver.get_salary(150_000)
+
+
+@scenario('jsonsaver.get_requirement')
+def jsonsaver_get_requirement(ctx: Context):
+    saver = ctx.saver()
+    return lambda: saver.get_requirement(['python', 'sql'])
+
+
+@scenario('jsonsaver.salary_range')
+def jsonsaver_salary_range(ctx: Context):
+    saver = ctx.saver()
+    return lambda: saver.salary_range(100_000, 200_000)
+
+
+@scenario('jsonsaver.top_salaries')
+def jsonsaver_top_salaries(ctx: Context):
+    saver = ctx.saver()
+    return lambda: saver.top_salaries(10)
+
+
+@scenario('jsonsaver.delete_vacancy')
+def jsonsaver_delete_vacancy(ctx: Context):
+    saver = ctx.saver()
+    return lambda: saver.delete_vacancy(ctx.dicts[len(ctx.dicts) // 2]
+                                        ['link'])
+
+
+@scenario('jsonsaver.delete_vacancies')
+def jsonsaver_delete_vacancies(ctx: Context):
+    saver = ctx.saver()
+    links = [item['link'] for item in ctx.dicts[::10]]
+    return lambda: saver.delete_vacancies(links)
+
+
+def codec_scenarios(name: str) -> None:
+    """
+    Регистрирует сценарии кодека name: разбор страниц API
+    с пропуском ненужных полей, запись хранилища с отступами
+    и компактно, чтение хранилища. Сравнение одноименных сценариев
+    разных кодеков показывает выигрыш быстрых библиотек.
+    """
+    codec = CODECS[name]()
+
+    @scenario(f"codec.{name}.decode_page.hh")
+    def decode_page_hh(ctx: Context):
+        return lambda: codec.decode(ctx.hh_body, HeadHunterAPI.page_fields)
+
+    @scenario(f"codec.{name}.decode_page.sj")
+    def decode_page_sj(ctx: Context):
+        return lambda: codec.decode(ctx.sj_body, SuperJobAPI.page_fields)
+
+    @scenario(f"codec.{name}.dumps_store")
+    def dumps_store(ctx: Context):
+        return lambda: codec.dumps(ctx.dicts, indent=True)
+
+    @scenario(f"codec.{name}.dumps_store.compact")
+    def dumps_store_compact(ctx: Context):
+        return lambda: codec.dumps(ctx.dicts)
+
+    @scenario(f"codec.{name}.loads_store")
+    def loads_store(ctx: Context):
+        body = codec.dumps(ctx.dicts, indent=True)
+        return lambda: codec.loads(body)
+
+
+for codec_name in CODECS:
+    codec_scenarios(codec_name)
+
+
+@scenario('main_utils.sort_vacancies.full')
+def sort_full(ctx: Context):
+    return lambda: sort_vacancies(ctx.dicts, '2', '')
+
+
+@scenario('main_utils.sort_vacancies.top_n')
+def sort_top_n(ctx: Context):
+    return lambda: sort_vacancies(ctx.dicts, '2', '10')
+
+
+@scenario('end_to_end.search')
+def end_to_end(ctx: Context):
+    """
+    Полный поиск на обеих платформах через заглушку API:
+    HTTP-запросы, кэш ответов, конвейер и сохранение в JSONSaver.
+    Кэш каждый раз новый, ограничение частоты запросов снято.
+    """
+    server = ctx.server()
+    transport = HTTPTransport()
+    cache = ResponseCache(ctx.path(f"cache-{time.monotonic_ns()}.sqlite"))
+    scheduler = RequestScheduler(rate_limits={'hh': 1e9, 'sj': 1e9})
+    api_list = [HeadHunterAPI(transport=transport, cache=cache,
+                              scheduler=scheduler),
+                SuperJobAPI(transport=transport, cache=cache,
+                            scheduler=scheduler)]
+    for api in api_list:
+        api.url = server.url
+    saver = JSONSaver(ctx.path(f"search-{time.monotonic_ns()}.json"))
+
+    def search() -> None:
+        with saver.batch():
+            run_pipeline(api_list, 'python', {'hh': 1, 'sj': 4}, saver,
+                         100_000, ['python'])
+        transport.close()
+    return search
+
+
+def cold_start(statement: str):
+    """Возвращает функцию, выполняющую statement в новом процессе."""
+    command = [sys.executable, '-c', statement]
+    environment = dict(os.environ,
+                       PYTHONPATH=os.pathsep.join([ROOT_DIR, SRC_DIR]))
+    return lambda: subprocess.run(command, cwd=SRC_DIR, env=environment,
+                                  check=True)
+
+
+@scenario('startup.main')
+def startup_main(ctx: Context):
+    return cold_start('import main')
+
+
+@scenario('startup.batch')
+def startup_batch(ctx: Context):
+    return cold_start('import batch')
+
+
+@scenario('startup.platforms')
+def startup_platforms(ctx: Context):
+    """Загрузка реестра и выбор платформы без запросов к ней."""
+    return cold_start("from platforms import platforms; "
+                      "platforms.get_class('hh'); platforms.get_class('sj')")
+
+
+def measure(name: str, ctx: Context, repeat: int) -> dict:
+    """Выполняет сценарий repeat раз и возвращает статистику времени."""
+    timings = []
+    for _ in range(repeat):
+        action = SCENARIOS[name](ctx)
+        start = time.perf_counter()
+        action()
+        timings.append(time.perf_counter() - start)
+    return {
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.fmean(timings),
+        'repeat': repeat,
+    }
+
+
+def run(arguments: argparse.Namespace) -> None:
+    """Выполняет выбранные сценарии и сохраняет результаты."""
+    names = [name for name in SCENARIOS
+             if not arguments.only
+             or any(part in name for part in arguments.only)]
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        ctx = Context(arguments.size, directory, arguments.latency / 1000,
+                      arguments.pages)
+        try:
+            for name in names:
+                results[name] = measure(name, ctx, arguments.repeat)
+                print(f"{name}: {results[name]['median'] * 1000:.2f} ms")
+        finally:
+            ctx.close()
+
+    report = {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'size': arguments.size,
+            'repeat': arguments.repeat,
+            'codec': get_codec().name,
+            'latency_ms': arguments.latency,
+            'pages': arguments.pages,
+        },
+        'results': results,
+    }
+    if arguments.output:
+        with open(arguments.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+        print(f"Результаты сохранены в {arguments.output}")
+
+
+def compare(arguments: argparse.Namespace) -> int:
+    """
+    Сравнивает медианы времени двух запусков.
+    Возвращает 1, если хотя бы один сценарий замедлился
+    больше чем на tolerance (доля), иначе 0.
+    """
+    with open(arguments.baseline, encoding='utf-8') as file:
+        baseline = json.load(file)['results']
+    with open(arguments.current, encoding='utf-8') as file:
+        current = json.load(file)['results']
+
+    regressions = 0
+    for name in sorted(baseline.keys() | current.keys()):
+        if name not in baseline or name not in current:
+            print(f"{name}: есть только в одном из запусков")
+            continue
+        before = baseline[name]['median']
+        after = current[name]['median']
+        change = (after - before) / before if before else 0.0
+        if change > arguments.tolerance:
+            status = 'ЗАМЕДЛЕНИЕ'
+            regressions += 1
+        elif change < -arguments.tolerance:
+            status = 'ускорение'
+        else:
+            status = 'без изменений'
+        print(f"{name}: {before * 1000:.2f} -> {after * 1000:.2f} ms "
+              f"({change:+.1%}) {status}")
+
+    print(f"Замедлившихся сценариев: {regressions}")
+    return 1 if regressions else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Замеры производительности парсера вакансий."
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="Выполнить замеры.")
+    run_parser.add_argument('--size', type=int, default=10_000,
+                            help="Количество синтетических вакансий.")
+    run_parser.add_argument('--repeat', type=int, default=5,
+                            help="Количество повторов каждого сценария.")
+    run_parser.add_argument('--latency', type=float, default=20,
+                            help="Задержка ответа заглушки API (мс).")
+    run_parser.add_argument('--pages', type=int, default=5,
+                            help="Страниц поиска на каждой платформе.")
+    run_parser.add_argument('--only', nargs='*',
+                            help="Выполнить только сценарии, в имени "
+                                 "которых есть одна из строк.")
+    run_parser.add_argument('--output', help="Файл для результатов (JSON).")
+
+    compare_parser = commands.add_parser('compare',
+                                         help="Сравнить два запуска.")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--tolerance', type=float, default=0.1,
+                                help="Допустимое замедление (доля).")
+
+    arguments = parser.parse_args()
+    if arguments.command == 'run':
+        run(arguments)
+    else:
+        sys.exit(compare(arguments))
+
+
+if __name__ == '__main__':
+    main()
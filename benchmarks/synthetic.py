@@ -0,0 +1,142 @@
+"""
+Детерминированный генератор ответов API HeadHunter и SuperJob.
+
+Вакансии повторяют структуру настоящих ответов (включая поля, которые
+проект не использует), поэтому на них можно замерять разбор ответов
+и весь путь от страницы поиска до хранилища.
+Одинаковые аргументы всегда дают одинаковые данные.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+
+TITLES = ['Python-разработчик', 'Backend-разработчик', 'Data Engineer',
+          'Аналитик данных', 'DevOps-инженер', 'Тестировщик',
+          'Frontend-разработчик', 'Team Lead', 'Go-разработчик',
+          'Системный администратор']
+GRADES = ['Junior', 'Middle', 'Senior', 'Ведущий', 'Старший', '']
+WORDS = ['python', 'django', 'flask', 'fastapi', 'sql', 'postgresql',
+         'docker', 'kubernetes', 'linux', 'git', 'redis', 'kafka',
+         'asyncio', 'english', 'rest', 'api', 'ci/cd', 'опыт', 'работы',
+         'знание', 'команде', 'лет', 'высшее', 'образование', 'умение',
+         'разработки', 'тестирования', 'микросервисов']
+CITIES = [(1, 4, 'Москва'), (2, 14, 'Санкт-Петербург'),
+          (4, 51, 'Новосибирск'), (3, 33, 'Екатеринбург'),
+          (88, 13, 'Казань')]
+EMPLOYERS = ['Яндекс', 'Сбер', 'Тинькофф', 'VK', 'Ozon', 'Авито',
+             'Лаборатория Касперского', 'МТС', 'Wildberries', 'Ростелеком']
+
+# Дата публикации самой свежей вакансии.
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _requirement(rnd: random.Random) -> str:
+    """Возвращает текст требований из случайных слов."""
+    return ' '.join(rnd.choices(WORDS, k=rnd.randint(6, 18))).capitalize()
+
+
+def _salary(rnd: random.Random) -> tuple[int | None, int | None]:
+    """Возвращает границы зарплаты; одна из границ может отсутствовать."""
+    salary_from = rnd.randrange(30_000, 400_000, 5_000)
+    salary_to = salary_from + rnd.randrange(0, 150_000, 5_000)
+    kind = rnd.random()
+    if kind < 0.2:
+        return salary_from, None
+    if kind < 0.3:
+        return None, salary_to
+    return salary_from, salary_to
+
+
+def hh_items(count: int, seed: int = 0, start: int = 0) -> list[dict]:
+    """
+    Возвращает count вакансий в формате API HeadHunter.
+
+    :param count: Количество вакансий.
+    :param seed: Начальное значение генератора случайных чисел.
+    :param start: Номер первой вакансии (для ссылок и id).
+    """
+    rnd = random.Random(f"hh-{seed}-{start}")
+    items = []
+    for number in range(start, start + count):
+        salary_from, salary_to = _salary(rnd)
+        hh_area, _, city = rnd.choice(CITIES)
+        employer = rnd.choice(EMPLOYERS)
+        requirement = _requirement(rnd) if rnd.random() > 0.05 else None
+        items.append({
+            'id': str(number),
+            'premium': False,
+            'name': f"{rnd.choice(GRADES)} {rnd.choice(TITLES)}".strip(),
+            'area': {'id': str(hh_area), 'name': city,
+                     'url': f"https://api.hh.ru/areas/{hh_area}"},
+            'salary': {'from': salary_from, 'to': salary_to,
+                       'currency': 'RUR', 'gross': rnd.random() < 0.5},
+            'type': {'id': 'open', 'name': 'Открытая'},
+            'published_at': (EPOCH - timedelta(minutes=number)
+                             ).strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'url': f"https://api.hh.ru/vacancies/{number}",
+            'alternate_url': f"https://hh.ru/vacancy/{number}",
+            'employer': {'id': str(EMPLOYERS.index(employer)),
+                         'name': employer, 'trusted': True},
+            'snippet': {'requirement': requirement,
+                        'responsibility': _requirement(rnd)},
+            'schedule': {'id': 'fullDay', 'name': 'Полный день'},
+            'experience': {'id': 'between1And3', 'name': 'От 1 года до 3 лет'},
+            'employment': {'id': 'full', 'name': 'Полная занятость'},
+        })
+    return items
+
+
+def sj_items(count: int, seed: int = 0, start: int = 0) -> list[dict]:
+    """
+    Возвращает count вакансий в формате API SuperJob.
+
+    :param count: Количество вакансий.
+    :param seed: Начальное значение генератора случайных чисел.
+    :param start: Номер первой вакансии (для ссылок и id).
+    """
+    rnd = random.Random(f"sj-{seed}-{start}")
+    items = []
+    for number in range(start, start + count):
+        payment_from, payment_to = _salary(rnd)
+        _, sj_town, city = rnd.choice(CITIES)
+        employer = rnd.choice(EMPLOYERS)
+        candidat = _requirement(rnd) if rnd.random() > 0.05 else ''
+        items.append({
+            'id': number,
+            'profession': f"{rnd.choice(GRADES)} {rnd.choice(TITLES)}"
+            .strip(),
+            'link': f"https://www.superjob.ru/vakansii/{number}.html",
+            'payment_from': payment_from or 0,
+            'payment_to': payment_to or 0,
+            'currency': 'rub',
+            'candidat': candidat,
+            'work': _requirement(rnd),
+            'date_published': int((EPOCH - timedelta(minutes=number)
+                                   ).timestamp()),
+            'town': {'id': sj_town, 'title': city},
+            'firm_name': employer,
+            'type_of_work': {'id': 6, 'title': 'Полный рабочий день'},
+            'experience': {'id': 2, 'title': 'От 1 года'},
+        })
+    return items
+
+
+def hh_page(page: int, pages: int, per_page: int = 100,
+            seed: int = 0) -> dict:
+    """Возвращает страницу поиска HeadHunter с номером page."""
+    return {
+        'items': hh_items(per_page, seed, page * per_page),
+        'found': pages * per_page,
+        'pages': pages,
+        'per_page': per_page,
+        'page': page,
+    }
+
+
+def sj_page(page: int, pages: int, per_page: int = 100,
+            seed: int = 0) -> dict:
+    """Возвращает страницу поиска SuperJob с номером page."""
+    return {
+        'objects': sj_items(per_page, seed, page * per_page),
+        'total': pages * per_page,
+        'more': page + 1 < pages,
+    }
@@ -1,6 +1,114 @@
+import os
 from pathlib import Path
 
 
 CURRENT_PATH = Path(__file__).parent
 PATH_FILE = Path.joinpath(CURRENT_PATH, 'src', 'vacancies.json')
 PATH_AREA_FILE = Path.joinpath(CURRENT_PATH, 'src', 'areas.json')
+PATH_DB_FILE = Path.joinpath(CURRENT_PATH, 'src', 'vacancies.sqlite')
+PATH_JSONL_FILE = Path.joinpath(CURRENT_PATH, 'src', 'vacancies.jsonl')
+PATH_BATCH_OUTPUT = Path.joinpath(CURRENT_PATH, 'batch_results')
+PATH_CACHE_FILE = Path.joinpath(CURRENT_PATH, 'src', 'responses_cache.sqlite')
+
+# Модули платформ с вакансиями и названия, при выборе которых модуль
+# импортируется и регистрирует свой класс API в реестре platforms.
+# Первое название - короткое имя платформы.
+PLATFORM_MODULES = {
+    'hhapi': ('hh', 'headhunter'),
+    'sjapi': ('sj', 'superjob'),
+}
+
+# Максимальное количество страниц поиска и потоков для их загрузки.
+MAX_PAGES = 20
+MAX_WORKERS = 4
+
+# Общее ограничение одновременных запросов при асинхронном поиске.
+ASYNC_CONCURRENCY = 8
+
+# Параметры пула HTTP-соединений и таймауты запросов (секунды).
+HTTP_POOL_MAXSIZE = 16
+HTTP_CONNECT_TIMEOUT = 5
+HTTP_READ_TIMEOUT = 30
+
+# Дисковый кэш ответов API: время жизни записи (секунды) и лимит размера.
+CACHE_ENABLED = True
+CACHE_TTL = 3600
+CACHE_MAX_BYTES = 50 * 1024 * 1024
+# Сколько секунд процесс ждет, пока другой процесс пишет в кэш.
+CACHE_BUSY_TIMEOUT = 30
+
+# Хранилище вакансий: 'json' (JSONSaver), 'sqlite' (SQLiteSaver)
+# или 'jsonl' (JSONLSaver).
+STORAGE_BACKEND = os.getenv('VACANCY_STORAGE', 'json')
+
+# Сжатие файла JSON Lines: доля устаревших строк и минимальный размер файла.
+JSONL_COMPACT_RATIO = 0.5
+JSONL_COMPACT_MIN_LINES = 1000
+
+# Потоковый конвейер: размер очереди страниц и пачки для сохранения.
+PIPELINE_BUFFER = 8
+PIPELINE_CHUNK = 500
+# Сколько последних ссылок помнит удаление дублей в конвейере.
+PIPELINE_DEDUPE_WINDOW = 100_000
+
+# Количество одновременно выполняемых заданий в пакетном режиме.
+BATCH_WORKERS = 4
+
+# Количество процессов (частей городов) при поиске по всем регионам.
+REGION_SHARDS = os.cpu_count() or 1
+
+# Ограничение частоты запросов к платформам (запросов в секунду)
+# и параметры повторов запросов при временных ошибках (секунды).
+RATE_LIMITS = {'hh': 10, 'sj': 5}
+DEFAULT_RATE_LIMIT = 5
+RETRY_MAX = 5
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30
+
+# Поиск почти одинаковых вакансий на разных платформах
+# (включается переменной окружения VACANCY_DEDUPE=1): порог сходства
+# Жаккара, количество хеш-функций MinHash и длина шингла (символов).
+DEDUPE_ENABLED = os.getenv('VACANCY_DEDUPE', '0') == '1'
+DEDUPE_THRESHOLD = 0.7
+DEDUPE_NUM_PERM = 64
+DEDUPE_SHINGLE = 4
+
+# Сбор метрик этапов поиска (VACANCY_METRICS=1), файл для их выгрузки
+# (.prom - формат Prometheus, иначе JSON) и границы корзин гистограмм.
+METRICS_ENABLED = os.getenv('VACANCY_METRICS', '0') == '1'
+PATH_METRICS_FILE = os.getenv('VACANCY_METRICS_FILE',
+                              Path.joinpath(CURRENT_PATH, 'metrics.json'))
+METRICS_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1,
+                   2.5, 5, 10)
+
+# Профилирование (ключ --profile или VACANCY_PROFILE=1): папка для отчетов,
+# интервал замеров памяти (секунды), количество строк в отчетах
+# и глубина стека вызовов для выделений памяти.
+PROFILE_ENABLED = os.getenv('VACANCY_PROFILE', '0') == '1'
+PATH_PROFILE_DIR = os.getenv('VACANCY_PROFILE_DIR',
+                             Path.joinpath(CURRENT_PATH, 'profile'))
+PROFILE_INTERVAL = float(os.getenv('VACANCY_PROFILE_INTERVAL', '1.0'))
+PROFILE_TOP = 30
+PROFILE_FRAMES = 10
+
+# HTTP-служба запросов к вакансиям: адрес, порт, интервал проверки
+# изменения файла (секунды), размер кэша ответов и лимит вакансий в ответе.
+SERVICE_HOST = '127.0.0.1'
+SERVICE_PORT = 8080
+SERVICE_POLL_INTERVAL = 1.0
+SERVICE_CACHE_SIZE = 1024
+SERVICE_MAX_RESULTS = 100
+
+# Обработка файла вакансий больше оперативной памяти: объем памяти
+# для сортировки (байт) и размер читаемого фрагмента файла (символов).
+MEMORY_BUDGET = int(os.getenv('VACANCY_MEMORY_BUDGET', 256 * 1024 * 1024))
+EXTSORT_READ_CHUNK = 1024 * 1024
+
+# Точность скетчей квантилей зарплат (ошибка ранга порядка 1/k).
+SKETCH_K = 200
+
+# Кодек JSON для ответов API и хранилища: json, orjson, msgspec
+# или auto - самый быстрый из установленных (VACANCY_JSON_CODEC).
+# Компактная запись хранилища без отступов (VACANCY_STORE_COMPACT=1).
+JSON_CODEC = os.getenv('VACANCY_JSON_CODEC', 'auto')
+STORE_COMPACT = os.getenv('VACANCY_STORE_COMPACT', '0') == '1'
@@ -0,0 +1,377 @@
+import argparse
+from bisect import bisect_left
+from contextlib import contextmanager
+from itertools import accumulate
+import json
+import math
+import os
+import random
+import tempfile
+import threading
+from urllib.parse import urlsplit
+from settings import PATH_FILE, SKETCH_K
+
+# Платформа вакансии определяется по адресу ссылки на нее.
+PLATFORM_HOSTS = {'hh.ru': 'hh', 'superjob.ru': 'sj'}
+
+# Запрос и регионы поиска, к которым относятся сохраняемые вакансии.
+_context = threading.local()
+
+
+@contextmanager
+def ingest_context(search_query: str, areas: dict[str, int]):
+    """
+    Контекстный менеджер: вакансии, сохраняемые внутри блока,
+    учитываются в статистике запроса search_query и регионов areas
+    (id региона для каждой платформы).
+    """
+    previous = getattr(_context, 'value', None)
+    _context.value = (search_query.lower(), areas)
+    try:
+        yield
+    finally:
+        _context.value = previous
+
+
+def platform_of(link: str) -> str:
+    """Возвращает короткое имя платформы по ссылке на вакансию."""
+    host = urlsplit(link).netloc
+    for suffix, platform in PLATFORM_HOSTS.items():
+        if host == suffix or host.endswith('.' + suffix):
+            return platform
+    return host or 'unknown'
+
+
+class QuantileSketch:
+    """
+    Потоковый скетч квантилей KLL.
+    Хранит O(k) значений независимо от их общего количества:
+    значения уровня h имеют вес 2**h, при переполнении уровень
+    сортируется и каждое второе значение переходит на следующий.
+    Скетчи можно объединять, ошибка ранга порядка 1/k.
+    """
+
+    # Коэффициент уменьшения емкости нижних уровней.
+    _C = 2 / 3
+
+    def __init__(self, k: int = SKETCH_K) -> None:
+        """
+        Создание экземпляра класса QuantileSketch.
+
+        :param k: Емкость верхнего уровня, определяет точность.
+        """
+        self.k = k
+        self.levels = [[]]
+        self.size = 0
+        self.max_size = self._capacity(0)
+        self._cdf = None
+
+    def _capacity(self, level: int) -> int:
+        """Возвращает емкость уровня level."""
+        depth = len(self.levels) - level - 1
+        return int(math.ceil(self.k * self._C ** depth)) + 1
+
+    def _grow(self) -> None:
+        """Добавляет уровень и пересчитывает общую емкость."""
+        self.levels.append([])
+        self.max_size = sum(self._capacity(level)
+                            for level in range(len(self.levels)))
+
+    def _compress(self) -> None:
+        """Сжимает переполненные уровни, пока скетч не уложится в емкость."""
+        for level in range(len(self.levels)):
+            items = self.levels[level]
+            if len(items) >= self._capacity(level):
+                if level + 1 >= len(self.levels):
+                    self._grow()
+                items.sort()
+                # При нечетной длине одно значение остается на уровне.
+                kept = [items.pop()] if len(items) % 2 else []
+                self.levels[level + 1].extend(
+                    items[random.getrandbits(1)::2]
+                )
+                self.levels[level] = kept
+                self.size = sum(len(items) for items in self.levels)
+                if self.size < self.max_size:
+                    break
+
+    def update(self, value: float) -> None:
+        """Добавляет значение."""
+        self.levels[0].append(value)
+        self.size += 1
+        self._cdf = None
+        if self.size >= self.max_size:
+            self._compress()
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """Добавляет значения другого скетча."""
+        while len(self.levels) < len(other.levels):
+            self._grow()
+        for level, items in enumerate(other.levels):
+            self.levels[level].extend(items)
+        self.size = sum(len(items) for items in self.levels)
+        self._cdf = None
+        while self.size >= self.max_size:
+            self._compress()
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Возвращает приближенный квантиль уровня q (от 0 до 1)
+        или None, если значений нет. Отсортированные значения
+        с накопленными весами запоминаются до следующего изменения,
+        поэтому повторные запросы не требуют сортировки.
+        """
+        if self._cdf is None:
+            weighted = sorted((value, 1 << level)
+                              for level, items in enumerate(self.levels)
+                              for value in items)
+            if not weighted:
+                return None
+            self._cdf = ([value for value, _ in weighted],
+                         list(accumulate(weight for _, weight in weighted)))
+        values, ranks = self._cdf
+        if not values:
+            return None
+        target = max(1, math.ceil(q * ranks[-1]))
+        return values[min(bisect_left(ranks, target), len(values) - 1)]
+
+    def to_dict(self) -> dict:
+        """Возвращает скетч в виде словаря для JSON."""
+        return {'k': self.k, 'levels': self.levels}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'QuantileSketch':
+        """Восстанавливает скетч из словаря."""
+        sketch = cls(data['k'])
+        for _ in range(len(data['levels']) - 1):
+            sketch._grow()
+        sketch.levels = [list(items) for items in data['levels']]
+        sketch.size = sum(len(items) for items in sketch.levels)
+        return sketch
+
+
+class SalaryStats:
+    """
+    Статистика зарплат одной группы вакансий:
+    точные количество, минимум, максимум, среднее и скетч квантилей.
+    """
+
+    def __init__(self, k: int = SKETCH_K) -> None:
+        """
+        Создание экземпляра класса SalaryStats.
+
+        :param k: Точность скетча квантилей.
+        """
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self.sketch = QuantileSketch(k)
+
+    @property
+    def mean(self) -> float | None:
+        """Средняя зарплата."""
+        return self.total / self.count if self.count else None
+
+    def add(self, salary: int) -> None:
+        """Учитывает зарплату вакансии."""
+        self.count += 1
+        self.total += salary
+        self.min = salary if self.min is None else min(self.min, salary)
+        self.max = salary if self.max is None else max(self.max, salary)
+        self.sketch.update(salary)
+
+    def merge(self, other: 'SalaryStats') -> None:
+        """Добавляет статистику другой группы."""
+        if not other.count:
+            return
+        self.count += other.count
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    def percentile(self, percent: float) -> float | None:
+        """Возвращает процентиль зарплаты (percent от 0 до 100)."""
+        if percent <= 0:
+            return self.min
+        if percent >= 100:
+            return self.max
+        return self.sketch.quantile(percent / 100)
+
+    def summary(self, percents=(25, 50, 75, 90)) -> dict:
+        """Возвращает сводку статистики с заданными процентилями."""
+        result = {'count': self.count, 'min': self.min, 'max': self.max,
+                  'mean': self.mean}
+        for percent in percents:
+            result[f"p{percent}"] = self.percentile(percent)
+        return result
+
+    def to_dict(self) -> dict:
+        """Возвращает статистику в виде словаря для JSON."""
+        return {'count': self.count, 'total': self.total, 'min': self.min,
+                'max': self.max, 'sketch': self.sketch.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'SalaryStats':
+        """Восстанавливает статистику из словаря."""
+        stats = cls()
+        stats.count = data['count']
+        stats.total = data['total']
+        stats.min = data['min']
+        stats.max = data['max']
+        stats.sketch = QuantileSketch.from_dict(data['sketch'])
+        return stats
+
+
+class SalaryAnalytics:
+    """
+    Статистика зарплат по группам (платформа, регион, запрос).
+    Обновляется по мере сохранения вакансий в хранилище
+    и хранится в файле рядом с ним. Статистику разных хранилищ,
+    частей и запусков можно объединять.
+    Удаление вакансий из хранилища статистику не меняет:
+    она описывает все загруженные вакансии. Вакансия учитывается
+    один раз - когда ее ссылка впервые сохраняется в хранилище,
+    повторные загрузки и обновления уже сохраненных вакансий
+    статистику не меняют.
+    """
+
+    def __init__(self, filename=None, k: int = SKETCH_K) -> None:
+        """
+        Создание экземпляра класса SalaryAnalytics.
+
+        :param filename: Файл статистики (если задан, загружается).
+        :param k: Точность скетчей квантилей.
+        """
+        self.filename = filename
+        self.k = k
+        self.groups = {}
+        self._lock = threading.Lock()
+        if filename is not None:
+            self.load()
+
+    @classmethod
+    def for_store(cls, store_filename) -> 'SalaryAnalytics':
+        """Возвращает статистику, хранящуюся рядом с файлом хранилища."""
+        return cls(f"{store_filename}.analytics.json")
+
+    @staticmethod
+    def key(platform: str, search_area, search_query: str) -> str:
+        """Формирует ключ группы."""
+        return f"{platform}|{search_area}|{search_query.lower()}"
+
+    def add(self, items: list[dict]) -> None:
+        """
+        Учитывает зарплаты сохраняемых вакансий. Платформа
+        определяется по ссылке, запрос и регион - по ingest_context.
+        """
+        search_query, areas = getattr(_context, 'value', None) or ('', {})
+        with self._lock:
+            for item in items:
+                platform = platform_of(item['link'])
+                key = self.key(platform, areas.get(platform), search_query)
+                stats = self.groups.get(key)
+                if stats is None:
+                    stats = self.groups[key] = SalaryStats(self.k)
+                stats.add(item['salary'])
+
+    def stats(self, platform: str, search_area,
+              search_query: str) -> SalaryStats | None:
+        """Возвращает статистику группы или None."""
+        return self.groups.get(self.key(platform, search_area, search_query))
+
+    def select(self, platform: str = None, search_area=None,
+               search_query: str = None) -> SalaryStats:
+        """
+        Объединяет статистику всех групп, подходящих под условия
+        (незаданное условие подходит для любых групп).
+        """
+        result = SalaryStats(self.k)
+        for key, stats in self.groups.items():
+            group_platform, group_area, group_query = key.split('|', 2)
+            if (platform is None or group_platform == platform) and \
+                    (search_area is None or
+                     group_area == str(search_area)) and \
+                    (search_query is None or
+                     group_query == search_query.lower()):
+                result.merge(stats)
+        return result
+
+    def merge(self, other: 'SalaryAnalytics') -> None:
+        """Добавляет статистику другого экземпляра."""
+        with self._lock:
+            for key, stats in other.groups.items():
+                own = self.groups.get(key)
+                if own is None:
+                    own = self.groups[key] = SalaryStats(self.k)
+                own.merge(stats)
+
+    def load(self) -> None:
+        """Загружает статистику из файла."""
+        try:
+            with open(self.filename, encoding='utf-8') as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        self.groups = {key: SalaryStats.from_dict(stats)
+                       for key, stats in data.items()}
+
+    def save(self) -> None:
+        """Атомарно записывает статистику в файл."""
+        if self.filename is None:
+            return
+        with self._lock:
+            data = {key: stats.to_dict()
+                    for key, stats in self.groups.items()}
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        descriptor, temp_name = tempfile.mkstemp(dir=directory,
+                                                 suffix='.tmp')
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False)
+        os.replace(temp_name, self.filename)
+
+
+def main() -> None:
+    """Выводит статистику зарплат или объединяет файлы статистики."""
+    parser = argparse.ArgumentParser(
+        description="Статистика зарплат по платформам, регионам и запросам."
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    report = commands.add_parser('report', help="вывести статистику")
+    report.add_argument('--store', default=PATH_FILE,
+                        help="файл хранилища, рядом с которым статистика")
+    report.add_argument('--platform')
+    report.add_argument('--area')
+    report.add_argument('--query')
+
+    merge = commands.add_parser('merge', help="объединить файлы статистики")
+    merge.add_argument('output')
+    merge.add_argument('inputs', nargs='+')
+    args = parser.parse_args()
+
+    if args.command == 'merge':
+        result = SalaryAnalytics(args.output)
+        for filename in args.inputs:
+            result.merge(SalaryAnalytics(filename))
+        result.save()
+        print(f"Групп в статистике: {len(result.groups)}")
+        return
+
+    analytics = SalaryAnalytics.for_store(args.store)
+    for key in sorted(analytics.groups):
+        platform, area, query = key.split('|', 2)
+        if (args.platform and platform != args.platform) or \
+                (args.area and area != args.area) or \
+                (args.query and query != args.query.lower()):
+            continue
+        summary = analytics.groups[key].summary()
+        print(f"{platform} {area} '{query}': " + ', '.join(
+            f"{name}={value:.0f}" if isinstance(value, float)
+            else f"{name}={value}" for name, value in summary.items()
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+import json
+import threading
+from typing import NamedTuple
+from settings import PATH_AREA_FILE
+
+
+class Area(NamedTuple):
+    """Город и его id на платформах HeadHunter и SuperJob."""
+    name: str
+    hh: int
+    sj: int | None
+
+
+def normalize(name: str) -> str:
+    """
+    Приводит название города к ключу поиска: нижний регистр, 'ё' -> 'е',
+    дефисы и повторные пробелы заменяются одним пробелом.
+    """
+    name = name.lower().replace('ё', 'е').replace('-', ' ')
+    return ' '.join(name.split())
+
+
+class AreaResolver:
+    """
+    Справочник городов из areas.json.
+    Файл читается один раз при первом обращении, после чего строятся
+    индекс нормализованных названий и префиксное дерево для поиска
+    по началу названия и с опечатками. Для каждого города сразу
+    известны id обеих платформ.
+    """
+
+    # Ключ узла префиксного дерева, в котором хранится город.
+    END = '$'
+
+    def __init__(self, filename=PATH_AREA_FILE) -> None:
+        """
+        Создание экземпляра класса AreaResolver.
+
+        :param filename: Файл со словарями id городов.
+        """
+        self.filename = filename
+        self._index = None
+        self._trie = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> None:
+        """Загружает файл и строит индексы, если это еще не сделано."""
+        if self._index is not None:
+            return
+        with self._lock:
+            if self._index is not None:
+                return
+            with open(self.filename, encoding='utf-8') as file:
+                areas = json.load(file)
+            area_sj = areas['area_sj']
+
+            index = {}
+            trie = {}
+            for name, hh_id in areas['area_hh'].items():
+                area = Area(name, hh_id, area_sj.get(name))
+                key = normalize(name)
+                index[key] = area
+                node = trie
+                for char in key:
+                    node = node.setdefault(char, {})
+                node[self.END] = area
+
+            self._trie = trie
+            self._index = index
+
+    def areas(self) -> list[Area]:
+        """Возвращает все города справочника."""
+        self._load()
+        return list(self._index.values())
+
+    def resolve(self, name: str) -> Area | None:
+        """Возвращает город по точному (нормализованному) названию."""
+        self._load()
+        return self._index.get(normalize(name))
+
+    def prefix(self, name: str, limit: int = 10) -> list[Area]:
+        """Возвращает города, названия которых начинаются с name."""
+        self._load()
+        node = self._trie
+        for char in normalize(name):
+            node = node.get(char)
+            if node is None:
+                return []
+
+        # Обход поддерева в глубину в алфавитном порядке.
+        result = []
+        stack = [node]
+        while stack and len(result) < limit:
+            node = stack.pop()
+            if self.END in node:
+                result.append(node[self.END])
+            stack.extend(node[char] for char in sorted(node, reverse=True)
+                         if char != self.END)
+        return result
+
+    def fuzzy(self, name: str, max_distance: int = 2,
+              limit: int = 10) -> list[Area]:
+        """
+        Возвращает города, расстояние Левенштейна до названия которых
+        не превышает max_distance, в порядке возрастания расстояния.
+        Строки матрицы расстояний считаются по ходу обхода дерева,
+        поэтому ветви, где расстояние уже больше порога, отсекаются.
+        """
+        self._load()
+        key = normalize(name)
+        first_row = list(range(len(key) + 1))
+        found = []
+
+        stack = [(self._trie, first_row)]
+        while stack:
+            node, previous = stack.pop()
+            if self.END in node and previous[-1] <= max_distance:
+                found.append((previous[-1], node[self.END]))
+            for char, child in node.items():
+                if char == self.END:
+                    continue
+                row = [previous[0] + 1]
+                for column in range(1, len(key) + 1):
+                    cost = 0 if key[column - 1] == char else 1
+                    row.append(min(row[column - 1] + 1,
+                                   previous[column] + 1,
+                                   previous[column - 1] + cost))
+                if min(row) <= max_distance:
+                    stack.append((child, row))
+
+        found.sort(key=lambda pair: (pair[0], pair[1].name))
+        return [area for _, area in found[:limit]]
+
+    def suggest(self, name: str, limit: int = 5) -> list[Area]:
+        """
+        Возвращает подсказки для введенного названия:
+        сначала совпадения по началу названия, затем с опечатками.
+        """
+        result = self.prefix(name, limit)
+        for area in self.fuzzy(name, limit=limit):
+            if len(result) >= limit:
+                break
+            if area not in result:
+                result.append(area)
+        return result
+
+
+_resolver = None
+
+
+def get_area_resolver() -> AreaResolver:
+    """Возвращает общий экземпляр AreaResolver."""
+    global _resolver
+    if _resolver is None:
+        _resolver = AreaResolver()
+    return _resolver
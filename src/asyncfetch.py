@@ -0,0 +1,123 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from settings import ASYNC_CONCURRENCY
+from pageapi import PageAPI
+
+
+async def fetch_all(api_list: list[PageAPI], search_query: str,
+                    areas: dict[str, int],
+                    concurrency: int = ASYNC_CONCURRENCY,
+                    as_batch: bool = False) -> list:
+    """
+    Одновременно запрашивает вакансии на всех выбранных платформах.
+    Каждая платформа получает только свой id региона из словаря areas,
+    а общее количество запросов в работе не превышает concurrency.
+    Возвращает списки вакансий (или VacancyBatch, если as_batch=True)
+    в порядке платформ из api_list.
+    """
+    limiter = asyncio.Semaphore(concurrency)
+
+    # Блокирующие запросы выполняются в пуле потоков того же размера,
+    # что и ограничение семафора, поэтому запросы не ждут свободный поток.
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return await asyncio.gather(*(
+            api.get_vacancies_async(search_query, areas[api.platform],
+                                    limiter, executor, as_batch)
+            for api in api_list
+        ))
+
+
+def search_platforms(api_list: list[PageAPI], search_query: str,
+                     areas: dict[str, int],
+                     concurrency: int = ASYNC_CONCURRENCY,
+                     as_batch: bool = False) -> list:
+    """Синхронная обертка над fetch_all для вызова из обычного кода."""
+    return asyncio.run(fetch_all(api_list, search_query, areas, concurrency,
+                                 as_batch))
+
+
+async def stream_platform(api: PageAPI, search_query: str, search_area: int,
+                          emit: Callable, limiter: asyncio.Semaphore,
+                          executor: ThreadPoolExecutor) -> bool:
+    """
+    Запрашивает страницы поиска одной платформы и передает их в emit
+    в порядке номеров страниц. Все страницы после первой запрашиваются
+    одновременно. Место в семафоре limiter занимает страница с момента
+    запроса до передачи в emit, поэтому семафор ограничивает и запросы
+    в работе, и полученные, но еще не переданные страницы.
+    Возвращает False, если emit отказался принимать страницы.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def fetch(page: int) -> dict:
+        await limiter.acquire()
+        try:
+            return await loop.run_in_executor(
+                executor, api.get_page, search_query, search_area, page
+            )
+        except BaseException:
+            limiter.release()
+            raise
+
+    def hand_over(response: dict) -> bool:
+        try:
+            return emit(api, response[api.items_key])
+        finally:
+            limiter.release()
+
+    # Первая страница сообщает общее количество страниц.
+    first_page = await fetch(0)
+    pages = min(api.page_count(first_page), api.max_pages)
+    if not hand_over(first_page):
+        return False
+
+    requests = deque(asyncio.ensure_future(fetch(page))
+                     for page in range(1, pages))
+    try:
+        while requests:
+            if not hand_over(await requests.popleft()):
+                return False
+        return True
+    finally:
+        # Непереданные страницы освобождают свои места в семафоре,
+        # чтобы остановка одной платформы не задержала остальные.
+        for request in requests:
+            if not request.done():
+                request.cancel()
+            elif not request.cancelled() and request.exception() is None:
+                limiter.release()
+
+
+async def stream_all(api_list: list[PageAPI], search_query: str,
+                     areas: dict[str, int], emit: Callable,
+                     concurrency: int = ASYNC_CONCURRENCY) -> None:
+    """
+    Одновременно обходит страницы поиска на всех платформах
+    с общим ограничением concurrency на все запросы
+    (платформа, регион, страница). Каждая страница передается
+    в emit(api, items); ошибка платформы передается в emit(api, error),
+    и обход этой платформы прекращается.
+    """
+    limiter = asyncio.Semaphore(concurrency)
+
+    async def run(api: PageAPI) -> None:
+        try:
+            await stream_platform(api, search_query, areas[api.platform],
+                                  emit, limiter, executor)
+        except Exception as error:
+            emit(api, error)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        await asyncio.gather(*(run(api) for api in api_list))
+
+
+def stream_pages(api_list: list[PageAPI], search_query: str,
+                 areas: dict[str, int], emit: Callable,
+                 concurrency: int = ASYNC_CONCURRENCY) -> None:
+    """
+    Синхронная обертка над stream_all: возвращается, когда все
+    платформы обойдены или emit отказался принимать страницы.
+    """
+    asyncio.run(stream_all(api_list, search_query, areas, emit, concurrency))
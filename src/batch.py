@@ -0,0 +1,153 @@
+import argparse
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import json
+import multiprocessing
+import os
+import time
+from settings import BATCH_WORKERS, PATH_BATCH_OUTPUT
+from platforms import platforms
+from scheduler import PRIORITY_BACKGROUND
+from jsonsaver import JSONSaver
+from arearesolver import get_area_resolver
+from pipeline import run_pipeline
+from metrics import metrics
+from analytics import SalaryAnalytics
+
+
+def load_jobs(filename) -> list[dict]:
+    """
+    Загружает файл заданий: список заданий или словарь с ключом 'jobs'.
+
+    Поля задания:
+    'name' - название (имя файла с результатами),
+    'query' - поисковой запрос,
+    'cities' - список городов или строка 'all' для всех городов,
+    'platforms' - список платформ (по умолчанию hh и sj),
+    'min_salary' - минимальная зарплата (необязательно),
+    'keywords' - ключевые слова для требований (необязательно).
+    """
+    with open(filename, encoding='utf-8') as file:
+        jobs = json.load(file)
+    if isinstance(jobs, dict):
+        jobs = jobs['jobs']
+
+    for number, job in enumerate(jobs, start=1):
+        job.setdefault('name', f"job_{number}")
+    return jobs
+
+
+def run_job(job: dict, output_dir) -> dict:
+    """
+    Выполняет одно задание по всем его городам и платформам,
+    сохраняет результаты в отдельный файл и возвращает отчет о задании.
+    """
+    start = time.perf_counter()
+    report = {'name': job['name'], 'vacancies': 0, 'error': None}
+    try:
+        resolver = get_area_resolver()
+        if job['cities'] == 'all':
+            areas_list = resolver.areas()
+        else:
+            areas_list = [resolver.resolve(city) for city in job['cities']]
+            unknown = [city for city, area in zip(job['cities'], areas_list)
+                       if area is None]
+            if unknown:
+                raise KeyError(f"Неизвестные города: {', '.join(unknown)}")
+        api_list = [platforms.create(platform, priority=PRIORITY_BACKGROUND)
+                    for platform in job.get('platforms', ['hh', 'sj'])]
+
+        filename = os.path.join(output_dir, f"{job['name']}.json")
+        saver = JSONSaver(filename,
+                          analytics=SalaryAnalytics.for_store(filename))
+        with saver.batch():
+            for area in areas_list:
+                areas = {'hh': area.hh, 'sj': area.sj}
+                report['vacancies'] += run_pipeline(
+                    api_list, job['query'], areas, saver,
+                    job.get('min_salary'), job.get('keywords')
+                )
+    except Exception as error:
+        report['error'] = f"{error.__class__.__name__}: {error}"
+
+    report['seconds'] = round(time.perf_counter() - start, 3)
+    report['vacancies_per_second'] = round(
+        report['vacancies'] / report['seconds'], 1
+    ) if report['seconds'] else 0.0
+
+    # В дочернем процессе метрики задания передаются основному процессу
+    # вместе с отчетом.
+    if metrics.enabled and multiprocessing.parent_process() is not None:
+        report['metrics'] = metrics.snapshot()
+        metrics.reset()
+    return report
+
+
+def run_batch(jobs: list[dict], output_dir, workers: int = BATCH_WORKERS,
+              use_processes: bool = False) -> dict:
+    """
+    Выполняет задания одновременно в пуле потоков или процессов
+    и возвращает сводный отчет.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    executor_class = ProcessPoolExecutor if use_processes \
+        else ThreadPoolExecutor
+
+    start = time.perf_counter()
+    with executor_class(max_workers=workers) as executor:
+        reports = list(executor.map(run_job, jobs,
+                                    [output_dir] * len(jobs)))
+    seconds = time.perf_counter() - start
+    for report in reports:
+        if 'metrics' in report:
+            metrics.merge(report.pop('metrics'))
+
+    total = sum(report['vacancies'] for report in reports)
+    summary = {
+        'jobs': reports,
+        'total_vacancies': total,
+        'seconds': round(seconds, 3),
+        'vacancies_per_second': round(total / seconds, 1) if seconds else 0.0,
+        'failed': sum(1 for report in reports if report['error'])
+    }
+    with open(os.path.join(output_dir, 'summary.json'), 'w',
+              encoding='utf-8') as file:
+        json.dump(summary, file, indent=2, ensure_ascii=False)
+    if metrics.enabled:
+        metrics.export(os.path.join(output_dir, 'metrics.json'))
+        metrics.export(os.path.join(output_dir, 'metrics.prom'))
+    return summary
+
+
+def print_summary(summary: dict) -> None:
+    """Печатает сводный отчет по заданиям."""
+    for report in summary['jobs']:
+        status = report['error'] or 'ok'
+        print(f"{report['name']}: {report['vacancies']} вакансий за "
+              f"{report['seconds']} с ({report['vacancies_per_second']} в "
+              f"секунду) - {status}")
+    print(f"Итого: {summary['total_vacancies']} вакансий за "
+          f"{summary['seconds']} с ({summary['vacancies_per_second']} в "
+          f"секунду), ошибок: {summary['failed']}")
+
+
+def main() -> None:
+    """Точка входа пакетного режима без взаимодействия с пользователем."""
+    parser = argparse.ArgumentParser(
+        description="Пакетный поиск вакансий по файлу заданий."
+    )
+    parser.add_argument('jobs', help="JSON-файл с заданиями")
+    parser.add_argument('--output', default=PATH_BATCH_OUTPUT,
+                        help="папка для результатов заданий")
+    parser.add_argument('--workers', type=int, default=BATCH_WORKERS,
+                        help="количество одновременно выполняемых заданий")
+    parser.add_argument('--processes', action='store_true',
+                        help="использовать пул процессов вместо потоков")
+    args = parser.parse_args()
+
+    summary = run_batch(load_jobs(args.jobs), args.output, args.workers,
+                        args.processes)
+    print_summary(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import NamedTuple
+from settings import PATH_CACHE_FILE, CACHE_ENABLED, CACHE_TTL, \
+    CACHE_MAX_BYTES, CACHE_BUSY_TIMEOUT
+
+
+class CacheEntry(NamedTuple):
+    """Запись кэша: ответ API и данные для его повторной проверки."""
+    payload: dict
+    etag: str
+    last_modified: str
+    fresh: bool
+
+
+class ResponseCache:
+    """
+    Дисковый кэш ответов API на основе SQLite.
+    Ответы хранятся уже декодированными (pickle), поэтому попадание в кэш
+    не требует ни сетевого запроса, ни разбора JSON.
+    Устаревшие записи проверяются заново по ETag / Last-Modified,
+    при превышении лимита размера удаляются давно не использованные записи.
+    Файлом могут одновременно пользоваться несколько процессов
+    (например, части поиска по регионам): база работает в режиме WAL,
+    и запись ждет освобождения блокировки до busy_timeout секунд.
+    """
+
+    def __init__(self, filename, ttl: float = CACHE_TTL,
+                 max_bytes: int = CACHE_MAX_BYTES,
+                 busy_timeout: float = CACHE_BUSY_TIMEOUT) -> None:
+        """
+        Создание экземпляра класса ResponseCache.
+
+        :param filename: Файл базы данных кэша.
+        :param ttl: Время жизни записи в секундах.
+        :param max_bytes: Максимальный суммарный размер записей.
+        :param busy_timeout: Ожидание блокировки другого процесса (секунды).
+        """
+        self.filename = filename
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(filename, timeout=busy_timeout,
+                                           check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body BLOB, etag TEXT, last_modified TEXT, "
+            "stored_at REAL, accessed_at REAL, size INTEGER)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed "
+            "ON responses (accessed_at)"
+        )
+        self._connection.commit()
+
+    @staticmethod
+    def make_key(platform: str, endpoint: str, params: dict) -> str:
+        """
+        Формирует ключ записи из платформы, адреса запроса
+        и нормализованных параметров (сортировка, приведение к строке).
+        """
+        normalized = {str(key): str(value).lower()
+                      if isinstance(value, bool) else str(value)
+                      for key, value in params.items() if value is not None}
+        return json.dumps([platform, endpoint, normalized], sort_keys=True,
+                          ensure_ascii=False)
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Возвращает запись кэша или None, если записи нет."""
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, etag, last_modified, stored_at "
+                "FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            body, etag, last_modified, stored_at = row
+            fresh = now - stored_at < self.ttl
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                (now, key)
+            )
+            self._connection.commit()
+
+        return CacheEntry(pickle.loads(body), etag, last_modified, fresh)
+
+    def revalidated(self, key: str) -> None:
+        """Продлевает срок жизни записи после ответа 304 Not Modified."""
+        with self._lock:
+            self.revalidations += 1
+            self._connection.execute(
+                "UPDATE responses SET stored_at = ? WHERE key = ?",
+                (time.time(), key)
+            )
+            self._connection.commit()
+
+    def put(self, key: str, payload: dict, etag: str = None,
+            last_modified: str = None) -> None:
+        """Сохраняет ответ в кэш и при необходимости освобождает место."""
+        body = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, body, etag, last_modified, now, now, len(body))
+            )
+            self._evict()
+            self._connection.commit()
+
+    def _evict(self) -> None:
+        """Удаляет давно не использованные записи сверх лимита размера."""
+        total = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        )
+        stale = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+
+        self._connection.executemany("DELETE FROM responses WHERE key = ?",
+                                     stale)
+        self.evictions += len(stale)
+
+    def stats(self) -> dict:
+        """Возвращает статистику попаданий, промахов и вытеснений."""
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'revalidations': self.revalidations,
+            'evictions': self.evictions,
+            'entries': entries,
+            'bytes': size
+        }
+
+    def clear(self) -> None:
+        """Удаляет все записи кэша."""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+
+_cache = None
+_cache_pid = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> ResponseCache | None:
+    """
+    Возвращает общий для всех платформ экземпляр ResponseCache
+    или None, если кэширование отключено в настройках.
+    Каждый процесс открывает свое соединение с базой: соединение,
+    унаследованное от родительского процесса, не используется.
+    """
+    global _cache, _cache_pid
+    if not CACHE_ENABLED:
+        return None
+    if _cache is None or _cache_pid != os.getpid():
+        with _cache_lock:
+            if _cache is None or _cache_pid != os.getpid():
+                _cache = ResponseCache(PATH_CACHE_FILE)
+                _cache_pid = os.getpid()
+    return _cache
@@ -0,0 +1,175 @@
+import json
+from typing import Any, Union
+from settings import JSON_CODEC
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def prune(value, fields):
+    """
+    Оставляет в значении только поля из описания fields.
+    Описание - словарь {поле: описание вложенного значения},
+    список из одного описания для массива объектов или None
+    для значения, которое сохраняется целиком.
+    Отсутствующие поля пропускаются, значения другого типа
+    (например, null вместо объекта) сохраняются как есть.
+    """
+    if fields is None:
+        return value
+    if isinstance(fields, list):
+        if not isinstance(value, list):
+            return value
+        return [prune(item, fields[0]) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return {name: prune(value[name], nested)
+            for name, nested in fields.items() if name in value}
+
+
+class JSONCodec:
+    """
+    Кодек JSON на стандартном модуле json.
+    Подклассы используют быстрые библиотеки с тем же результатом:
+    dumps в обоих режимах дает те же байты, что и json.dumps
+    с ensure_ascii=False, decode - те же словари, что и prune(loads()).
+    """
+
+    name = 'json'
+    DecodeError = json.JSONDecodeError
+
+    def loads(self, data: bytes | str):
+        """Декодирует JSON."""
+        return json.loads(data)
+
+    def dumps(self, obj, indent: bool = False) -> bytes:
+        """
+        Кодирует значение в JSON (UTF-8): с отступами в 2 пробела
+        или компактно, без пробелов между элементами.
+        """
+        if indent:
+            text = json.dumps(obj, indent=2, ensure_ascii=False)
+        else:
+            text = json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+        return text.encode('utf-8')
+
+    def decode(self, data: bytes | str, fields=None):
+        """
+        Декодирует JSON и оставляет только поля из описания fields
+        (см. prune), чтобы ненужные поля не занимали память и кэш.
+        """
+        return prune(self.loads(data), fields)
+
+
+class OrjsonCodec(JSONCodec):
+    """Кодек JSON на библиотеке orjson."""
+
+    name = 'orjson'
+    DecodeError = orjson.JSONDecodeError if orjson else None
+
+    def loads(self, data: bytes | str):
+        """Декодирует JSON."""
+        return orjson.loads(data)
+
+    def dumps(self, obj, indent: bool = False) -> bytes:
+        """Кодирует значение в JSON с отступами или компактно."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    Кодек JSON на библиотеке msgspec.
+    По описанию полей строится схема из структур msgspec,
+    и декодер пропускает остальные поля, не создавая для них
+    объекты Python.
+    """
+
+    name = 'msgspec'
+    DecodeError = msgspec.DecodeError if msgspec else None
+
+    def __init__(self) -> None:
+        """Создание экземпляра класса MsgspecCodec."""
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._decoders = {}
+
+    def loads(self, data: bytes | str):
+        """Декодирует JSON."""
+        return self._decoder.decode(data)
+
+    def dumps(self, obj, indent: bool = False) -> bytes:
+        """Кодирует значение в JSON с отступами или компактно."""
+        data = self._encoder.encode(obj)
+        return msgspec.json.format(data, indent=2) if indent else data
+
+    @classmethod
+    def _schema(cls, fields, name: str = 'Page'):
+        """
+        Переводит описание полей в тип msgspec: объект - в структуру,
+        массив - в список, вложенные объекты и массивы могут быть null.
+        Отсутствующие поля получают значение UNSET и не попадают
+        в результат.
+        """
+        if fields is None:
+            return Any
+        if isinstance(fields, list):
+            return list[cls._schema(fields[0], name)]
+        return msgspec.defstruct(name, [
+            (field, cls._nullable(cls._schema(nested, f"{name}_{field}")),
+             msgspec.UNSET)
+            for field, nested in fields.items()
+        ])
+
+    @staticmethod
+    def _nullable(schema):
+        """Разрешает null и отсутствие поля для вложенного типа."""
+        if schema is Any:
+            return Any
+        return Union[schema, None, msgspec.UnsetType]
+
+    def decode(self, data: bytes | str, fields=None):
+        """
+        Декодирует JSON по схеме из описания fields и переводит
+        результат в словари и списки. Если тип значения не совпадает
+        со схемой (например, массив вместо объекта), выбрасывает
+        DecodeError.
+        """
+        if fields is None:
+            return self.loads(data)
+        key = repr(fields)
+        decoder = self._decoders.get(key)
+        if decoder is None:
+            decoder = self._decoders[key] = msgspec.json.Decoder(
+                self._schema(fields)
+            )
+        return msgspec.to_builtins(decoder.decode(data))
+
+
+CODECS = {'json': JSONCodec}
+if orjson is not None:
+    CODECS['orjson'] = OrjsonCodec
+if msgspec is not None:
+    CODECS['msgspec'] = MsgspecCodec
+
+
+def get_codec(name: str = JSON_CODEC) -> JSONCodec:
+    """
+    Возвращает кодек по имени: 'json', 'orjson', 'msgspec'
+    или 'auto' - самый быстрый из установленных.
+    Если библиотека не установлена, используется стандартный json.
+    """
+    if name == 'auto':
+        name = next((name for name in ('msgspec', 'orjson')
+                     if name in CODECS), 'json')
+    return CODECS.get(name, JSONCodec)()
+
+
+# Общий кодек для ответов API и хранилищ.
+codec = get_codec()
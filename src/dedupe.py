@@ -0,0 +1,208 @@
+from operator import eq
+import re
+import zlib
+from settings import DEDUPE_THRESHOLD, DEDUPE_NUM_PERM, DEDUPE_SHINGLE
+from analytics import platform_of
+
+WORD_PATTERN = re.compile(r'\w+')
+# Множитель для перемешивания 32-битных хешей в 64-битные.
+_MIX = 0x9E3779B97F4A7C15
+_MASK = (1 << 64) - 1
+
+
+def shingles(text: str, size: int = DEDUPE_SHINGLE) -> set[int]:
+    """
+    Возвращает 64-битные хеши символьных шинглов длины size
+    для текста, приведенного к словам в нижнем регистре.
+    """
+    text = ' '.join(WORD_PATTERN.findall(text.lower().replace('ё', 'е')))
+    if len(text) <= size:
+        return {zlib.crc32(text.encode()) * _MIX & _MASK}
+    return {zlib.crc32(text[i:i + size].encode()) * _MIX & _MASK
+            for i in range(len(text) - size + 1)}
+
+
+def choose_bands(threshold: float, num_perm: int) -> tuple[int, int]:
+    """
+    Подбирает количество полос и строк в полосе LSH так,
+    чтобы порог срабатывания (1 / bands) ** (1 / rows)
+    был ближе всего к заданному порогу сходства.
+    """
+    options = [(bands, num_perm // bands) for bands in range(1, num_perm + 1)
+               if num_perm % bands == 0]
+    return min(options, key=lambda option:
+               abs((1 / option[0]) ** (1 / option[1]) - threshold))
+
+
+class NearDuplicateIndex:
+    """
+    Поиск почти одинаковых вакансий с помощью MinHash и LSH.
+    Для каждой вакансии по шинглам названия и требований считается
+    MinHash-подпись, подпись делится на полосы, и кандидатами в дубли
+    считаются только вакансии с совпадающей полосой. Поэтому проверка
+    выполняется примерно за линейное время, а не попарно.
+    Дублем считается только вакансия с другой платформы с той же
+    зарплатой и тем же работодателем (если он известен у обеих):
+    разные вакансии одной платформы с похожим текстом сохраняются.
+    """
+
+    def __init__(self, threshold: float = DEDUPE_THRESHOLD,
+                 num_perm: int = DEDUPE_NUM_PERM) -> None:
+        """
+        Создание экземпляра класса NearDuplicateIndex.
+
+        :param threshold: Минимальное сходство Жаккара для дубля (0..1).
+        :param num_perm: Количество значений в подписи.
+        """
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = choose_bands(threshold, num_perm)
+        self.buckets = [{} for _ in range(self.bands)]
+        self.signatures = {}
+        # Ссылка -> (платформа, зарплата, работодатель) вакансии.
+        self.keys = {}
+        # Ссылка дубля -> ссылка исходной вакансии и обратное соответствие.
+        self.duplicates = {}
+        self._copies = {}
+
+    def signature(self, title: str, requirement: str) -> tuple[int, ...]:
+        """
+        Возвращает MinHash-подпись названия и требований вакансии.
+        Используется вариант с одной хеш-функцией: хеш шингла выбирает
+        ячейку подписи, в ячейке остается минимальное значение.
+        Так подпись строится за один проход по шинглам.
+        Пустые ячейки заполняются значением ближайшей следующей ячейки.
+        """
+        empty = _MASK + 1
+        cells = [empty] * self.num_perm
+        for value in shingles(f"{title} {requirement or ''}"):
+            cell = value % self.num_perm
+            value //= self.num_perm
+            if value < cells[cell]:
+                cells[cell] = value
+
+        # Уплотнение: пустая ячейка получает значение ближайшей следующей
+        # непустой ячейки со сдвигом, зависящим от расстояния до нее.
+        if empty in cells:
+            original = list(cells)
+            for cell in range(self.num_perm):
+                if original[cell] != empty:
+                    continue
+                step = 1
+                while original[(cell + step) % self.num_perm] == empty:
+                    step += 1
+                source = original[(cell + step) % self.num_perm]
+                cells[cell] = (source + step * _MIX) & _MASK
+        return tuple(cells)
+
+    def _band_keys(self, signature: tuple[int, ...]) -> list[tuple]:
+        """Делит подпись на полосы."""
+        return [signature[band * self.rows:(band + 1) * self.rows]
+                for band in range(self.bands)]
+
+    def similarity(self, first: tuple, second: tuple) -> float:
+        """Оценивает сходство Жаккара по двум подписям."""
+        return sum(map(eq, first, second)) / self.num_perm
+
+    @staticmethod
+    def key(link: str, salary: int = None, employer: str = None) -> tuple:
+        """Возвращает платформу, зарплату и работодателя вакансии."""
+        if employer:
+            employer = ' '.join(WORD_PATTERN.findall(employer.lower()))
+        return platform_of(link), salary, employer or None
+
+    @staticmethod
+    def comparable(first: tuple, second: tuple) -> bool:
+        """
+        Проверяет, могут ли вакансии с ключами first и second быть
+        одной вакансией: платформы разные, зарплаты совпадают,
+        работодатели совпадают, если известны у обеих.
+        """
+        platform, salary, employer = first
+        other_platform, other_salary, other_employer = second
+        if platform == other_platform or salary != other_salary:
+            return False
+        return employer is None or other_employer is None or \
+            employer == other_employer
+
+    def find(self, signature: tuple[int, ...],
+             key: tuple = None) -> str | None:
+        """
+        Возвращает ссылку похожей вакансии из индекса или None.
+
+        :param key: Ключ вакансии (см. key); если задан, кандидаты
+        проверяются функцией comparable.
+        """
+        candidates = set()
+        for band, band_key in enumerate(self._band_keys(signature)):
+            candidates.update(self.buckets[band].get(band_key, ()))
+
+        best_link, best_score = None, self.threshold
+        for link in candidates:
+            if key is not None and not self.comparable(key, self.keys[link]):
+                continue
+            score = self.similarity(signature, self.signatures[link])
+            if score >= best_score:
+                best_link, best_score = link, score
+        return best_link
+
+    def add(self, link: str, title: str, requirement: str,
+            salary: int = None, employer: str = None) -> str | None:
+        """
+        Проверяет вакансию и добавляет ее в индекс.
+        Возвращает ссылку исходной вакансии, если это дубль
+        (по ссылке или по содержанию), иначе None.
+        """
+        if link in self.signatures:
+            return link
+        if link in self.duplicates:
+            return self.duplicates[link]
+
+        signature = self.signature(title, requirement)
+        key = self.key(link, salary, employer)
+        original = self.find(signature, key)
+        if original is not None:
+            self.duplicates[link] = original
+            self._copies.setdefault(original, set()).add(link)
+            return original
+
+        self.signatures[link] = signature
+        self.keys[link] = key
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self.buckets[band].setdefault(band_key, set()).add(link)
+        return None
+
+    def remove(self, link: str) -> None:
+        """Удаляет вакансию и ссылки на нее как на исходную из индекса."""
+        signature = self.signatures.pop(link, None)
+        if signature is None:
+            original = self.duplicates.pop(link, None)
+            if original is not None:
+                self._copies[original].discard(link)
+            return
+        del self.keys[link]
+        for band, key in enumerate(self._band_keys(signature)):
+            bucket = self.buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(link)
+                if not bucket:
+                    del self.buckets[band][key]
+        for duplicate in self._copies.pop(link, ()):
+            del self.duplicates[duplicate]
+
+    def clear(self) -> None:
+        """Очищает индекс."""
+        self.buckets = [{} for _ in range(self.bands)]
+        self.signatures.clear()
+        self.keys.clear()
+        self.duplicates.clear()
+        self._copies.clear()
+
+    def filter_rows(self, rows):
+        """
+        Пропускает только строки (title, link, salary, requirement),
+        которые не являются дублями уже проверенных вакансий.
+        """
+        for row in rows:
+            if self.add(row[1], row[0], row[3], row[2]) is None:
+                yield row
@@ -0,0 +1,324 @@
+import argparse
+import heapq
+import json
+from operator import itemgetter
+import os
+import pickle
+import sys
+import tempfile
+from typing import Callable, Iterable, Iterator
+from settings import PATH_FILE, MEMORY_BUDGET, EXTSORT_READ_CHUNK, \
+    STORE_COMPACT
+from textindex import KeywordMatcher
+from codec import codec
+
+# Символы между элементами массива JSON.
+_SEPARATORS = ' \t\r\n,'
+
+# Ключ сортировки вакансий по зарплате.
+SALARY_KEY = itemgetter('salary')
+
+
+def iter_json_array(filename,
+                    chunk_size: int = EXTSORT_READ_CHUNK) -> Iterator[dict]:
+    """
+    Поочередно возвращает элементы массива JSON из файла,
+    не загружая файл целиком: в памяти находится только
+    прочитанный фрагмент размером около chunk_size символов.
+    Отсутствующий файл считается пустым массивом.
+    """
+    decoder = json.JSONDecoder()
+    try:
+        file = open(filename, encoding='utf-8')
+    except FileNotFoundError:
+        return
+
+    with file:
+        buffer = ''
+        position = 0
+        started = False
+        eof = False
+        while True:
+            # Пропускаем пробелы и запятые, дочитывая файл при необходимости.
+            while position < len(buffer) and buffer[position] in _SEPARATORS:
+                position += 1
+            if position == len(buffer):
+                if eof:
+                    return
+                chunk = file.read(chunk_size)
+                eof = not chunk
+                buffer, position = buffer[position:] + chunk, 0
+                continue
+
+            if not started:
+                if buffer[position] != '[':
+                    raise ValueError("Файл не содержит массив JSON.")
+                started = True
+                position += 1
+                continue
+            if buffer[position] == ']':
+                return
+
+            try:
+                item, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # Элемент не поместился в прочитанный фрагмент.
+                if eof:
+                    raise
+                chunk = file.read(chunk_size)
+                eof = not chunk
+                buffer, position = buffer[position:] + chunk, 0
+                continue
+            yield item
+
+
+def _format_item(item: dict) -> str:
+    """
+    Форматирует вакансию так же, как json.dump(indent=2) внутри массива.
+    Плоский словарь кодируется быстрым кодировщиком без отступов,
+    отступы добавляются разделителями.
+    """
+    if item and not any(isinstance(value, (dict, list))
+                        for value in item.values()):
+        text = json.dumps(item, ensure_ascii=False,
+                          separators=(',\n    ', ': '))
+        return '{\n    ' + text[1:-1] + '\n  }'
+    return json.dumps(item, indent=2, ensure_ascii=False).replace('\n',
+                                                                  '\n  ')
+
+
+def write_json_array(items: Iterable[dict], filename,
+                     compact: bool = STORE_COMPACT) -> int:
+    """
+    Потоково и атомарно записывает вакансии в файл в том же формате,
+    что и JSONSaver (с отступами или компактно).
+    Возвращает количество записанных вакансий.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    descriptor, temp_name = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    count = 0
+    try:
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as file:
+            file.write('[')
+            for item in items:
+                if compact:
+                    file.write(',' if count else '')
+                    file.write(codec.dumps(item).decode('utf-8'))
+                else:
+                    file.write(',\n  ' if count else '\n  ')
+                    file.write(_format_item(item))
+                count += 1
+            file.write(']' if compact or not count else '\n]')
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_name, filename)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+    return count
+
+
+def filter_salary(items: Iterable[dict], min_salary: int = None,
+                  max_salary: int = None) -> Iterator[dict]:
+    """
+    Пропускает вакансии с зарплатой от min_salary до max_salary
+    включительно (как JSONSaver.get_salary).
+    """
+    for item in items:
+        if (min_salary is None or item['salary'] >= min_salary) and \
+                (max_salary is None or item['salary'] <= max_salary):
+            yield item
+
+
+def filter_requirement(items: Iterable[dict], criteria_list: list[str],
+                       whole_words: bool = False) -> Iterator[dict]:
+    """
+    Пропускает вакансии, в требованиях которых есть все ключевые слова
+    (по правилам KeywordMatcher, как JSONSaver.get_requirement).
+    """
+    matcher = KeywordMatcher(criteria_list, whole_words)
+    for item in items:
+        if matcher.matches(item['requirement']):
+            yield item
+
+
+def item_size(item: dict) -> int:
+    """Оценивает объем памяти, который занимает словарь вакансии."""
+    return sys.getsizeof(item) + sum(sys.getsizeof(value)
+                                     for value in item.values())
+
+
+def _write_run(items: list[dict], directory: str) -> str:
+    """
+    Сохраняет отсортированную часть во временный файл.
+    Временные файлы читает только этот модуль, поэтому вакансии
+    сохраняются через pickle, который быстрее JSON.
+    """
+    descriptor, name = tempfile.mkstemp(dir=directory, suffix='.run')
+    with os.fdopen(descriptor, 'wb') as file:
+        for item in items:
+            pickle.dump(item, file, pickle.HIGHEST_PROTOCOL)
+    return name
+
+
+def _read_run(name: str) -> Iterator[dict]:
+    """Поочередно читает вакансии из временного файла части."""
+    with open(name, 'rb') as file:
+        while True:
+            try:
+                yield pickle.load(file)
+            except EOFError:
+                return
+
+
+def external_sort(items: Iterable[dict], key: Callable,
+                  reverse: bool = False,
+                  memory_budget: int = MEMORY_BUDGET) -> Iterator[dict]:
+    """
+    Сортирует поток вакансий с ограничением памяти.
+    Вакансии набираются в часть, пока ее объем не превысит
+    memory_budget, часть сортируется и сохраняется во временный файл.
+    Затем части объединяются k-путевым слиянием, которое держит
+    в памяти по одной вакансии из каждой части.
+    Порядок равных элементов такой же, как у sorted().
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        runs = []
+        chunk = []
+        size = 0
+        for item in items:
+            chunk.append(item)
+            size += item_size(item)
+            if size >= memory_budget:
+                chunk.sort(key=key, reverse=reverse)
+                runs.append(_write_run(chunk, directory))
+                chunk = []
+                size = 0
+        chunk.sort(key=key, reverse=reverse)
+
+        # Если все поместилось в память, временные файлы не нужны.
+        if not runs:
+            yield from chunk
+            return
+        if chunk:
+            runs.append(_write_run(chunk, directory))
+            chunk = []
+        yield from heapq.merge(*(_read_run(name) for name in runs),
+                               key=key, reverse=reverse)
+
+
+def sort_by_salary(items: Iterable[dict], reverse: bool = False,
+                   top_n: int = None,
+                   memory_budget: int = MEMORY_BUDGET) -> Iterator[dict]:
+    """
+    Сортирует поток вакансий по зарплате с ограничением памяти.
+    Для top_n достаточно ограниченной кучи из top_n вакансий,
+    поэтому поток читается один раз без временных файлов.
+    """
+    if top_n:
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return iter(select(top_n, items, key=SALARY_KEY))
+    return external_sort(items, SALARY_KEY, reverse, memory_budget)
+
+
+class StreamingStore:
+    """
+    Хранилище вакансий в JSON-файле для данных больше оперативной памяти.
+    Формат файла тот же, что у JSONSaver, но вакансии читаются потоком,
+    а фильтры и сортировка выполняются с ограничением памяти
+    memory_budget. Результаты совпадают с JSONSaver и sort_vacancies.
+    """
+
+    def __init__(self, filename, memory_budget: int = MEMORY_BUDGET,
+                 compact: bool = STORE_COMPACT) -> None:
+        """
+        Создание экземпляра класса StreamingStore.
+
+        :param filename: JSON-файл с вакансиями.
+        :param memory_budget: Объем памяти для сортировки (байт).
+        :param compact: Записывать файл без отступов (как JSONSaver).
+        """
+        self.filename = filename
+        self.memory_budget = memory_budget
+        self.compact = compact
+
+    def __iter__(self) -> Iterator[dict]:
+        """Поочередно возвращает вакансии из файла."""
+        return iter_json_array(self.filename)
+
+    def _rewrite(self, items: Iterable[dict]) -> int:
+        """
+        Записывает отфильтрованные вакансии в новый файл и заменяет им
+        основной. Возвращает количество оставшихся вакансий.
+        """
+        return write_json_array(items, self.filename, self.compact)
+
+    def get_salary(self, salary: int, max_salary: int = None) -> int:
+        """
+        Оставляет в файле вакансии с зарплатой от salary
+        до max_salary. Возвращает количество оставшихся вакансий.
+        """
+        return self._rewrite(filter_salary(self, salary, max_salary))
+
+    def get_requirement(self, criteria_list: list[str],
+                        whole_words: bool = False) -> int:
+        """
+        Оставляет в файле вакансии со всеми словами criteria_list
+        в требованиях. Возвращает количество оставшихся вакансий.
+        """
+        return self._rewrite(filter_requirement(self, criteria_list,
+                                                whole_words))
+
+    def sorted(self, reverse: bool = False,
+               top_n: int = None) -> Iterator[dict]:
+        """Поочередно возвращает вакансии, отсортированные по зарплате."""
+        return sort_by_salary(self, reverse, top_n, self.memory_budget)
+
+
+def parse_size(value: str) -> int:
+    """Переводит размер вида 512K, 64M, 2G или число байт в байты."""
+    units = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+    value = value.strip().upper().rstrip('B')
+    if value and value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+def main() -> None:
+    """
+    Фильтрует и сортирует файл вакансий с ограничением памяти
+    и выводит результат в формате JSON Lines или сохраняет в файл.
+    """
+    parser = argparse.ArgumentParser(
+        description="Фильтр и сортировка вакансий больше оперативной памяти."
+    )
+    parser.add_argument('--file', default=PATH_FILE,
+                        help="JSON-файл с вакансиями")
+    parser.add_argument('--min-salary', type=int)
+    parser.add_argument('--max-salary', type=int)
+    parser.add_argument('--keywords', nargs='*', default=[])
+    parser.add_argument('--order', choices=['asc', 'desc'], default='desc')
+    parser.add_argument('--top', type=int, help="количество вакансий")
+    parser.add_argument('--budget', type=parse_size, default=MEMORY_BUDGET,
+                        help="объем памяти, например 64M")
+    parser.add_argument('--output', help="файл для результата (JSON)")
+    args = parser.parse_args()
+
+    items = iter_json_array(args.file)
+    if args.min_salary is not None or args.max_salary is not None:
+        items = filter_salary(items, args.min_salary, args.max_salary)
+    if args.keywords:
+        items = filter_requirement(items, args.keywords)
+    items = sort_by_salary(items, args.order == 'desc', args.top,
+                           args.budget)
+
+    if args.output:
+        count = write_json_array(items, args.output)
+        print(f"Сохранено вакансий: {count}")
+    else:
+        for item in items:
+            print(json.dumps(item, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
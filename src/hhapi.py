@@ -0,0 +1,135 @@
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterator
+from settings import MAX_PAGES, MAX_WORKERS
+from transport import HTTPTransport, get_transport
+from scheduler import RequestScheduler, get_scheduler, \
+    PRIORITY_INTERACTIVE
+from pageapi import PageAPI
+from platforms import platforms
+
+if TYPE_CHECKING:
+    from cache import ResponseCache
+
+
+@platforms.register('hh')
+class HeadHunterAPI(PageAPI):
+    """
+    Класс, наследующийся от абстрактного класса,
+    для работы с платформой HeadHunter.
+    """
+
+    platform = 'hh'
+    items_key = 'items'
+    per_page = 100
+    page_fields = {
+        'pages': None,
+        'items': [{'name': None, 'alternate_url': None,
+                   'salary': {'from': None, 'to': None},
+                   'snippet': {'requirement': None},
+                   'published_at': None}],
+    }
+
+    def __init__(self, max_pages: int = MAX_PAGES,
+                 max_workers: int = MAX_WORKERS,
+                 transport: HTTPTransport = None,
+                 cache: 'ResponseCache' = None,
+                 scheduler: RequestScheduler = None,
+                 priority: int = PRIORITY_INTERACTIVE) -> None:
+        """
+        Создание экземпляра класса HeadHunterAPI.
+        Устанавливает базовый URL для работы с API HeadHunter.
+
+        :param max_pages: Максимальное количество страниц поиска.
+        :param max_workers: Количество потоков для загрузки страниц.
+        :param transport: HTTP-транспорт, по умолчанию общий для всех платформ.
+        :param cache: Кэш ответов API, по умолчанию общий для всех платформ.
+        :param scheduler: Планировщик запросов, по умолчанию общий.
+        :param priority: Приоритет запросов (интерактивный или фоновый).
+        """
+        self.url = 'https://api.hh.ru'
+        self.max_pages = max_pages
+        self.max_workers = max_workers
+        self.transport = transport or get_transport()
+        if cache is None:
+            from cache import get_cache
+            cache = get_cache()
+        self.cache = cache
+        self.scheduler = scheduler or get_scheduler()
+        self.priority = priority
+
+    def get_page(self, search_query: str, search_area: int,
+                 page: int, since: datetime = None) -> dict:
+        """
+        Запрашивает одну страницу поиска вакансий.
+
+        Параметры запроса:
+        'text' - поисковой запрос,
+        'area' - регион поиска,
+        'page' - номер страницы поиска,
+        'per_page' - количество элементов (вакансий),
+        'only_with_salary' - вывод вакансий с указанием зарплаты (True),
+        'date_from' - дата публикации, начиная с которой ищутся вакансии,
+        'order_by' - сортировка: при обновлении сначала самые новые,
+        чтобы ограничение числа страниц отсекало самые старые вакансии.
+        """
+        url = f"{self.url}/vacancies"
+        params = {
+            "text": search_query,
+            "area": search_area,
+            "page": page,
+            "per_page": self.per_page,
+            "only_with_salary": True,
+            "search_fields": "name"
+        }
+        if since is not None:
+            params["date_from"] = since.isoformat(timespec='seconds')
+            params["order_by"] = "publication_time"
+
+        # При обновлении новые вакансии могли появиться и в пределах
+        # времени жизни кэша, поэтому ответ проверяется повторно.
+        return self.get_json(url, params, revalidate=since is not None)
+
+    @staticmethod
+    def published(vacancy: dict) -> datetime | None:
+        """Возвращает дату публикации вакансии."""
+        if not vacancy.get('published_at'):
+            return None
+        return datetime.strptime(vacancy['published_at'],
+                                 '%Y-%m-%dT%H:%M:%S%z')
+
+    @staticmethod
+    def page_count(response: dict) -> int:
+        """Возвращает количество страниц поиска из ответа API."""
+        return response.get('pages', 1)
+
+    @staticmethod
+    def organize_rows(data_vacancy) -> Iterator[tuple]:
+        """
+        Организация данных по вакансиям.
+        Поочередно возвращает кортежи (title, link, salary, requirement).
+        """
+        for vacancy in data_vacancy:
+            title = vacancy['name']
+            link = vacancy['alternate_url']
+            requirement = vacancy['snippet'].get('requirement', None)
+            salary_from = vacancy['salary'].get('from', None)
+            salary_to = vacancy['salary'].get('to', None)
+
+            # Устанавливаем значение зарплаты.
+            # Если есть обе границы - устанавливаем минимальное значение.
+            # В ином случае, устанавливаем то значение, которое существует.
+            if salary_from and salary_to:
+                salary = min(salary_from, salary_to)
+            else:
+                salary = salary_from or salary_to
+
+            # Устанавливаем значение требований.
+            # Если значение есть - приводим его к нижнему регистру.
+            # В ином случае, устанавливаем значение, что данных нет.
+            if requirement:
+                requirement = requirement.lower()
+            else:
+                requirement = 'Нет данных.'
+
+            # Возвращаем сформированные данные.
+            yield title, link, salary, requirement
@@ -0,0 +1,293 @@
+import argparse
+from contextlib import contextmanager
+import os
+import sys
+import tempfile
+import threading
+from jsonsaver import SaveWorker
+from vacancybatch import VacancyBatch
+from textindex import KeywordMatcher
+from codec import codec
+from settings import JSONL_COMPACT_RATIO, JSONL_COMPACT_MIN_LINES, \
+    PATH_FILE, PATH_JSONL_FILE
+
+
+class JSONLSaver(SaveWorker):
+    """
+    Класс для сохранения информации о вакансиях в файл JSON Lines.
+    Каждое изменение дописывается в конец файла отдельной строкой:
+    добавление - строкой с вакансией, удаление - строкой-надгробием
+    {"link": ..., "deleted": true}. Когда доля устаревших строк превышает
+    порог, файл в фоновом потоке переписывается только живыми вакансиями.
+    """
+
+    def __init__(self, filename, compact_ratio: float = JSONL_COMPACT_RATIO,
+                 background: bool = True) -> None:
+        """
+        Создание экземпляра класса JSONLSaver.
+
+        :param filename: Файл с данными по вакансиям.
+        :param compact_ratio: Доля устаревших строк, после которой
+        выполняется сжатие файла.
+        :param background: Выполнять сжатие в фоновом потоке.
+        """
+        self.filename = filename
+        self.compact_ratio = compact_ratio
+        self.background = background
+        # Живые вакансии по ссылке в порядке добавления.
+        self.live = {}
+        self._lines = 0
+        self._buffer = []
+        self._batch_depth = 0
+        self._pending = None
+        self._lock = threading.RLock()
+        self._compactor = None
+
+    @property
+    def data(self) -> list[dict]:
+        """Возвращает список живых вакансий."""
+        with self._lock:
+            return list(self.live.values())
+
+    def load_data(self) -> None:
+        """
+        Загружает файл построчно, применяя добавления и надгробия по порядку.
+        Поврежденная последняя строка (например, после сбоя записи)
+        пропускается.
+        """
+        with self._lock:
+            self.live = {}
+            self._lines = 0
+            try:
+                with open(self.filename, 'rb') as file:
+                    for line in file:
+                        try:
+                            record = codec.loads(line)
+                        except codec.DecodeError:
+                            continue
+                        self._lines += 1
+                        self._apply(record)
+            except FileNotFoundError:
+                pass
+
+    def _apply(self, record: dict) -> None:
+        """Применяет строку файла к набору живых вакансий."""
+        if record.get('deleted'):
+            self.live.pop(record['link'], None)
+        else:
+            # Повторное добавление ссылки заменяет старую запись.
+            self.live.pop(record['link'], None)
+            self.live[record['link']] = record
+
+    def _append(self, records: list[dict]) -> None:
+        """Применяет записи и ставит их в очередь на дозапись в файл."""
+        with self._lock:
+            for record in records:
+                self._apply(record)
+            self._buffer.extend(records)
+        self.save_data()
+
+    def save_data(self) -> None:
+        """
+        Дописывает накопленные строки в конец файла.
+        Внутри пакетного режима запись откладывается до выхода из batch().
+        """
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self) -> None:
+        """Дописывает в файл все накопленные строки одним вызовом write."""
+        with self._lock:
+            if not self._buffer:
+                return
+            lines = b''.join(codec.dumps(record) + b'\n'
+                             for record in self._buffer)
+            with open(self.filename, 'ab') as file:
+                file.write(lines)
+            self._lines += len(self._buffer)
+            # Строки, дописанные во время сжатия, переносятся в новый файл.
+            if self._pending is not None:
+                self._pending.append(lines)
+            self._buffer = []
+        self.maybe_compact()
+
+    @contextmanager
+    def batch(self):
+        """
+        Контекстный менеджер пакетного режима: строки копятся в памяти
+        и дописываются в файл один раз при выходе из блока.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def dead_ratio(self) -> float:
+        """Возвращает долю устаревших строк в файле."""
+        with self._lock:
+            if not self._lines:
+                return 0.0
+            return (self._lines - len(self.live)) / self._lines
+
+    def maybe_compact(self) -> None:
+        """Запускает сжатие, если доля устаревших строк превысила порог."""
+        if self._lines < JSONL_COMPACT_MIN_LINES or \
+                self.dead_ratio() < self.compact_ratio:
+            return
+        if not self.background:
+            self.compact()
+        elif self._compactor is None or not self._compactor.is_alive():
+            self._compactor = threading.Thread(target=self.compact,
+                                               daemon=True)
+            self._compactor.start()
+
+    def compact(self) -> None:
+        """
+        Переписывает файл только живыми вакансиями.
+        Снимок пишется во временный файл без блокировки, строки,
+        дописанные за это время, переносятся в него перед заменой файла.
+        """
+        with self._lock:
+            snapshot = list(self.live.values())
+            self._pending = []
+
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        descriptor, temp_name = tempfile.mkstemp(dir=directory,
+                                                 suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                for record in snapshot:
+                    file.write(codec.dumps(record) + b'\n')
+                with self._lock:
+                    for lines in self._pending:
+                        file.write(lines)
+                    file.flush()
+                    os.fsync(file.fileno())
+                    os.replace(temp_name, self.filename)
+                    self._lines = len(snapshot) + sum(
+                        lines.count(b'\n') for lines in self._pending)
+                    self._pending = None
+        except BaseException:
+            with self._lock:
+                self._pending = None
+            if os.path.exists(temp_name):
+                os.unlink(temp_name)
+            raise
+
+    def wait_compaction(self) -> None:
+        """Ожидает завершения фонового сжатия, если оно выполняется."""
+        if self._compactor is not None:
+            self._compactor.join()
+
+    def add_vacancy(self, vacancies: list | VacancyBatch) -> None:
+        """
+        Добавляет вакансии в конец файла.
+        Принимает список экземпляров Vacancy или VacancyBatch.
+        """
+        if isinstance(vacancies, VacancyBatch):
+            self._append(vacancies.to_dicts())
+        else:
+            self._append([vacancy.to_dict() for vacancy in vacancies])
+
+    def upsert_vacancy(self, vacancies: list | VacancyBatch) -> None:
+        """
+        Добавляет новые вакансии и обновляет уже сохраненные
+        с той же ссылкой: при загрузке последняя строка со ссылкой
+        заменяет предыдущие.
+        """
+        self.add_vacancy(vacancies)
+
+    def _delete_where(self, predicate) -> None:
+        """Дописывает надгробия для всех вакансий, где predicate истинен."""
+        with self._lock:
+            links = [link for link, item in self.live.items()
+                     if predicate(item)]
+        self._append([{'link': link, 'deleted': True} for link in links])
+
+    def get_requirement(self, criteria_list: list[str],
+                        whole_words: bool = False) -> None:
+        """
+        Получает список со словами, фильтрует по ним критерий требований,
+        сохраняет полученные вакансии в файл.
+        Правила совпадения - как у KeywordMatcher и JSONSaver.
+        """
+        matcher = KeywordMatcher(criteria_list, whole_words)
+        if matcher:
+            self._delete_where(
+                lambda item: not matcher.matches(item['requirement'])
+            )
+
+    def get_salary(self, salary: int, max_salary: int = None) -> None:
+        """
+        Получает значение зарплаты, фильтрует по нему критерий зарплаты,
+        сохраняет полученные вакансии в файл.
+
+        :param salary: Минимальная зарплата.
+        :param max_salary: Максимальная зарплата (необязательно).
+        """
+        self._delete_where(lambda item: item['salary'] < salary or (
+            max_salary is not None and item['salary'] > max_salary))
+
+    def delete_vacancy(self, vacancy_link: str) -> None:
+        """Удаляет вакансию, дописывая надгробие в файл."""
+        self.delete_vacancies([vacancy_link])
+
+    def delete_vacancies(self, vacancy_links: list[str]) -> None:
+        """Удаляет вакансии с указанными ссылками одной дозаписью."""
+        with self._lock:
+            links = [link for link in dict.fromkeys(vacancy_links)
+                     if link in self.live]
+        self._append([{'link': link, 'deleted': True} for link in links])
+
+    def import_json(self, json_filename) -> int:
+        """
+        Переносит вакансии из файла в формате JSONSaver (массив JSON)
+        и возвращает количество перенесенных вакансий.
+        Вакансии с уже сохраненными ссылками заменяются.
+        Если файл поврежден или не является массивом вакансий,
+        выбрасывает ValueError и ничего не переносит.
+        """
+        with open(json_filename, 'rb') as file:
+            body = file.read()
+        try:
+            items = codec.loads(body)
+            if not isinstance(items, list):
+                raise ValueError("ожидался массив вакансий")
+            records = [{'title': item['title'], 'link': item['link'],
+                        'salary': item['salary'],
+                        'requirement': item['requirement']}
+                       for item in items]
+        except (codec.DecodeError, ValueError, KeyError, TypeError) as error:
+            raise ValueError(f"Файл {json_filename} не удалось перенести: "
+                             f"{error!r}") from error
+
+        self._append(records)
+        return len(records)
+
+
+def main() -> None:
+    """Переносит вакансии из JSON-файла JSONSaver в файл JSON Lines."""
+    parser = argparse.ArgumentParser(
+        description="Перенос вакансий из JSON-файла в хранилище JSON Lines."
+    )
+    parser.add_argument('--source', default=PATH_FILE,
+                        help="JSON-файл с вакансиями (формат JSONSaver)")
+    parser.add_argument('--target', default=PATH_JSONL_FILE,
+                        help="файл JSON Lines")
+    args = parser.parse_args()
+
+    saver = JSONLSaver(args.target, background=False)
+    saver.load_data()
+    try:
+        count = saver.import_json(args.source)
+    except (OSError, ValueError) as error:
+        sys.exit(f"Ошибка: {error}")
+    print(f"Перенесено вакансий: {count}, всего в хранилище: "
+          f"{len(saver.live)}")
+
+
+if __name__ == "__main__":
+    main()
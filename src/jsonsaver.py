@@ -1,5 +1,15 @@
 from abc import ABC, abstractmethod
-import json
+from contextlib import contextmanager
+import os
+import tempfile
+from textindex import InvertedIndex
+from salaryindex import SalaryIndex
+from vacancybatch import VacancyBatch
+from dedupe import NearDuplicateIndex
+from analytics import SalaryAnalytics
+from metrics import metrics
+from codec import codec
+from settings import STORE_COMPACT
 
 
 class SaveWorker(ABC):
@@ -18,7 +28,15 @@ class SaveWorker(ABC):
         pass
 
     @abstractmethod
-    def get_salary(self, salary):
+    def get_salary(self, salary, max_salary=None):
+        pass
+
+    @abstractmethod
+    def get_requirement(self, criteria_list):
+        pass
+
+    @abstractmethod
+    def upsert_vacancy(self, vacancies):
         pass
 
     @abstractmethod
@@ -31,57 +49,255 @@ class JSONSaver(SaveWorker):
     Класс для сохранения информации о вакансиях в JSON-файл.
     """
 
-    def __init__(self, filename) -> None:
+    def __init__(self, filename,
+                 deduplicator: NearDuplicateIndex = None,
+                 analytics: SalaryAnalytics = None,
+                 compact: bool = STORE_COMPACT) -> None:
         """
         Создание экземпляра класса JSONSaver.
 
         :param filename: Файл с данными по вакансиям.
+        :param deduplicator: Индекс почти одинаковых вакансий; если задан,
+        add_vacancy не сохраняет дубли уже сохраненных вакансий.
+        :param analytics: Статистика зарплат; если задана, учитывает
+        добавляемые вакансии и сохраняется вместе с файлом.
+        :param compact: Записывать файл без отступов (меньше размер
+        и быстрее запись); читаются оба формата.
         """
         self.filename = filename
+        self.deduplicator = deduplicator
+        self.analytics = analytics
+        self.compact = compact
         self.data = []
+        self.index = InvertedIndex()
+        self.salary_index = SalaryIndex()
+        # Последняя добавленная вакансия для каждой ссылки.
+        self.links = {}
+        self._batch_depth = 0
+        self._dirty = False
 
     def load_data(self) -> None:
         """Загружает файл."""
         try:
-            with open(self.filename, encoding='utf-8') as file:
-                self.data = json.load(file)
+            with open(self.filename, 'rb') as file:
+                self.data = codec.loads(file.read())
         except FileNotFoundError:
             self.data = []
-        except json.JSONDecodeError:
+        except codec.DecodeError:
             return None
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Строит индексы требований и зарплат заново по текущим данным."""
+        self.index.clear()
+        self.links = {}
+        if self.deduplicator is not None:
+            self.deduplicator.clear()
+        for item in self.data:
+            self.index.add(id(item), item['requirement'])
+            self.links[item['link']] = item
+            if self.deduplicator is not None:
+                self.deduplicator.add(item['link'], item['title'],
+                                      item['requirement'], item['salary'],
+                                      item.get('employer'))
+        self.salary_index.rebuild(self.data)
+
+    def _keep(self, predicate) -> None:
+        """
+        Оставляет в данных только вакансии, для которых predicate истинен,
+        и удаляет остальные из индексов требований и зарплат.
+        """
+        kept = []
+        removed = []
+        for item in self.data:
+            if predicate(item):
+                kept.append(item)
+            else:
+                self.index.remove(id(item))
+                if self.links.get(item['link']) is item:
+                    del self.links[item['link']]
+                    if self.deduplicator is not None:
+                        self.deduplicator.remove(item['link'])
+                removed.append(item)
+        self.salary_index.remove_many(removed)
+        self.data = kept
 
     def save_data(self) -> None:
-        """Сохраняет данные в файл."""
-        with open(self.filename, 'w', encoding='utf-8') as file:
-            json.dump(self.data, file, indent=2, ensure_ascii=False)
+        """
+        Сохраняет данные в файл.
+        Внутри пакетного режима только отмечает, что данные изменились,
+        запись выполняется один раз при выходе из batch() или вызове flush().
+        """
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self._write()
 
-    def add_vacancy(self, vacancies: list) -> None:
-        """Добавляет вакансии в файл."""
-        self.data.extend([vacancy.to_dict() for vacancy in vacancies])
+    def flush(self) -> None:
+        """Записывает в файл изменения, накопленные в пакетном режиме."""
+        if self._dirty:
+            self._write()
+
+    @contextmanager
+    def batch(self):
+        """
+        Контекстный менеджер пакетного режима: изменения хранятся в памяти
+        и записываются в файл один раз при выходе из блока.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def _write(self) -> None:
+        """
+        Атомарно записывает данные: сначала во временный файл
+        в той же папке, затем заменяет им основной файл.
+        Сбой во время записи не повреждает основной файл.
+        """
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        descriptor, temp_name = tempfile.mkstemp(dir=directory,
+                                                 suffix='.tmp')
+        try:
+            with metrics.timer('save_data_seconds'), \
+                    os.fdopen(descriptor, 'wb') as file:
+                file.write(codec.dumps(self.data, indent=not self.compact))
+                file.flush()
+                os.fsync(file.fileno())
+                metrics.inc('store_bytes_written_total', file.tell())
+            os.replace(temp_name, self.filename)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+        if self.analytics is not None:
+            self.analytics.save()
+        self._dirty = False
+
+    @staticmethod
+    def _to_dicts(vacancies: list | VacancyBatch) -> list[dict]:
+        """Переводит список экземпляров Vacancy или VacancyBatch в словари."""
+        if isinstance(vacancies, VacancyBatch):
+            return vacancies.to_dicts()
+        return [vacancy.to_dict() for vacancy in vacancies]
+
+    def _insert(self, items: list[dict]) -> None:
+        """
+        Добавляет словари вакансий в данные, индексы и статистику.
+        В статистике учитываются только вакансии со ссылками, которых
+        еще нет в хранилище, поэтому повторная загрузка тех же вакансий
+        не искажает ее.
+        """
+        new_items = []
+        for item in items:
+            if item['link'] not in self.links:
+                new_items.append(item)
+            self.index.add(id(item), item['requirement'])
+            self.links[item['link']] = item
+        self.salary_index.add(items)
+        self.data.extend(items)
+        if self.analytics is not None:
+            self.analytics.add(new_items)
+
+    def _unique(self, items: list[dict]) -> list[dict]:
+        """
+        Отбрасывает вакансии, которые индекс дублей признал повтором
+        уже сохраненной вакансии (по ссылке или по содержанию).
+        """
+        if self.deduplicator is None:
+            return items
+        return [item for item in items
+                if self.deduplicator.add(item['link'], item['title'],
+                                         item['requirement'], item['salary'],
+                                         item.get('employer')) is None]
+
+    def add_vacancy(self, vacancies: list | VacancyBatch) -> None:
+        """
+        Добавляет вакансии в файл.
+        Принимает список экземпляров Vacancy или VacancyBatch.
+        """
+        self._insert(self._unique(self._to_dicts(vacancies)))
+        self.save_data()
+
+    def upsert_vacancy(self, vacancies: list | VacancyBatch) -> None:
+        """
+        Добавляет новые вакансии и обновляет уже сохраненные
+        с той же ссылкой. Стоимость зависит только от числа
+        переданных вакансий, а не от размера файла.
+        """
+        # Из повторов внутри пачки остается последняя вакансия.
+        items = {item['link']: item
+                 for item in self._to_dicts(vacancies)}.values()
+        new_items = []
+        for item in items:
+            existing = self.links.get(item['link'])
+            if existing is None:
+                new_items.append(item)
+                continue
+            # Обновляем сохраненную вакансию на месте и переиндексируем ее.
+            self.index.remove(id(existing))
+            self.salary_index.remove(existing)
+            existing.update(item)
+            self.index.add(id(existing), existing['requirement'])
+            self.salary_index.add([existing])
+        self._insert(self._unique(new_items))
         self.save_data()
 
-    def get_requirement(self, criteria_list: list[str]) -> None:
+    def get_requirement(self, criteria_list: list[str],
+                        whole_words: bool = False) -> None:
         """
         Получает список со словами, фильтрует по ним критерий требований,
         сохраняет полученные вакансии в файл.
+        Кандидаты находятся по инвертированному индексу, правила
+        совпадения - как у KeywordMatcher: по умолчанию слово ищется
+        как подстрока требований, в режиме whole_words - как отдельное
+        слово.
         """
-        requirement_data = [item for item in self.data
-                            if item['requirement'] is not None
-                            if all(criteria in item['requirement']
-                                   for criteria in criteria_list)]
-        self.data = requirement_data
+        matched = self.index.search(criteria_list, whole_words)
+        self._keep(lambda item: id(item) in matched)
         self.save_data()
 
-    def get_salary(self, salary: int) -> None:
+    def get_salary(self, salary: int, max_salary: int = None) -> None:
         """
-        Получает список со словами, фильтрует по ним критерий зарплаты,
+        Получает значение зарплаты, фильтрует по нему критерий зарплаты,
         сохраняет полученные вакансии в файл.
+        Подходящие вакансии находятся бинарным поиском по индексу зарплат.
+
+        :param salary: Минимальная зарплата.
+        :param max_salary: Максимальная зарплата (необязательно).
         """
-        salary_data = [item for item in self.data if item['salary'] >= salary]
-        self.data = salary_data
+        matched = {id(item)
+                   for item in self.salary_index.range(salary, max_salary)}
+        self._keep(lambda item: id(item) in matched)
         self.save_data()
 
+    def salary_range(self, min_salary: int = None,
+                     max_salary: int = None) -> list[dict]:
+        """
+        Возвращает вакансии с зарплатой в указанном диапазоне
+        в порядке возрастания зарплаты, не изменяя данные.
+        """
+        return self.salary_index.range(min_salary, max_salary)
+
+    def top_salaries(self, top_n: int, reverse: bool = True) -> list[dict]:
+        """
+        Возвращает top_n вакансий с наибольшей зарплатой
+        (или наименьшей, если reverse=False) прямо из индекса зарплат.
+        """
+        return self.salary_index.top(top_n, reverse)
+
     def delete_vacancy(self, vacancy_link: str) -> None:
         """Удаляет вакансии из файла."""
-        self.data = [item for item in self.data if item['link'] != vacancy_link]
+        self._keep(lambda item: item['link'] != vacancy_link)
+        self.save_data()
+
+    def delete_vacancies(self, vacancy_links: list[str]) -> None:
+        """
+        Удаляет из файла все вакансии с указанными ссылками
+        за один проход по данным и одну запись файла.
+        """
+        links = set(vacancy_links)
+        self._keep(lambda item: item['link'] not in links)
         self.save_data()
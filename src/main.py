@@ -1,12 +1,33 @@
-from settings import PATH_FILE
-from jsonsaver import JSONSaver
+import argparse
+from settings import PATH_FILE, PATH_DB_FILE, PATH_JSONL_FILE, \
+    STORAGE_BACKEND, DEDUPE_ENABLED, PATH_METRICS_FILE, PROFILE_ENABLED, \
+    PATH_PROFILE_DIR, PROFILE_INTERVAL
 from main_utils import get_selected_platforms, get_vacancies, \
     get_search_query_and_area, print_vacancies, delete_vacancies, \
-    sort_vacancies, load_area_dicts
+    sort_vacancies
+from arearesolver import get_area_resolver
+from metrics import metrics
 
 
-json_saver = JSONSaver(PATH_FILE)
-PLATFORMS = ['HeadHunter', 'headhunter', 'hh', 'SuperJob', 'superjob', 'sj']
+# Хранилище выбирается настройкой STORAGE_BACKEND,
+# все классы реализуют одинаковый интерфейс SaveWorker.
+# Импортируется только модуль выбранного хранилища.
+if STORAGE_BACKEND == 'sqlite':
+    from sqlitesaver import SQLiteSaver
+    json_saver = SQLiteSaver(PATH_DB_FILE)
+elif STORAGE_BACKEND == 'jsonl':
+    from jsonlsaver import JSONLSaver
+    json_saver = JSONLSaver(PATH_JSONL_FILE)
+    json_saver.load_data()
+else:
+    from jsonsaver import JSONSaver
+    from analytics import SalaryAnalytics
+    deduplicator = None
+    if DEDUPE_ENABLED:
+        from dedupe import NearDuplicateIndex
+        deduplicator = NearDuplicateIndex()
+    json_saver = JSONSaver(PATH_FILE, deduplicator=deduplicator,
+                           analytics=SalaryAnalytics.for_store(PATH_FILE))
 
 
 def user_inter():
@@ -18,14 +39,13 @@ def user_inter():
     # до тех пор, пока пользователь не введет команду 'нет'.
     while not program_exit:
         # Создаем список с выбранной платформой на которой будем работать.
-        api_list = get_selected_platforms(PLATFORMS)
+        api_list = get_selected_platforms()
 
-        # Создаем переменные для выбранного пользователем города.
-        area_hh, area_sj = load_area_dicts()
         # Создаем переменные с поиском запроса и городом запроса.
+        # Справочник городов загружается один раз при первом обращении.
         # Далее происходит поиск вакансий по этим двум критериям.
         search_query, search_area_hh, search_area_sj = \
-            get_search_query_and_area(area_hh, area_sj)
+            get_search_query_and_area(get_area_resolver())
 
         # Передаем созданные переменные - функции,
         # которая создает экземпляры вакансий и добавляет их в список.
@@ -74,5 +94,32 @@ def user_inter():
         delete_vacancies(json_saver, filtered_vacancies)
 
 
+def parse_args() -> argparse.Namespace:
+    """Разбирает аргументы командной строки."""
+    parser = argparse.ArgumentParser(description="Поиск вакансий.")
+    parser.add_argument('--profile', action='store_true',
+                        default=PROFILE_ENABLED,
+                        help="профилировать время и память (cProfile и "
+                             "tracemalloc)")
+    parser.add_argument('--profile-dir', default=PATH_PROFILE_DIR,
+                        help="папка для отчетов профилирования")
+    parser.add_argument('--profile-interval', type=float,
+                        default=PROFILE_INTERVAL,
+                        help="интервал замеров памяти (секунды)")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    user_inter()
+    args = parse_args()
+    try:
+        if args.profile:
+            from profiler import Profiler
+            with Profiler(args.profile_dir, args.profile_interval):
+                user_inter()
+            print(f"Отчеты профилирования сохранены в {args.profile_dir}")
+        else:
+            user_inter()
+    finally:
+        # Метрики выгружаются в файл, если их сбор включен.
+        if metrics.enabled:
+            metrics.export(PATH_METRICS_FILE)
@@ -1,14 +1,14 @@
-import json
-from settings import PATH_AREA_FILE
-from pageapi import HeadHunterAPI, SuperJobAPI
-from vacancy import Vacancy
+import heapq
+from platforms import platforms
 from jsonsaver import JSONSaver
+from arearesolver import AreaResolver
+from pipeline import run_pipeline
 
 
-def get_selected_platforms(platforms: list) -> list:
+def get_selected_platforms() -> list:
     """
-    Возвращает список с экземпляром платформы
-    по API классов HeadHunterAPI или SuperJobAPI.
+    Возвращает список с экземплярами платформ,
+    выбранных пользователем по названиям из реестра платформ.
     """
     api_list = []
     valid_input = False
@@ -21,20 +21,12 @@ def get_selected_platforms(platforms: list) -> list:
                                    ).split()
 
         # Создаем цикл for, чтобы сравнивать введенный пользователем текст
-        # со значениями в списке платформ. В зависимости от ввода
-        # проводится выбор платформы и создается нужный экземпляр класса с API.
+        # с названиями платформ из реестра. Класс API выбранной платформы
+        # загружается только при ее выборе.
         for platform in selected_platforms:
-            if platform.strip() in platforms:
-                if platform.strip() == 'HeadHunter' or \
-                        platform.strip() == 'headhunter' or \
-                        platform.strip() == 'hh':
-                    api_list.append(HeadHunterAPI())
-                    valid_input = True
-                elif platform.strip() == 'SuperJob' or \
-                        platform.strip() == 'superjob' or \
-                        platform.strip() == 'sj':
-                    api_list.append(SuperJobAPI())
-                    valid_input = True
+            if platforms.resolve(platform) is not None:
+                api_list.append(platforms.create(platform))
+                valid_input = True
             else:
                 print("Платформа не поддерживается или Вы не ввели ее.")
                 break
@@ -42,25 +34,13 @@ def get_selected_platforms(platforms: list) -> list:
     return api_list
 
 
-def load_area_dicts() -> tuple[dict, dict]:
-    """Загружает json файл со словарями городов для API."""
-    try:
-        with open(PATH_AREA_FILE, encoding='utf-8') as file:
-            areas = json.load(file)
-    except FileNotFoundError:
-        pass
-
-    return areas['area_hh'], areas['area_sj']
-
-
-def get_search_query_and_area(area_hh: dict,
-                              area_sj: dict) -> tuple[str, int, int]:
+def get_search_query_and_area(resolver: AreaResolver) -> tuple[str, int, int]:
     """
     Возвращает значение введенные пользователем для осуществления
     поиска по API по критериям:
     поиска - search_query,
-    города - search_city (поиск ведется по словарю hh, т.к.
-    словари обеих платформ одинаковы, различаются лишь значения(int)).
+    города - search_city (город ищется в справочнике AreaResolver,
+    который сразу возвращает id города на обеих платформах).
     """
     # Просим пользователя ввести поисковый запрос.
     search_query = input("Введите поисковый запрос (Например, Python): ")
@@ -73,21 +53,27 @@ def get_search_query_and_area(area_hh: dict,
             valid_search = True
         else:
             print("Вы не ввели поисковый запрос.")
-            search_query = input("Введите поисковый запрос (Например, Python): ")
+            search_query = input("Введите поисковый запрос "
+                                 "(Например, Python): ")
 
     # Просим пользователя ввести город поиска.
-    search_city = input("Введите название города (Например, Москва): "
-                        "").title()
+    search_city = input("Введите название города (Например, Москва): ")
+    area = resolver.resolve(search_city)
 
     # Создаем цикл while, до тех пор пока пользователь
-    # не введет существующий город в словаре.
-    while search_city not in area_hh:
+    # не введет существующий город в справочнике.
+    while area is None:
         print('Такого города нет в базе или неверный ввод.')
-        search_city = input("Введите название города (Например, Москва): "
-                            "").title()
+        # Предлагаем похожие названия городов.
+        suggestions = resolver.suggest(search_city)
+        if suggestions:
+            print("Возможно, вы имели в виду: "
+                  f"{', '.join(item.name for item in suggestions)}")
+        search_city = input("Введите название города (Например, Москва): ")
+        area = resolver.resolve(search_city)
 
-    search_area_hh = area_hh[search_city]  # сохраняем значение введенного города hh.
-    search_area_sj = area_sj[search_city]  # сохраняем значение введенного города sj.
+    search_area_hh = area.hh  # сохраняем значение введенного города hh.
+    search_area_sj = area.sj  # сохраняем значение введенного города sj.
 
     return search_query, search_area_hh, search_area_sj
 
@@ -95,70 +81,53 @@ def get_search_query_and_area(area_hh: dict,
 def get_vacancies(json_saver: JSONSaver, api_list: list, search_query: str,
                   search_area_hh: int, search_area_sj: int) -> None:
     """
-    Создает экземпляры класса Vacancy по запрашиваемому поиску (слово, город)
-    и добавляет их в файл с вакансиями. Далее обращается к функциям
-    фильтрации по критериям salary и requirement.
+    Запрашивает у пользователя критерии фильтрации по salary и requirement,
+    затем потоково получает вакансии по запрашиваемому поиску (слово, город)
+    и добавляет в файл только подходящие под критерии вакансии.
     """
-    # Создаем цикл for и выбираем работу с вакансиями
-    # на основе выбранной пользователем платформы.
-    for api in api_list:
-        # Получаем вакансии по запросам (слово, город).
-        hh_data = api.get_vacancies(search_query, search_area_hh)
-        sj_data = api.get_vacancies(search_query, search_area_sj)
-
-        # Создаем экземпляры класса Vacancy.
-        hh_vacancies = [Vacancy(v['title'], v['link'], v['salary'],
-                                v['requirement']) for v in hh_data]
-
-        sj_vacancies = [Vacancy(v['title'], v['link'], v['salary'],
-                                v['requirement']) for v in sj_data]
-
-        # Добавляем вакансии в файл.
-        json_saver.add_vacancy(hh_vacancies)
-        json_saver.add_vacancy(sj_vacancies)
-
-        # Фильтруем вакансии по критериям salary и requirement.
-        filter_by_salary(json_saver)
-        filter_by_requirement(json_saver)
-
-
-def filter_by_salary(json_saver: JSONSaver) -> None:
-    """Фильтруем вакансии по зарплате (критерий salary)."""
-    # Создаем цикл while с флагом valid_salary, он работает до тех пор,
-    # пока пользователь не введет запрос.
-    valid_salary = False
-    while not valid_salary:
+    # Каждая платформа получает только свой id региона.
+    areas = {'hh': search_area_hh, 'sj': search_area_sj}
+
+    # Критерии запрашиваются до поиска, чтобы фильтры применялись
+    # в конвейере и неподходящие вакансии не сохранялись.
+    min_salary = ask_min_salary()
+    keyword_list = ask_keywords()
+
+    # Страницы всех платформ загружаются одновременно и проходят
+    # через конвейер без накопления полного списка вакансий.
+    # Файл с вакансиями записывается один раз в конце.
+    with json_saver.batch():
+        count = run_pipeline(api_list, search_query, areas, json_saver,
+                             min_salary, keyword_list)
+
+    # Если подходящих вакансий нет, выводим сообщение.
+    if count == 0:
+        print("Нет вакансий, соответствующих заданным критериям.")
+
+
+def ask_min_salary() -> int:
+    """Запрашивает у пользователя минимальное значение зарплаты."""
+    # Создаем цикл while, он работает до тех пор,
+    # пока пользователь не введет число.
+    while True:
         try:
             # Просим пользователя ввести минимальное значение зарплаты.
-            min_salary = int(input("Введите минимальную зарплату для "
-                                   "фильтрации (Например, 110000): "))
+            return int(input("Введите минимальную зарплату для "
+                             "фильтрации (Например, 110000): "))
         except ValueError:
             print('Вы не ввели значение зарплаты.')
-        else:
-            # Фильтруем по минимальному значению.
-            json_saver.get_salary(min_salary)
-            valid_salary = True
-            # Если файл с вакансиями пуст после фильтрации выводим сообщение.
-            if len(json_saver.data) == 0:
-                print("Нет вакансий, соответствующих заданным критериям.")
 
 
-def filter_by_requirement(json_saver: JSONSaver) -> None:
-    """Фильтруем вакансии по зарплате (критерий requirement)."""
+def ask_keywords() -> list[str]:
+    """Запрашивает у пользователя ключевые слова для фильтрации."""
     # Просим пользователя ввести ключевое слово для фильтрации.
     keyword_list = input("Введите ключевые слова для фильтрации вакансий "
                          "по требованиям (через пробел): ").lower().split()
 
-    # Делаем проверку ввода данных пользователя,
-    # в ином случае выводим сообщение.
-    if keyword_list:
-        # Фильтруем по ключевым словам
-        json_saver.get_requirement(keyword_list)
-        # Если файл с вакансиями пуст после фильтрации выводим сообщение.
-        if len(json_saver.data) == 0:
-            print("Нет вакансий, соответствующих заданным критериям.")
-    else:
+    # Если слова не введены, выводим сообщение.
+    if not keyword_list:
         print("Вы отказались от фильтрации по требованиям.")
+    return keyword_list
 
 
 def sort_vacancies(filtered_vacancies: list, order: str, top_n) -> list:
@@ -167,6 +136,19 @@ def sort_vacancies(filtered_vacancies: list, order: str, top_n) -> list:
     Имеет возможность выводить конкретное количество вакансий
     (если такое количество имеется).
     """
+    # При заданном top_n лучшие вакансии выбираются ограниченной кучей
+    # без полной сортировки списка.
+    if top_n:
+        top_n = int(top_n)
+        # По возрастанию.
+        if order.lower() == '1':
+            return heapq.nsmallest(top_n, filtered_vacancies,
+                                   key=lambda x: x['salary'])
+        # По убыванию.
+        elif order.lower() == '2':
+            return heapq.nlargest(top_n, filtered_vacancies,
+                                  key=lambda x: x['salary'])
+
     # По возрастанию.
     if order.lower() == '1':
         sorted_vacancies = sorted(filtered_vacancies,
@@ -179,10 +161,6 @@ def sort_vacancies(filtered_vacancies: list, order: str, top_n) -> list:
         print("Некорректный выбор порядка сортировки.")
         return []
 
-    # Проверяем наличие ввода значения - если оно есть выводим срез вакансий.
-    if top_n:
-        sorted_vacancies = sorted_vacancies[:int(top_n)]
-
     return sorted_vacancies
 
 
@@ -197,5 +175,4 @@ def print_vacancies(vacancies: list) -> None:
 
 def delete_vacancies(json_saver: JSONSaver, vacancies: list) -> None:
     """Удаляет вакансии с помощью функции из класса JSONSaver."""
-    for vacancy in vacancies:
-        json_saver.delete_vacancy(vacancy['link'])
+    json_saver.delete_vacancies([vacancy['link'] for vacancy in vacancies])
@@ -0,0 +1,184 @@
+import json
+import threading
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+from settings import METRICS_ENABLED, METRICS_BUCKETS
+
+# Пустой контекстный менеджер, который возвращает timer() при отключенных
+# метриках: замер не выполняется и новые объекты не создаются.
+_NULL_TIMER = nullcontext()
+
+
+class _Timer:
+    """Контекстный менеджер, записывающий время выполнения блока."""
+
+    __slots__ = ('_metrics', '_name', '_labels', '_start')
+
+    def __init__(self, metrics: 'Metrics', name: str, labels: dict) -> None:
+        self._metrics = metrics
+        self._name = name
+        self._labels = labels
+
+    def __enter__(self) -> '_Timer':
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._metrics.observe(self._name, time.perf_counter() - self._start,
+                              **self._labels)
+
+
+class Metrics:
+    """
+    Счетчики, таймеры и гистограммы этапов поиска вакансий.
+    Значения хранятся отдельно для каждого набора меток
+    (например, platform='hh'). При отключенных метриках методы
+    сразу возвращаются, поэтому замеры можно оставлять в коде.
+    """
+
+    def __init__(self, enabled: bool = METRICS_ENABLED,
+                 buckets: tuple = METRICS_BUCKETS) -> None:
+        """
+        Создание экземпляра класса Metrics.
+
+        :param enabled: Включен ли сбор метрик.
+        :param buckets: Верхние границы корзин гистограмм (секунды).
+        """
+        self.enabled = enabled
+        self.buckets = tuple(buckets)
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name: str, labels: dict) -> tuple:
+        """Возвращает ключ значения: имя и отсортированные метки."""
+        return name, tuple(sorted((label, str(value))
+                                  for label, value in labels.items()))
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        """Увеличивает счетчик name на value."""
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """Добавляет значение value в гистограмму name."""
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                # Счетчики корзин, сумма и количество значений.
+                histogram = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                self.histograms[key] = histogram
+            histogram[0][bisect_left(self.buckets, value)] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+    def timer(self, name: str, **labels):
+        """
+        Возвращает контекстный менеджер, который записывает
+        время выполнения блока в гистограмму name.
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name, labels)
+
+    def snapshot(self) -> dict:
+        """Возвращает текущие значения метрик в виде словаря для JSON."""
+        with self._lock:
+            counters = [{'name': name, 'labels': dict(labels),
+                         'value': value}
+                        for (name, labels), value in self.counters.items()]
+            histograms = [{'name': name, 'labels': dict(labels),
+                           'buckets': list(counts), 'sum': total,
+                           'count': count}
+                          for (name, labels), (counts, total, count)
+                          in self.histograms.items()]
+        return {'bucket_bounds': list(self.buckets), 'counters': counters,
+                'histograms': histograms}
+
+    def merge(self, snapshot: dict) -> None:
+        """
+        Добавляет значения из снимка snapshot, например полученного
+        из другого процесса. Границы корзин должны совпадать.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            for counter in snapshot['counters']:
+                key = self._key(counter['name'], counter['labels'])
+                self.counters[key] = self.counters.get(key, 0) + \
+                    counter['value']
+            for item in snapshot['histograms']:
+                key = self._key(item['name'], item['labels'])
+                histogram = self.histograms.setdefault(
+                    key, [[0] * (len(self.buckets) + 1), 0.0, 0]
+                )
+                histogram[0] = [own + other for own, other
+                                in zip(histogram[0], item['buckets'])]
+                histogram[1] += item['sum']
+                histogram[2] += item['count']
+
+    def reset(self) -> None:
+        """Обнуляет все метрики."""
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    @staticmethod
+    def _labels(labels: tuple, extra: str = '') -> str:
+        """Форматирует метки в синтаксисе Prometheus."""
+        parts = [f'{label}="{value}"' for label, value in labels]
+        if extra:
+            parts.append(extra)
+        return '{' + ','.join(parts) + '}' if parts else ''
+
+    def to_prometheus(self) -> str:
+        """Возвращает метрики в текстовом формате Prometheus."""
+        lines = []
+        with self._lock:
+            counters = sorted(self.counters.items())
+            histograms = sorted(self.histograms.items())
+
+        previous = None
+        for (name, labels), value in counters:
+            if name != previous:
+                lines.append(f"# TYPE {name} counter")
+                previous = name
+            lines.append(f"{name}{self._labels(labels)} {value}")
+
+        previous = None
+        for (name, labels), (counts, total, count) in histograms:
+            if name != previous:
+                lines.append(f"# TYPE {name} histogram")
+                previous = name
+            cumulative = 0
+            for bound, bucket in zip(self.buckets + ('+Inf',), counts):
+                cumulative += bucket
+                le = self._labels(labels, f'le="{bound}"')
+                lines.append(f"{name}_bucket{le} {cumulative}")
+            lines.append(f"{name}_sum{self._labels(labels)} {total}")
+            lines.append(f"{name}_count{self._labels(labels)} {count}")
+        return '\n'.join(lines) + '\n'
+
+    def export(self, filename) -> None:
+        """
+        Сохраняет метрики в файл: в формате Prometheus для файлов
+        с расширением .prom, иначе в виде снимка JSON.
+        """
+        with open(filename, 'w', encoding='utf-8') as file:
+            if str(filename).endswith('.prom'):
+                file.write(self.to_prometheus())
+            else:
+                json.dump(self.snapshot(), file, indent=2,
+                          ensure_ascii=False)
+
+
+# Общий экземпляр метрик для всех модулей.
+metrics = Metrics()
@@ -1,9 +1,16 @@
 from abc import ABC, abstractmethod
-import requests
-import os
-from dotenv import load_dotenv
+from collections import deque
+from itertools import islice
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterator
+from metrics import metrics
 
-load_dotenv()
+# Пул потоков, asyncio, кодек JSON и VacancyBatch импортируются при первом
+# запросе, а не при загрузке модулей платформ для выбора платформы.
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Executor
+    from vacancybatch import VacancyBatch
 
 
 class ErrorResponse(Exception):
@@ -26,184 +33,228 @@ class ErrorResponse(Exception):
 class PageAPI(ABC):
     """Абстрактный класс для работы с API сайтов с вакансиями."""
 
+    # Короткое имя платформы и ключ списка вакансий в ответе API.
+    platform = ''
+    items_key = ''
+    # Поля ответа API, которые используются при разборе страницы;
+    # остальные пропускаются при декодировании.
+    page_fields = None
+
     @abstractmethod
     def __init__(self):
         pass
 
     @abstractmethod
-    def get_vacancies(self, search_query, search_area):
+    def get_page(self, search_query, search_area, page, since=None):
         pass
 
+    @abstractmethod
+    def published(self, vacancy):
+        pass
 
-class HeadHunterAPI(PageAPI):
-    """
-    Класс, наследующийся от абстрактного класса,
-    для работы с платформой HeadHunter.
-    """
+    @abstractmethod
+    def page_count(self, response):
+        pass
+
+    @abstractmethod
+    def organize_rows(self, data_vacancy):
+        pass
 
-    def __init__(self) -> None:
+    @classmethod
+    def data_organize(cls, data_vacancy) -> list[dict]:
         """
-        Создание экземпляра класса HeadHunterAPI.
-        Устанавливает базовый URL для работы с API HeadHunter.
+        Организация данных по вакансиям.
+        Возвращает сформированный список словарей.
         """
-        self.url = 'https://api.hh.ru'
-
-    def get_vacancies(self, search_query: str, search_area: int) -> list[dict]:
+        with metrics.timer('organize_seconds', platform=cls.platform):
+            result = [{'title': title, 'link': link, 'salary': salary,
+                       'requirement': requirement}
+                      for title, link, salary, requirement
+                      in cls.organize_rows(data_vacancy)]
+        metrics.inc('records_total', len(result), platform=cls.platform,
+                    stage='organize')
+        return result
+
+    @classmethod
+    def batch_organize(cls, data_vacancy) -> 'VacancyBatch':
+        """
+        Организация данных по вакансиям.
+        Возвращает колоночный VacancyBatch без промежуточных словарей.
+        """
+        from vacancybatch import VacancyBatch
+        with metrics.timer('organize_seconds', platform=cls.platform):
+            batch = VacancyBatch.from_rows(cls.organize_rows(data_vacancy))
+        metrics.inc('records_total', len(batch), platform=cls.platform,
+                    stage='organize')
+        return batch
+
+    def get_vacancies(self, search_query: str, search_area: int,
+                      as_batch: bool = False) -> 'list[dict] | VacancyBatch':
         """
         Производит поиск вакансий по пользовательскому запросу,
-        и получает список словарей с данными о вакансиях.
-
-        Параметры запроса:
-        'text' - поисковой запрос,
-        'area' - регион поиска,
-        'per_page' - количество элементов (вакансий),
-        'only_with_salary' - вывод вакансий с указанием зарплаты (True).
-        """
-        url = f"{self.url}/vacancies"
-        params = {
-            "text": search_query,
-            "area": search_area,
-            "per_page": 100,
-            "only_with_salary": True,
-            "search_fields": "name"
-        }
-
-        # Отправляем запрос с установленными параметрами.
-        response = requests.get(url, params=params)
-
-        # Если запрос выполнен успешно, возвращается список словарей,
-        # в противном случае выбрасывает ошибку.
-        if response.status_code == 200:
-            data_vacancy = response.json()['items']
-            return self.data_organize(data_vacancy)
-        else:
-            raise ErrorResponse("Ошибка при выполнении запроса: ",
-                                response.status_code)
-
-    @staticmethod
-    def data_organize(data_vacancy) -> list[dict]:
+        и получает список словарей с данными о вакансиях
+        (или VacancyBatch, если as_batch=True).
+        Обходит все страницы поиска, но не более max_pages.
         """
-        Организация данных по вакансиям.
-        Возвращает сформированный список словарей.
+        # Первая страница сообщает общее количество страниц.
+        first_page = self.get_page(search_query, search_area, 0)
+        pages = min(self.page_count(first_page), self.max_pages)
+
+        data_vacancy = list(first_page[self.items_key])
+        for response in self.fetch_pages(search_query, search_area,
+                                         range(1, pages)):
+            data_vacancy.extend(response[self.items_key])
+
+        if as_batch:
+            return self.batch_organize(data_vacancy)
+        return self.data_organize(data_vacancy)
+
+    async def get_vacancies_async(self, search_query: str, search_area: int,
+                                  limiter: 'asyncio.Semaphore',
+                                  executor: 'Executor' = None,
+                                  as_batch: bool = False
+                                  ) -> 'list[dict] | VacancyBatch':
         """
-        vacancies = []
-        for vacancy in data_vacancy:
-            title = vacancy['name']
-            link = vacancy['alternate_url']
-            requirement = vacancy['snippet'].get('requirement', None)
-            salary_from = vacancy['salary'].get('from', None)
-            salary_to = vacancy['salary'].get('to', None)
-
-            # Устанавливаем значение зарплаты.
-            # Если есть обе границы - устанавливаем минимальное значение.
-            # В ином случае, устанавливаем то значение, которое существует.
-            if salary_from and salary_to:
-                salary = min(salary_from, salary_to)
-            else:
-                salary = salary_from or salary_to
-
-            # Устанавливаем значение требований.
-            # Если значение есть - приводим его к нижнему регистру.
-            # В ином случае, устанавливаем значение, что данных нет.
-            if requirement:
-                requirement = requirement.lower()
-            else:
-                requirement = 'Нет данных.'
-
-            # Добавляем сформированные данные в список.
-            vacancies.append({
-                'title': title,
-                'link': link,
-                'salary': salary,
-                'requirement': requirement
-            })
-
-        return vacancies
-
-
-class SuperJobAPI(PageAPI):
-    """
-    Класс, наследующийся от абстрактного класса,
-    для работы с платформой SuperJob.
-    """
+        Асинхронный вариант get_vacancies.
+        Все страницы после первой запрашиваются одновременно,
+        общее число запросов в работе ограничивает семафор limiter.
 
-    def __init__(self):
+        :param limiter: Семафор, общий для всех платформ поиска.
+        :param executor: Пул потоков для выполнения блокирующих запросов.
+        :param as_batch: Вернуть VacancyBatch вместо списка словарей.
         """
-        Создание экземпляра класса SuperJobAPI.
-        Устанавливает базовый URL для работы с API SuperJob.
+        import asyncio
+        loop = asyncio.get_running_loop()
+
+        async def get_page(page: int) -> dict:
+            async with limiter:
+                return await loop.run_in_executor(
+                    executor, self.get_page, search_query, search_area, page
+                )
+
+        first_page = await get_page(0)
+        pages = min(self.page_count(first_page), self.max_pages)
+        responses = await asyncio.gather(*(get_page(page)
+                                           for page in range(1, pages)))
+
+        data_vacancy = list(first_page[self.items_key])
+        for response in responses:
+            data_vacancy.extend(response[self.items_key])
+
+        if as_batch:
+            return self.batch_organize(data_vacancy)
+        return self.data_organize(data_vacancy)
+
+    def iter_pages(self, search_query: str, search_area: int,
+                   since: datetime = None) -> Iterator[list[dict]]:
         """
-        self.url = "https://api.superjob.ru"
+        Поочередно возвращает списки вакансий со страниц поиска
+        в порядке номеров страниц.
+        Одновременно загружается не более max_workers страниц,
+        поэтому в памяти находится ограниченное число ответов.
 
-    def get_vacancies(self, search_query: str, search_area: int) -> list[dict]:
+        :param since: Запрашивать только вакансии, опубликованные
+        начиная с этого момента.
         """
-        Производит поиск вакансий по пользовательскому запросу,
-        и получает список словарей с данными о вакансиях
+        from concurrent.futures import ThreadPoolExecutor
+        first_page = self.get_page(search_query, search_area, 0, since)
+        pages = min(self.page_count(first_page), self.max_pages)
+        yield first_page[self.items_key]
+        del first_page
+
+        page_numbers = iter(range(1, pages))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = deque(
+                executor.submit(self.get_page, search_query, search_area,
+                                page, since)
+                for page in islice(page_numbers, self.max_workers)
+            )
+            while futures:
+                response = futures.popleft().result()
+                # Освободившееся место занимает следующая страница.
+                for page in islice(page_numbers, 1):
+                    futures.append(executor.submit(
+                        self.get_page, search_query, search_area, page, since
+                    ))
+                yield response[self.items_key]
+
+    def get_json(self, url: str, params: dict, headers: dict = None,
+                 revalidate: bool = False) -> dict:
+        """
+        Выполняет запрос к API и возвращает декодированный ответ,
+        в котором оставлены только поля из page_fields.
+        Свежий ответ из кэша возвращается без обращения к сети,
+        устаревший проверяется повторно по ETag / Last-Modified.
 
-        Параметры запроса:
-        'keyword' - поисковой запрос,
-        'page' - номер страницы поиска,
-        'count' - количество элементов (вакансий),
-        'town' - регион поиска (город).
-        """
-        url = f"{self.url}/2.0/vacancies/"
-        params = {
-            "keyword": search_query,
-            "page": 0,
-            "count": 10,
-            "town": search_area
-        }
-        headers = {'X-Api-App-Id': os.getenv("SJ_SECURE_CODE")}
-
-        # Отправляем запрос с установленными параметрами.
-        response = requests.get(url, headers=headers, params=params)
-
-        # Если запрос выполнен успешно, возвращается список словарей,
+        :param revalidate: Всегда проверять ответ из кэша повторно,
+        даже если он свежий.
+        """
+        entry = None
+        if self.cache is not None:
+            key = self.cache.make_key(self.platform, url, params)
+            entry = self.cache.get(key)
+            if entry is not None and entry.fresh and not revalidate:
+                metrics.inc('cache_hits_total', platform=self.platform)
+                return entry.payload
+
+        # Добавляем условные заголовки для повторной проверки записи.
+        headers = dict(headers or {})
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+
+        # Отправляем запрос с установленными параметрами через планировщик,
+        # который соблюдает ограничение частоты и повторяет запрос
+        # при временных ошибках.
+        with metrics.timer('http_request_seconds', platform=self.platform):
+            response = self.scheduler.request(
+                self.platform,
+                lambda: self.transport.get(url, params=params,
+                                           headers=headers),
+                self.priority
+            )
+        metrics.inc('http_responses_total', platform=self.platform,
+                    status=response.status_code)
+
+        # Если данные не изменились, возвращается ответ из кэша,
+        # если запрос выполнен успешно - новый ответ,
         # в противном случае выбрасывает ошибку.
-        if response.status_code == 200:
-            data_vacancy = response.json()['objects']
-            return self.data_organize(data_vacancy)
+        if response.status_code == 304 and entry is not None:
+            self.cache.revalidated(key)
+            return entry.payload
+        elif response.status_code == 200:
+            from codec import codec
+            metrics.inc('response_bytes_total', len(response.content),
+                        platform=self.platform)
+            with metrics.timer('json_decode_seconds', platform=self.platform):
+                payload = codec.decode(response.content, self.page_fields)
+            if self.cache is not None:
+                self.cache.put(key, payload, response.headers.get('ETag'),
+                               response.headers.get('Last-Modified'))
+            return payload
         else:
-            raise ErrorResponse(f"Ошибка при выполнении запроса: {response.status_code}")
+            raise ErrorResponse(f"Ошибка при выполнении запроса: "
+                                f"{response.status_code}")
 
-    @staticmethod
-    def data_organize(data_vacancy) -> list[dict]:
+    def fetch_pages(self, search_query: str, search_area: int,
+                    pages: range) -> list[dict]:
         """
-        Организация данных по вакансиям.
-        Возвращает сформированный список словарей.
+        Параллельно запрашивает указанные страницы поиска
+        в пуле потоков ограниченного размера.
+        Возвращает ответы API в порядке номеров страниц.
         """
-        vacancies = []
-        for vacancy in data_vacancy:
-            title = vacancy['profession']
-            link = vacancy['link']
-            salary_from = vacancy.get('payment_from', None)
-            salary_to = vacancy.get('payment_to', None)
-            requirement = vacancy.get('candidat', None)
-
-            # Устанавливаем значение зарплаты.
-            # Если есть обе границы - устанавливаем минимальное значение.
-            # В ином случае, устанавливаем то значение, которое существует.
-            if salary_from and salary_to:
-                salary = min(salary_from, salary_to)
-            else:
-                salary = salary_from or salary_to
-
-            # Устанавливаем значение требований.
-            # Если значение есть - приводим его к нижнему регистру.
-            # В ином случае, устанавливаем значение, что данных нет.
-            if requirement:
-                requirement = requirement.lower()
-            else:
-                requirement = 'Нет данных.'
-
-            # Проводим проверку, чтобы добавлялись лишь те вакансии, у которых
-            # значение зарплаты больше 1000.
-            # Добавляем сформированные данные в список.
-            if salary > 1000:
-                vacancies.append({
-                    'title': title,
-                    'link': link,
-                    'salary': salary,
-                    'requirement': requirement
-                })
-
-        return vacancies
+        if not pages:
+            return []
+
+        from concurrent.futures import ThreadPoolExecutor
+        # Размер пула не превышает количество запрашиваемых страниц.
+        workers = max(1, min(self.max_workers, len(pages)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Метод map сохраняет порядок страниц независимо от того,
+            # в каком порядке завершились запросы.
+            return list(executor.map(
+                lambda page: self.get_page(search_query, search_area, page),
+                pages
+            ))
@@ -0,0 +1,180 @@
+from queue import Queue, Full
+import threading
+from typing import Iterable, Iterator
+from itertools import islice
+from pageapi import PageAPI
+from jsonsaver import SaveWorker
+from vacancybatch import VacancyBatch
+from settings import PIPELINE_BUFFER, PIPELINE_CHUNK, PIPELINE_DEDUPE_WINDOW, \
+    ASYNC_CONCURRENCY
+from metrics import metrics
+from analytics import ingest_context
+from textindex import KeywordMatcher
+from asyncfetch import stream_pages
+
+# Признак завершения работы потока-источника.
+_DONE = object()
+# Как часто поток-источник проверяет, не остановлен ли конвейер (секунды).
+_PUT_TIMEOUT = 0.1
+
+
+def source(api_list: list[PageAPI], search_query: str, areas: dict[str, int],
+           buffer: int = PIPELINE_BUFFER,
+           concurrency: int = ASYNC_CONCURRENCY
+           ) -> Iterator[tuple[PageAPI, list]]:
+    """
+    Источник конвейера: одновременно обходит страницы поиска на всех
+    платформах и поочередно возвращает пары (платформа, вакансии страницы).
+    Страницы загружает асинхронный обход stream_pages в отдельном потоке:
+    все запросы (платформа, регион, страница) ограничены общим семафором
+    размера concurrency. Страницы передаются через очередь ограниченного
+    размера, поэтому загрузка ждет, пока конвейер не обработает уже
+    полученные. Если конвейер завершился раньше (ошибка, закрытие
+    генератора), загрузка останавливается и не остается ждать места
+    в очереди.
+    """
+    pages = Queue(maxsize=buffer)
+    stop = threading.Event()
+
+    def put(item: tuple) -> bool:
+        """Ждет места в очереди, пока конвейер не остановлен."""
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=_PUT_TIMEOUT)
+                return True
+            except Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            stream_pages(api_list, search_query, areas,
+                         lambda api, items: put((api, items)), concurrency)
+        except Exception as error:
+            put((None, error))
+        finally:
+            put((None, _DONE))
+
+    threading.Thread(target=produce, daemon=True,
+                     name='pipeline-source').start()
+
+    try:
+        while True:
+            api, items = pages.get()
+            if items is _DONE:
+                break
+            if isinstance(items, Exception):
+                raise items
+            yield api, items
+    finally:
+        stop.set()
+
+
+def normalize(pages: Iterable[tuple[PageAPI, list]]) -> Iterator[tuple]:
+    """
+    Приводит вакансии каждой платформы к кортежам
+    (title, link, salary, requirement).
+    """
+    for api, items in pages:
+        # Страница обрабатывается целиком, чтобы замерить время разбора
+        # без учета следующих этапов конвейера.
+        with metrics.timer('organize_seconds', platform=api.platform):
+            rows = list(api.organize_rows(items))
+        metrics.inc('records_total', len(rows), platform=api.platform,
+                    stage='organize')
+        yield from rows
+
+
+def validate(rows: Iterable[tuple]) -> Iterator[tuple]:
+    """Пропускает только строки, удовлетворяющие правилам Vacancy."""
+    rejected = 0
+    for row in rows:
+        title, link, salary, requirement = row
+        if isinstance(title, str) and isinstance(link, str) and \
+                isinstance(salary, int) and salary >= 0 and \
+                isinstance(requirement, str):
+            yield row
+        else:
+            rejected += 1
+    metrics.inc('records_rejected_total', rejected, stage='validate')
+
+
+def filter_salary(rows: Iterable[tuple], min_salary: int) -> Iterator[tuple]:
+    """Пропускает вакансии с зарплатой не ниже min_salary."""
+    for row in rows:
+        if row[2] >= min_salary:
+            yield row
+
+
+def filter_requirement(rows: Iterable[tuple], criteria_list: list[str],
+                       whole_words: bool = False) -> Iterator[tuple]:
+    """
+    Пропускает вакансии, в требованиях которых есть все ключевые слова.
+    Правила совпадения - как у KeywordMatcher и хранилищ, поэтому
+    при загрузке и при запросе к хранилищу слова дают одинаковый результат.
+    """
+    matcher = KeywordMatcher(criteria_list, whole_words)
+    for row in rows:
+        if matcher.matches(row[3]):
+            yield row
+
+
+def dedupe(rows: Iterable[tuple],
+           window: int = PIPELINE_DEDUPE_WINDOW) -> Iterator[tuple]:
+    """
+    Пропускает только первую вакансию с каждой ссылкой.
+    Помнит не больше window последних ссылок, поэтому память не растет
+    с длиной потока; повтор более старой ссылки отсеивает хранилище,
+    которое тоже не добавляет вакансии с уже сохраненной ссылкой.
+    """
+    seen = {}
+    for row in rows:
+        if row[1] not in seen:
+            seen[row[1]] = None
+            if len(seen) > window:
+                # Словарь хранит ссылки в порядке добавления.
+                del seen[next(iter(seen))]
+            yield row
+
+
+def sink(rows: Iterable[tuple], saver: SaveWorker,
+         chunk_size: int = PIPELINE_CHUNK, upsert: bool = False) -> int:
+    """
+    Сохраняет вакансии в хранилище пачками VacancyBatch по chunk_size штук
+    и возвращает количество сохраненных вакансий.
+
+    :param upsert: Обновлять уже сохраненные вакансии с той же ссылкой
+    вместо добавления повторов.
+    """
+    store = saver.upsert_vacancy if upsert else saver.add_vacancy
+    rows = iter(rows)
+    count = 0
+    while chunk := list(islice(rows, chunk_size)):
+        with metrics.timer('vacancy_validate_seconds'):
+            batch = VacancyBatch.from_rows(chunk)
+        with metrics.timer('store_add_seconds'):
+            store(batch)
+        count += len(chunk)
+    metrics.inc('records_total', count, stage='store')
+    return count
+
+
+def run_pipeline(api_list: list[PageAPI], search_query: str,
+                 areas: dict[str, int], saver: SaveWorker,
+                 min_salary: int = None,
+                 criteria_list: list[str] = None) -> int:
+    """
+    Собирает конвейер источник -> нормализация -> проверка -> фильтры ->
+    удаление дублей -> хранилище и возвращает количество сохраненных
+    вакансий. Фильтры применяются до сохранения, поэтому неподходящие
+    вакансии в хранилище не попадают.
+    """
+    rows = validate(normalize(source(api_list, search_query, areas)))
+    if min_salary is not None:
+        rows = filter_salary(rows, min_salary)
+    if criteria_list:
+        rows = filter_requirement(rows, criteria_list)
+    # Сохраняемые вакансии учитываются в статистике зарплат
+    # этого запроса и регионов.
+    with ingest_context(search_query, areas):
+        return sink(dedupe(rows), saver)
@@ -0,0 +1,96 @@
+from importlib import import_module
+import threading
+from typing import NamedTuple
+from settings import PLATFORM_MODULES
+
+
+class Platform(NamedTuple):
+    """Запись реестра: короткое имя, модуль платформы и псевдонимы."""
+    name: str
+    module: str
+    aliases: tuple
+
+
+class PlatformRegistry:
+    """
+    Реестр платформ с вакансиями.
+    Для каждой платформы заранее известны только названия и модуль
+    (PLATFORM_MODULES). Модуль импортируется при первом выборе
+    его платформы и сам регистрирует свой класс API декоратором
+    register, поэтому модули невыбранных платформ не загружаются.
+    """
+
+    def __init__(self, modules: dict = PLATFORM_MODULES) -> None:
+        """
+        Создание экземпляра класса PlatformRegistry.
+
+        :param modules: Словарь {модуль: (короткое имя, псевдонимы...)}.
+        """
+        self._platforms = {}
+        self._aliases = {}
+        self._classes = {}
+        self._lock = threading.Lock()
+        for module, (name, *aliases) in modules.items():
+            self.declare(name, module, aliases)
+
+    def declare(self, name: str, module: str, aliases=()) -> None:
+        """
+        Объявляет платформу, модуль которой импортируется при ее выборе.
+
+        :param name: Короткое имя платформы (например, 'hh').
+        :param module: Модуль, регистрирующий класс API платформы.
+        :param aliases: Другие названия платформы для ввода пользователя.
+        """
+        self._platforms[name] = Platform(name, module, tuple(aliases))
+        for alias in (name, *aliases):
+            self._aliases[alias.lower()] = name
+
+    def register(self, name: str):
+        """
+        Декоратор класса API, регистрирующий его для платформы name.
+        Применяется в модуле платформы и выполняется при его импорте.
+        """
+        def decorator(api_class: type) -> type:
+            self._classes[name] = api_class
+            return api_class
+        return decorator
+
+    def resolve(self, alias: str) -> str | None:
+        """
+        Возвращает короткое имя платформы по названию без учета регистра
+        или None, если такой платформы нет.
+        """
+        return self._aliases.get(alias.strip().lower())
+
+    def aliases(self) -> list[str]:
+        """Возвращает все известные названия платформ."""
+        return [alias for platform in self._platforms.values()
+                for alias in (platform.name, *platform.aliases)]
+
+    def get_class(self, alias: str) -> type:
+        """
+        Возвращает класс API платформы, импортируя ее модуль
+        при первом обращении. Выбрасывает KeyError для неизвестной
+        платформы.
+        """
+        name = self.resolve(alias)
+        if name is None:
+            raise KeyError(f"Платформа не поддерживается: {alias}")
+        api_class = self._classes.get(name)
+        if api_class is None:
+            with self._lock:
+                module = self._platforms[name].module
+                import_module(module)
+                api_class = self._classes.get(name)
+            if api_class is None:
+                raise KeyError(f"Модуль {module} не зарегистрировал "
+                               f"платформу {name}")
+        return api_class
+
+    def create(self, alias: str, **kwargs):
+        """Создает клиент API платформы с параметрами kwargs."""
+        return self.get_class(alias)(**kwargs)
+
+
+# Общий реестр платформ.
+platforms = PlatformRegistry()
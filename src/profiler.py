@@ -0,0 +1,155 @@
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from settings import PROFILE_INTERVAL, PROFILE_TOP, PROFILE_FRAMES
+
+# Папка с модулями проекта: выделения памяти относятся к ближайшему
+# по стеку модулю проекта (pageapi, vacancy, jsonsaver, main_utils...).
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def module_name(filename: str) -> str:
+    """
+    Возвращает имя модуля по пути к файлу
+    (для __init__.py - имя пакета).
+    """
+    name = os.path.splitext(os.path.basename(filename))[0]
+    if name == '__init__':
+        return os.path.basename(os.path.dirname(filename))
+    return name
+
+
+def group_by_module(snapshot: tracemalloc.Snapshot) -> list[tuple]:
+    """
+    Группирует выделения памяти снимка по модулям проекта.
+    Память, выделенная в стандартной библиотеке (например, json)
+    по вызову из модуля проекта, относится к этому модулю.
+    Возвращает список (модуль, байт, блоков) по убыванию размера.
+    """
+    sizes = defaultdict(int)
+    counts = defaultdict(int)
+    for statistic in snapshot.statistics('traceback'):
+        frames = statistic.traceback
+        # Кадры упорядочены от старого к новому, ищем самый новый
+        # кадр из модулей проекта.
+        owner = next((frame for frame in reversed(frames)
+                      if frame.filename.startswith(PROJECT_DIR)), frames[-1])
+        name = module_name(owner.filename)
+        sizes[name] += statistic.size
+        counts[name] += statistic.count
+    return sorted(((name, sizes[name], counts[name]) for name in sizes),
+                  key=lambda item: item[1], reverse=True)
+
+
+class Profiler:
+    """
+    Профилирование времени (cProfile) и памяти (tracemalloc).
+    Во время работы фоновый поток через заданный интервал
+    записывает текущий и пиковый объем памяти, чтобы был виден
+    ее рост, например, при увеличении JSONSaver.data.
+    cProfile учитывает только поток, в котором запущен профилировщик;
+    память учитывается во всех потоках.
+    """
+
+    def __init__(self, output_dir, interval: float = PROFILE_INTERVAL,
+                 top: int = PROFILE_TOP,
+                 frames: int = PROFILE_FRAMES) -> None:
+        """
+        Создание экземпляра класса Profiler.
+
+        :param output_dir: Папка для отчетов и файла pstats.
+        :param interval: Интервал замеров памяти (секунды).
+        :param top: Количество строк в отчетах.
+        :param frames: Глубина стека вызовов для выделений памяти.
+        """
+        self.output_dir = output_dir
+        self.interval = interval
+        self.top = top
+        self.frames = frames
+        self.samples = []
+        self._profile = cProfile.Profile()
+        self._stop = threading.Event()
+        self._thread = None
+        self._start = None
+
+    def _sample(self) -> None:
+        """Записывает объем памяти через каждые interval секунд."""
+        while not self._stop.wait(self.interval):
+            current, peak = tracemalloc.get_traced_memory()
+            self.samples.append((time.perf_counter() - self._start,
+                                 current, peak))
+
+    def __enter__(self) -> 'Profiler':
+        """Запускает профилирование."""
+        tracemalloc.start(self.frames)
+        self._start = time.perf_counter()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        self._profile.enable()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Останавливает профилирование и сохраняет отчеты."""
+        self._profile.disable()
+        self._stop.set()
+        self._thread.join()
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),)
+        )
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.samples.append((time.perf_counter() - self._start,
+                             current, peak))
+        self.save(snapshot)
+
+    def hot_functions(self, sort: str = 'cumulative') -> str:
+        """Возвращает отчет о самых затратных функциях."""
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=stream)
+        stats.strip_dirs().sort_stats(sort).print_stats(self.top)
+        return stream.getvalue()
+
+    def memory_report(self, snapshot: tracemalloc.Snapshot) -> str:
+        """
+        Возвращает отчет о памяти: выделения по модулям проекта,
+        самые затратные строки кода и замеры памяти по времени.
+        """
+        lines = ["Выделения памяти по модулям:"]
+        for name, size, count in group_by_module(snapshot)[:self.top]:
+            lines.append(f"  {name}: {size / 1024:.1f} KiB, {count} блоков")
+
+        lines.append("")
+        lines.append("Места выделения памяти:")
+        for statistic in snapshot.statistics('lineno')[:self.top]:
+            frame = statistic.traceback[0]
+            lines.append(f"  {module_name(frame.filename)}:{frame.lineno}: "
+                         f"{statistic.size / 1024:.1f} KiB, "
+                         f"{statistic.count} блоков")
+
+        lines.append("")
+        lines.append("Память по времени (секунды, текущая, пиковая):")
+        for seconds, current, peak in self.samples:
+            lines.append(f"  {seconds:.1f}: {current / 1024 / 1024:.1f} MiB, "
+                         f"{peak / 1024 / 1024:.1f} MiB")
+        return '\n'.join(lines) + '\n'
+
+    def save(self, snapshot: tracemalloc.Snapshot) -> None:
+        """
+        Сохраняет в output_dir файл profile.pstats для других
+        инструментов и текстовые отчеты profile_cpu.txt и profile_memory.txt.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._profile.dump_stats(os.path.join(self.output_dir,
+                                              'profile.pstats'))
+        with open(os.path.join(self.output_dir, 'profile_cpu.txt'), 'w',
+                  encoding='utf-8') as file:
+            file.write(self.hot_functions('cumulative'))
+            file.write(self.hot_functions('tottime'))
+        with open(os.path.join(self.output_dir, 'profile_memory.txt'), 'w',
+                  encoding='utf-8') as file:
+            file.write(self.memory_report(snapshot))
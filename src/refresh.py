@@ -0,0 +1,166 @@
+import argparse
+from datetime import datetime
+import json
+import os
+import tempfile
+import threading
+from settings import PATH_FILE
+from pageapi import PageAPI
+from platforms import platforms
+from jsonsaver import JSONSaver, SaveWorker
+from arearesolver import get_area_resolver
+from pipeline import validate
+from vacancybatch import VacancyBatch
+from scheduler import PRIORITY_BACKGROUND
+from analytics import ingest_context
+
+
+class Watermarks:
+    """
+    Отметки последнего обновления для каждой тройки
+    (платформа, запрос, регион): дата публикации самой свежей
+    из уже загруженных вакансий. Хранятся в файле рядом с хранилищем.
+    """
+
+    def __init__(self, filename) -> None:
+        """
+        Создание экземпляра класса Watermarks.
+
+        :param filename: Файл с отметками.
+        """
+        self.filename = filename
+        self.marks = {}
+        self._lock = threading.Lock()
+        try:
+            with open(filename, encoding='utf-8') as file:
+                self.marks = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.marks = {}
+
+    @classmethod
+    def for_saver(cls, saver: SaveWorker) -> 'Watermarks':
+        """Возвращает отметки, хранящиеся рядом с файлом хранилища."""
+        return cls(f"{saver.filename}.state.json")
+
+    @staticmethod
+    def key(platform: str, search_query: str, search_area: int) -> str:
+        """Формирует ключ отметки."""
+        return f"{platform}|{search_query.lower()}|{search_area}"
+
+    def get(self, platform: str, search_query: str,
+            search_area: int) -> datetime | None:
+        """Возвращает отметку или None, если обновлений еще не было."""
+        value = self.marks.get(self.key(platform, search_query, search_area))
+        return datetime.fromisoformat(value) if value else None
+
+    def set(self, platform: str, search_query: str, search_area: int,
+            moment: datetime) -> None:
+        """Устанавливает отметку и сохраняет файл."""
+        self.update({(platform, search_query, search_area): moment})
+
+    def update(self, marks: dict[tuple, datetime]) -> None:
+        """
+        Устанавливает отметки {(платформа, запрос, регион): момент}
+        и сохраняет файл один раз.
+        """
+        if not marks:
+            return
+        with self._lock:
+            for key, moment in marks.items():
+                self.marks[self.key(*key)] = moment.isoformat()
+            self.save()
+
+    def save(self) -> None:
+        """Атомарно записывает отметки в файл."""
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        descriptor, temp_name = tempfile.mkstemp(dir=directory,
+                                                 suffix='.tmp')
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as file:
+            json.dump(self.marks, file, indent=2, ensure_ascii=False)
+        os.replace(temp_name, self.filename)
+
+
+def refresh(api: PageAPI, search_query: str, search_area: int,
+            saver: SaveWorker,
+            watermarks: Watermarks) -> tuple[int, datetime | None]:
+    """
+    Загружает только вакансии, опубликованные после прошлого обновления,
+    и добавляет или обновляет их в хранилище по ссылке.
+    Возвращает количество загруженных вакансий и новую отметку
+    или None, если отметку сдвигать нельзя.
+    Отметка не сдвигается, если поиск уперся в ограничение max_pages:
+    часть вакансий после прошлой отметки могла остаться не загруженной.
+    """
+    since = watermarks.get(api.platform, search_query, search_area)
+    newest = since
+    rows = []
+    pages = size = 0
+    for items in api.iter_pages(search_query, search_area, since):
+        pages += 1
+        size = len(items)
+        for vacancy in items:
+            published = api.published(vacancy)
+            if published is not None and (newest is None or
+                                          published > newest):
+                newest = published
+        rows.extend(api.organize_rows(items))
+
+    batch = VacancyBatch.from_rows(validate(rows))
+    saver.upsert_vacancy(batch)
+    truncated = pages >= api.max_pages and size >= api.per_page
+    if truncated or newest == since:
+        newest = None
+    return len(batch), newest
+
+
+def refresh_all(api_list: list[PageAPI], search_query: str,
+                areas: dict[str, int], saver: SaveWorker) -> int:
+    """
+    Выполняет обновление на всех платформах в пакетном режиме.
+    Отметки сохраняются только после записи вакансий в хранилище,
+    чтобы сбой записи не пропустил вакансии при следующем обновлении.
+    """
+    watermarks = Watermarks.for_saver(saver)
+    marks = {}
+    count = 0
+    with saver.batch(), ingest_context(search_query, areas):
+        for api in api_list:
+            search_area = areas[api.platform]
+            loaded, newest = refresh(api, search_query, search_area, saver,
+                                     watermarks)
+            count += loaded
+            if newest is not None:
+                marks[(api.platform, search_query, search_area)] = newest
+    watermarks.update(marks)
+    return count
+
+
+def main() -> None:
+    """Точка входа периодического обновления вакансий."""
+    parser = argparse.ArgumentParser(
+        description="Загрузка вакансий, опубликованных после прошлого "
+                    "обновления."
+    )
+    parser.add_argument('query', help="поисковой запрос")
+    parser.add_argument('city', help="город поиска")
+    parser.add_argument('--platforms', nargs='+', default=['hh', 'sj'],
+                        help="платформы поиска")
+    parser.add_argument('--output', default=PATH_FILE,
+                        help="файл для сохранения вакансий")
+    args = parser.parse_args()
+
+    area = get_area_resolver().resolve(args.city)
+    if area is None:
+        parser.error(f"Неизвестный город: {args.city}")
+
+    saver = JSONSaver(args.output)
+    saver.load_data()
+    api_list = [platforms.create(platform, priority=PRIORITY_BACKGROUND)
+                for platform in args.platforms]
+    count = refresh_all(api_list, args.query,
+                        {'hh': area.hh, 'sj': area.sj}, saver)
+    print(f"Загружено новых и измененных вакансий: {count}")
+
+
+if __name__ == "__main__":
+    main()
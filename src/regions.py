@@ -0,0 +1,167 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+from itertools import groupby
+from operator import itemgetter
+from settings import PATH_FILE, REGION_SHARDS, RATE_LIMITS, \
+    DEFAULT_RATE_LIMIT, PIPELINE_CHUNK
+from platforms import platforms as registry
+from scheduler import RequestScheduler, PRIORITY_BACKGROUND
+from jsonsaver import JSONSaver, SaveWorker
+from arearesolver import Area, get_area_resolver
+from pipeline import validate, filter_salary, filter_requirement, sink
+from analytics import SalaryAnalytics, ingest_context
+
+# Ключ сортировки и слияния строк вакансий - ссылка.
+by_link = itemgetter(1)
+
+
+def shard_areas(cities: list[Area], shards: int) -> list[list[Area]]:
+    """Делит города на shards частей примерно одинакового размера."""
+    shards = max(1, min(shards, len(cities)))
+    return [cities[number::shards] for number in range(shards)]
+
+
+def shard_scheduler(platforms: list[str], shards: int) -> RequestScheduler:
+    """
+    Планировщик запросов для одного процесса-части.
+    У каждого процесса свое ограничение частоты, поэтому оно делится
+    на количество одновременно работающих частей: вместе процессы
+    не превышают ограничение платформы.
+    """
+    names = {registry.resolve(platform) or platform for platform in platforms}
+    return RequestScheduler(rate_limits={
+        name: RATE_LIMITS.get(name, DEFAULT_RATE_LIMIT) / shards
+        for name in names
+    })
+
+
+def crawl_shard(platforms: list[str], search_query: str, shard: list[Area],
+                min_salary: int = None, criteria_list: list[str] = None,
+                shards: int = 1) -> list[tuple]:
+    """
+    Выполняется в отдельном процессе: загружает и нормализует вакансии
+    по всем городам части, применяет фильтры и возвращает
+    отсортированный по ссылке список строк без повторов.
+    К каждой строке добавляются id города на платформах (hh, sj)
+    для статистики зарплат.
+
+    :param shards: Количество одновременно работающих частей.
+    """
+    scheduler = shard_scheduler(platforms, shards)
+    api_list = [registry.create(platform, scheduler=scheduler,
+                                priority=PRIORITY_BACKGROUND)
+                for platform in platforms]
+    rows = []
+    for area in shard:
+        areas = {'hh': area.hh, 'sj': area.sj}
+        area_rows = []
+        for api in api_list:
+            if areas[api.platform] is None:
+                continue
+            for items in api.iter_pages(search_query, areas[api.platform]):
+                area_rows.extend(api.organize_rows(items))
+
+        area_rows = validate(area_rows)
+        if min_salary is not None:
+            area_rows = filter_salary(area_rows, min_salary)
+        if criteria_list:
+            area_rows = filter_requirement(area_rows, criteria_list)
+        rows.extend((*row, (area.hh, area.sj)) for row in area_rows)
+
+    # Сортировка по ссылке позволяет объединить части слиянием.
+    rows = sorted(rows, key=by_link)
+    return [next(group) for _, group in groupby(rows, key=by_link)]
+
+
+def merge_shards(runs: list[list[tuple]]):
+    """
+    Слияние k отсортированных частей в один поток строк
+    с удалением повторов по ссылке.
+    """
+    merged = heapq.merge(*runs, key=by_link)
+    for _, group in groupby(merged, key=by_link):
+        yield next(group)
+
+
+def store_rows(rows, saver: SaveWorker, search_query: str,
+               chunk_size: int = PIPELINE_CHUNK) -> int:
+    """
+    Сохраняет строки с id городов в хранилище: вакансии с уже
+    сохраненными ссылками обновляются, новые добавляются.
+    Строки копятся по городам, чтобы каждая пачка сохранялась
+    в ingest_context своего города и попадала в статистику зарплат
+    этого запроса и города. Возвращает количество сохраненных вакансий.
+    """
+    chunks = {}
+    count = 0
+
+    def flush(area: tuple) -> int:
+        hh, sj = area
+        with ingest_context(search_query, {'hh': hh, 'sj': sj}):
+            return sink(chunks.pop(area), saver, chunk_size, upsert=True)
+
+    for *row, area in rows:
+        chunk = chunks.setdefault(area, [])
+        chunk.append(tuple(row))
+        if len(chunk) >= chunk_size:
+            count += flush(area)
+    for area in list(chunks):
+        count += flush(area)
+    return count
+
+
+def crawl_regions(search_query: str, saver: SaveWorker,
+                  platforms: list[str] = ('hh', 'sj'),
+                  shards: int = REGION_SHARDS, min_salary: int = None,
+                  criteria_list: list[str] = None) -> int:
+    """
+    Ищет вакансии во всех городах из areas.json: города делятся на части,
+    каждая часть загружается и нормализуется в отдельном процессе,
+    результаты объединяются слиянием с удалением повторов по ссылке
+    и сохраняются в хранилище с обновлением уже сохраненных вакансий.
+    Возвращает количество сохраненных вакансий.
+    """
+    parts = shard_areas(get_area_resolver().areas(), shards)
+    platforms = [platform.lower() for platform in platforms]
+
+    with ProcessPoolExecutor(max_workers=len(parts)) as executor:
+        runs = list(executor.map(
+            crawl_shard, [platforms] * len(parts),
+            [search_query] * len(parts), parts,
+            [min_salary] * len(parts), [criteria_list] * len(parts),
+            [len(parts)] * len(parts)
+        ))
+
+    with saver.batch():
+        return store_rows(merge_shards(runs), saver, search_query)
+
+
+def main() -> None:
+    """Точка входа режима поиска по всем регионам."""
+    parser = argparse.ArgumentParser(
+        description="Поиск вакансий во всех городах из areas.json."
+    )
+    parser.add_argument('query', help="поисковой запрос")
+    parser.add_argument('--platforms', nargs='+', default=['hh', 'sj'],
+                        help="платформы поиска")
+    parser.add_argument('--shards', type=int, default=REGION_SHARDS,
+                        help="количество процессов (частей городов)")
+    parser.add_argument('--min-salary', type=int, default=None,
+                        help="минимальная зарплата")
+    parser.add_argument('--keywords', nargs='*', default=None,
+                        help="ключевые слова для требований")
+    parser.add_argument('--output', default=PATH_FILE,
+                        help="файл для сохранения вакансий")
+    args = parser.parse_args()
+
+    saver = JSONSaver(args.output,
+                      analytics=SalaryAnalytics.for_store(args.output))
+    saver.load_data()
+    count = crawl_regions(args.query, saver, args.platforms, args.shards,
+                          args.min_salary, args.keywords)
+    print(f"Сохранено вакансий: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+from bisect import bisect_left, bisect_right
+from itertools import islice
+
+
+class SalaryIndex:
+    """
+    Отсортированный по зарплате индекс вакансий.
+    Запросы по диапазону зарплат выполняются бинарным поиском,
+    а лучшие N вакансий читаются с нужного конца индекса без сортировки.
+    """
+
+    def __init__(self) -> None:
+        """Создание пустого экземпляра класса SalaryIndex."""
+        # Параллельные списки: зарплаты по возрастанию и сами вакансии.
+        self.salaries = []
+        self.items = []
+
+    def __len__(self) -> int:
+        """Возвращает количество вакансий в индексе."""
+        return len(self.items)
+
+    def rebuild(self, items: list[dict]) -> None:
+        """Строит индекс заново по списку вакансий."""
+        ordered = sorted(items, key=lambda item: item['salary'])
+        self.salaries = [item['salary'] for item in ordered]
+        self.items = ordered
+
+    def add(self, items: list[dict]) -> None:
+        """
+        Добавляет вакансии в индекс.
+        Небольшие пачки вставляются бинарным поиском,
+        крупные - общей пересортировкой.
+        """
+        if len(items) > len(self.items) // 8:
+            self.rebuild(self.items + list(items))
+            return
+        for item in items:
+            salary = item['salary']
+            position = bisect_right(self.salaries, salary)
+            self.salaries.insert(position, salary)
+            self.items.insert(position, item)
+
+    def remove(self, item: dict) -> None:
+        """Удаляет вакансию из индекса."""
+        start = bisect_left(self.salaries, item['salary'])
+        stop = bisect_right(self.salaries, item['salary'])
+        for position in range(start, stop):
+            if self.items[position] is item:
+                del self.salaries[position]
+                del self.items[position]
+                return
+
+    def remove_many(self, items: list[dict]) -> None:
+        """Удаляет несколько вакансий из индекса за один проход."""
+        if len(items) < 8:
+            for item in items:
+                self.remove(item)
+            return
+        removed = {id(item) for item in items}
+        kept = [position for position, item in enumerate(self.items)
+                if id(item) not in removed]
+        self.salaries = [self.salaries[position] for position in kept]
+        self.items = [self.items[position] for position in kept]
+
+    def range(self, min_salary: int = None,
+              max_salary: int = None) -> list[dict]:
+        """
+        Возвращает вакансии с зарплатой от min_salary до max_salary
+        включительно в порядке возрастания зарплаты.
+        """
+        start = 0 if min_salary is None \
+            else bisect_left(self.salaries, min_salary)
+        stop = len(self.salaries) if max_salary is None \
+            else bisect_right(self.salaries, max_salary)
+        return self.items[start:stop]
+
+    def top(self, top_n: int, reverse: bool = False) -> list[dict]:
+        """
+        Возвращает top_n вакансий с наименьшей зарплатой,
+        или с наибольшей, если reverse=True.
+        """
+        if reverse:
+            return list(islice(reversed(self.items), top_n))
+        return self.items[:top_n]
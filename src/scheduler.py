@@ -0,0 +1,207 @@
+import heapq
+import random
+import threading
+import time
+from itertools import count
+from typing import Callable
+from settings import RATE_LIMITS, DEFAULT_RATE_LIMIT, RETRY_MAX, \
+    RETRY_BASE_DELAY, RETRY_MAX_DELAY
+from transport import transient_errors
+
+# Приоритеты запросов: чем меньше значение, тем раньше выполняется запрос.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+
+
+class TokenBucket:
+    """
+    Адаптивное ограничение частоты запросов к одной платформе.
+    Токены пополняются со скоростью rate в секунду; после ответа 429
+    скорость уменьшается вдвое, а после успешных ответов плавно
+    возвращается к исходной. Ожидающие запросы получают токены
+    в порядке приоритета.
+    """
+
+    def __init__(self, rate: float, capacity: float = None) -> None:
+        """
+        Создание экземпляра класса TokenBucket.
+
+        :param rate: Количество запросов в секунду.
+        :param capacity: Максимальный запас токенов (размер всплеска).
+        """
+        self.max_rate = rate
+        self.min_rate = rate / 20
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._waiters = []
+        self._sequence = count()
+        self._condition = threading.Condition()
+
+    def _refill(self, now: float) -> None:
+        """Пополняет запас токенов за прошедшее время."""
+        self.tokens = min(self.capacity,
+                          self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, priority: int = PRIORITY_INTERACTIVE) -> None:
+        """Ожидает свою очередь и свободный токен, затем забирает его."""
+        with self._condition:
+            ticket = (priority, next(self._sequence))
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    if self._waiters[0] != ticket:
+                        # Первым токен получит запрос с большим приоритетом.
+                        self._condition.wait()
+                        continue
+                    if now >= self.blocked_until and self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    self._condition.wait(max(self.blocked_until - now,
+                                             (1 - self.tokens) / self.rate))
+            finally:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+
+    def throttle(self, retry_after: float) -> None:
+        """
+        Уменьшает скорость вдвое и приостанавливает выдачу токенов
+        на retry_after секунд после ответа 429.
+        """
+        with self._condition:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = 0
+            self.blocked_until = max(self.blocked_until,
+                                     time.monotonic() + retry_after)
+            self._condition.notify_all()
+
+    def success(self) -> None:
+        """Плавно возвращает скорость к исходной после успешного ответа."""
+        with self._condition:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Возвращает задержку из заголовка Retry-After в секундах."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    # Дата в заголовке встречается редко, модуль email загружается
+    # только для ее разбора.
+    from email.utils import parsedate_to_datetime
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RequestScheduler:
+    """
+    Планировщик запросов ко всем платформам.
+    Для каждой платформы действует свое адаптивное ограничение частоты,
+    ответы 429 учитывают заголовок Retry-After, а ошибки 5xx и таймауты
+    повторяются с экспоненциальной задержкой со случайным разбросом.
+    """
+
+    def __init__(self, rate_limits: dict[str, float] = None,
+                 max_retries: int = RETRY_MAX,
+                 base_delay: float = RETRY_BASE_DELAY,
+                 max_delay: float = RETRY_MAX_DELAY) -> None:
+        """
+        Создание экземпляра класса RequestScheduler.
+
+        :param rate_limits: Запросов в секунду для каждой платформы.
+        :param max_retries: Максимальное количество повторов запроса.
+        :param base_delay: Начальная задержка перед повтором (секунды).
+        :param max_delay: Максимальная задержка перед повтором (секунды).
+        """
+        self.rate_limits = dict(RATE_LIMITS if rate_limits is None
+                                else rate_limits)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.buckets = {}
+        self.stats = {'requests': 0, 'retries': 0, 'throttled': 0}
+        self._lock = threading.Lock()
+
+    def bucket(self, platform: str) -> TokenBucket:
+        """Возвращает ограничение частоты для платформы."""
+        with self._lock:
+            if platform not in self.buckets:
+                self.buckets[platform] = TokenBucket(
+                    self.rate_limits.get(platform, DEFAULT_RATE_LIMIT)
+                )
+            return self.buckets[platform]
+
+    def backoff(self, attempt: int) -> float:
+        """Возвращает задержку перед повтором с разбросом от 50% до 150%."""
+        delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return delay * random.uniform(0.5, 1.5)
+
+    def _count(self, name: str) -> None:
+        """Увеличивает счетчик статистики."""
+        with self._lock:
+            self.stats[name] += 1
+
+    def request(self, platform: str, send: Callable,
+                priority: int = PRIORITY_INTERACTIVE):
+        """
+        Выполняет запрос send() с учетом ограничения частоты платформы
+        и повторяет его при временных ошибках.
+        Возвращает последний полученный ответ.
+        """
+        bucket = self.bucket(platform)
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            bucket.acquire(priority)
+            self._count('requests')
+            try:
+                response = send()
+            except transient_errors():
+                if last_attempt:
+                    raise
+                self._count('retries')
+                time.sleep(self.backoff(attempt))
+                continue
+
+            if response.status_code == 429:
+                # Платформа просит снизить частоту запросов.
+                self._count('throttled')
+                retry_after = parse_retry_after(
+                    response.headers.get('Retry-After')
+                )
+                bucket.throttle(retry_after if retry_after is not None
+                                else self.backoff(attempt))
+            elif response.status_code >= 500:
+                if not last_attempt:
+                    time.sleep(self.backoff(attempt))
+            else:
+                bucket.success()
+                return response
+
+            if last_attempt:
+                return response
+            self._count('retries')
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> RequestScheduler:
+    """Возвращает общий для всех платформ экземпляр RequestScheduler."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = RequestScheduler()
+    return _scheduler
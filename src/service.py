@@ -0,0 +1,338 @@
+import argparse
+from collections import OrderedDict
+import heapq
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import threading
+import time
+from urllib.parse import urlsplit, parse_qs
+from settings import PATH_FILE, SERVICE_HOST, SERVICE_PORT, \
+    SERVICE_POLL_INTERVAL, SERVICE_CACHE_SIZE, SERVICE_MAX_RESULTS
+from textindex import InvertedIndex, KeywordMatcher
+from salaryindex import SalaryIndex
+from codec import codec
+
+
+class VacancySnapshot:
+    """
+    Неизменяемый снимок вакансий, оптимизированный для чтения.
+    Индексы строятся один раз при загрузке, после этого снимок
+    только читается и может использоваться из многих потоков
+    без блокировок.
+    """
+
+    def __init__(self, data: list[dict], version: tuple = None) -> None:
+        """
+        Создание экземпляра класса VacancySnapshot.
+
+        :param data: Список словарей вакансий.
+        :param version: Признак версии файла (время изменения и размер).
+        """
+        self.data = data
+        self.version = version
+        self.loaded_at = time.time()
+        self.index = InvertedIndex()
+        for position, item in enumerate(data):
+            self.index.add(position, item['requirement'])
+        self.salary_index = SalaryIndex()
+        self.salary_index.rebuild(data)
+
+    @classmethod
+    def load(cls, filename) -> 'VacancySnapshot':
+        """Загружает снимок из JSON-файла хранилища."""
+        stat = os.stat(filename)
+        with open(filename, 'rb') as file:
+            data = codec.loads(file.read())
+        return cls(data, (stat.st_mtime_ns, stat.st_size))
+
+    def salary_range(self, min_salary: int = None, max_salary: int = None,
+                     limit: int = SERVICE_MAX_RESULTS) -> list[dict]:
+        """Вакансии с зарплатой в диапазоне в порядке ее возрастания."""
+        return self.salary_index.range(min_salary, max_salary)[:limit]
+
+    def search(self, keywords: list[str], whole_words: bool = False,
+               limit: int = SERVICE_MAX_RESULTS) -> list[dict]:
+        """
+        Вакансии, в требованиях которых есть все слова keywords,
+        в порядке убывания зарплаты.
+        """
+        positions = self.index.search(keywords, whole_words)
+        return heapq.nlargest(limit, (self.data[position]
+                                      for position in positions),
+                              key=lambda item: item['salary'])
+
+    def top(self, top_n: int, reverse: bool = True) -> list[dict]:
+        """Лучшие top_n вакансий по зарплате."""
+        return self.salary_index.top(top_n, reverse)
+
+
+class ResponseLRU:
+    """
+    Кэш готовых ответов на частые запросы.
+    Ключ включает версию снимка, поэтому после замены снимка
+    старые ответы больше не выдаются.
+    """
+
+    def __init__(self, maxsize: int = SERVICE_CACHE_SIZE) -> None:
+        """
+        Создание экземпляра класса ResponseLRU.
+
+        :param maxsize: Максимальное количество ответов в кэше.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> bytes | None:
+        """Возвращает ответ из кэша или None."""
+        with self._lock:
+            body = self._items.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key, body: bytes) -> None:
+        """Сохраняет ответ, вытесняя давно не запрашиваемые."""
+        with self._lock:
+            self._items[key] = body
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        """Очищает кэш."""
+        with self._lock:
+            self._items.clear()
+
+
+class SnapshotStore:
+    """
+    Текущий снимок хранилища. Фоновый поток следит за файлом
+    и при его изменении загружает новый снимок, затем заменяет
+    ссылку на него одним присваиванием: запросы, которые уже
+    выполняются, дочитывают старый снимок, новые получают новый.
+    """
+
+    def __init__(self, filename, poll_interval: float = SERVICE_POLL_INTERVAL,
+                 cache: ResponseLRU = None) -> None:
+        """
+        Создание экземпляра класса SnapshotStore.
+
+        :param filename: JSON-файл хранилища (как у JSONSaver).
+        :param poll_interval: Интервал проверки файла (секунды).
+        :param cache: Кэш ответов, очищается при замене снимка.
+        """
+        self.filename = filename
+        self.poll_interval = poll_interval
+        self.cache = cache
+        self.snapshot = VacancySnapshot([])
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _version(self) -> tuple | None:
+        """Возвращает время изменения и размер файла или None."""
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def refresh(self) -> bool:
+        """
+        Загружает новый снимок, если файл изменился.
+        Возвращает True, если снимок был заменен.
+        JSONSaver записывает файл атомарно, поэтому он всегда
+        читается целиком; при ошибке чтения остается старый снимок.
+        """
+        version = self._version()
+        if version is None or version == self.snapshot.version:
+            return False
+        try:
+            snapshot = VacancySnapshot.load(self.filename)
+        except (OSError, codec.DecodeError, KeyError, TypeError):
+            return False
+        self.snapshot = snapshot
+        if self.cache is not None:
+            self.cache.clear()
+        return True
+
+    def _watch(self) -> None:
+        """Проверяет файл через каждые poll_interval секунд."""
+        while not self._stop.wait(self.poll_interval):
+            self.refresh()
+
+    def start(self) -> None:
+        """Загружает первый снимок и запускает фоновую проверку файла."""
+        self.refresh()
+        self._thread = threading.Thread(target=self._watch, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Останавливает фоновую проверку файла."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    """
+    Обработчик запросов к службе вакансий.
+
+    GET /salary?min=100000&max=200000&limit=50 - вакансии по диапазону
+    зарплаты,
+    GET /search?q=python+django&words=0&limit=50 - вакансии по словам
+    в требованиях (words=1 - только отдельные слова),
+    GET /top?n=10&order=desc - лучшие вакансии по зарплате,
+    GET /health - размер и время загрузки снимка, статистика кэша.
+    Параметры limit и n должны быть больше нуля.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        """Выполняет запрос и возвращает ответ JSON."""
+        parts = urlsplit(self.path)
+        store = self.server.store
+        cache = self.server.cache
+        snapshot = store.snapshot
+
+        if parts.path == '/health':
+            self._send(200, self._encode({
+                'vacancies': len(snapshot.data),
+                'loaded_at': snapshot.loaded_at,
+                'cache_hits': cache.hits,
+                'cache_misses': cache.misses,
+            }))
+            return
+
+        # Ответы на одинаковые запросы к одному снимку одинаковы,
+        # поэтому готовое тело ответа берется из кэша.
+        key = (snapshot.version, parts.path, parts.query)
+        body = cache.get(key)
+        if body is None:
+            try:
+                result = self._query(snapshot, parts.path,
+                                     parse_qs(parts.query))
+            except ValueError as error:
+                self._send(400, self._encode({'error': str(error)}))
+                return
+            if result is None:
+                self._send(404, self._encode({'error': 'Not found'}))
+                return
+            body = self._encode({'count': len(result), 'items': result})
+            cache.put(key, body)
+        self._send(200, body)
+
+    @staticmethod
+    def _query(snapshot: VacancySnapshot, path: str,
+               params: dict) -> list[dict] | None:
+        """
+        Выполняет запрос к снимку. Возвращает None для неизвестного
+        адреса и выбрасывает ValueError при неверных параметрах.
+        """
+        def number(name: str, default=None):
+            value = params.get(name, [None])[0]
+            return default if value in (None, '') else int(value)
+
+        def count(name: str, default: int) -> int:
+            """Количество результатов: от 1 до SERVICE_MAX_RESULTS."""
+            value = number(name, default)
+            if value < 1:
+                raise ValueError(f"Параметр {name} должен быть больше нуля.")
+            return min(value, SERVICE_MAX_RESULTS)
+
+        limit = count('limit', SERVICE_MAX_RESULTS)
+        if path == '/salary':
+            return snapshot.salary_range(number('min'), number('max'), limit)
+        if path == '/search':
+            keywords = ' '.join(params.get('q', [])).lower().split()
+            if not KeywordMatcher(keywords):
+                raise ValueError("Не заданы ключевые слова (параметр q).")
+            whole_words = params.get('words', ['0'])[0] == '1'
+            return snapshot.search(keywords, whole_words, limit)
+        if path == '/top':
+            reverse = params.get('order', ['desc'])[0] != 'asc'
+            return snapshot.top(count('n', 10), reverse)
+        return None
+
+    @staticmethod
+    def _encode(payload: dict) -> bytes:
+        """Кодирует ответ в компактный JSON."""
+        return codec.dumps(payload)
+
+    def _send(self, status: int, body: bytes) -> None:
+        """Отправляет ответ с телом body."""
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        """Не выводит журнал каждого запроса."""
+
+
+class VacancyServer(ThreadingHTTPServer):
+    """
+    Многопоточный HTTP-сервер запросов к вакансиям только для чтения.
+    Каждый запрос обрабатывается в своем потоке и читает текущий
+    снимок, поэтому файл не перечитывается при каждом запросе.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, filename, host: str = SERVICE_HOST,
+                 port: int = SERVICE_PORT,
+                 poll_interval: float = SERVICE_POLL_INTERVAL,
+                 cache_size: int = SERVICE_CACHE_SIZE) -> None:
+        """
+        Создание экземпляра класса VacancyServer.
+
+        :param filename: JSON-файл хранилища.
+        :param host: Адрес сервера.
+        :param port: Порт сервера (0 - любой свободный).
+        :param poll_interval: Интервал проверки изменения файла (секунды).
+        :param cache_size: Количество готовых ответов в кэше.
+        """
+        super().__init__((host, port), QueryHandler)
+        self.cache = ResponseLRU(cache_size)
+        self.store = SnapshotStore(filename, poll_interval, self.cache)
+        self.store.start()
+
+    def server_close(self) -> None:
+        """Останавливает проверку файла и закрывает сокет."""
+        self.store.stop()
+        super().server_close()
+
+
+def main() -> None:
+    """Точка входа службы запросов к вакансиям."""
+    parser = argparse.ArgumentParser(
+        description="HTTP-служба запросов к сохраненным вакансиям."
+    )
+    parser.add_argument('--file', default=PATH_FILE,
+                        help="JSON-файл с вакансиями")
+    parser.add_argument('--host', default=SERVICE_HOST)
+    parser.add_argument('--port', type=int, default=SERVICE_PORT)
+    parser.add_argument('--poll', type=float, default=SERVICE_POLL_INTERVAL,
+                        help="интервал проверки изменения файла (секунды)")
+    args = parser.parse_args()
+
+    server = VacancyServer(args.file, args.host, args.port, args.poll)
+    host, port = server.server_address[:2]
+    print(f"Служба запущена: http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+from datetime import datetime, timezone
+from functools import lru_cache
+import math
+import os
+from typing import TYPE_CHECKING, Iterator
+from settings import MAX_PAGES, MAX_WORKERS
+from transport import HTTPTransport, get_transport
+from scheduler import RequestScheduler, get_scheduler, \
+    PRIORITY_INTERACTIVE
+from pageapi import PageAPI
+from platforms import platforms
+
+if TYPE_CHECKING:
+    from cache import ResponseCache
+
+
+@lru_cache(maxsize=None)
+def load_credentials() -> None:
+    """
+    Загружает ключи API из файла .env при первом обращении
+    к платформе, которой они нужны.
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+@platforms.register('sj')
+class SuperJobAPI(PageAPI):
+    """
+    Класс, наследующийся от абстрактного класса,
+    для работы с платформой SuperJob.
+    """
+
+    platform = 'sj'
+    items_key = 'objects'
+    per_page = 100
+    page_fields = {
+        'total': None,
+        'objects': [{'profession': None, 'link': None,
+                     'payment_from': None, 'payment_to': None,
+                     'candidat': None, 'date_published': None}],
+    }
+
+    def __init__(self, max_pages: int = MAX_PAGES,
+                 max_workers: int = MAX_WORKERS,
+                 transport: HTTPTransport = None,
+                 cache: 'ResponseCache' = None,
+                 scheduler: RequestScheduler = None,
+                 priority: int = PRIORITY_INTERACTIVE) -> None:
+        """
+        Создание экземпляра класса SuperJobAPI.
+        Устанавливает базовый URL для работы с API SuperJob.
+
+        :param max_pages: Максимальное количество страниц поиска.
+        :param max_workers: Количество потоков для загрузки страниц.
+        :param transport: HTTP-транспорт, по умолчанию общий для всех платформ.
+        :param cache: Кэш ответов API, по умолчанию общий для всех платформ.
+        :param scheduler: Планировщик запросов, по умолчанию общий.
+        :param priority: Приоритет запросов (интерактивный или фоновый).
+        """
+        self.url = "https://api.superjob.ru"
+        self.max_pages = max_pages
+        self.max_workers = max_workers
+        self.transport = transport or get_transport()
+        if cache is None:
+            from cache import get_cache
+            cache = get_cache()
+        self.cache = cache
+        self.scheduler = scheduler or get_scheduler()
+        self.priority = priority
+
+    def get_page(self, search_query: str, search_area: int,
+                 page: int, since: datetime = None) -> dict:
+        """
+        Запрашивает одну страницу поиска вакансий.
+
+        Параметры запроса:
+        'keyword' - поисковой запрос,
+        'page' - номер страницы поиска,
+        'count' - количество элементов (вакансий),
+        'town' - регион поиска (город),
+        'date_published_from' - дата публикации (unixtime), начиная
+        с которой ищутся вакансии,
+        'order_field', 'order_direction' - сортировка: при обновлении
+        сначала самые новые вакансии.
+        """
+        url = f"{self.url}/2.0/vacancies/"
+        params = {
+            "keyword": search_query,
+            "page": page,
+            "count": self.per_page,
+            "town": search_area
+        }
+        if since is not None:
+            params["date_published_from"] = int(since.timestamp())
+            params["order_field"] = "date"
+            params["order_direction"] = "desc"
+        load_credentials()
+        headers = {'X-Api-App-Id': os.getenv("SJ_SECURE_CODE")}
+
+        # При обновлении новые вакансии могли появиться и в пределах
+        # времени жизни кэша, поэтому ответ проверяется повторно.
+        return self.get_json(url, params, headers,
+                             revalidate=since is not None)
+
+    @staticmethod
+    def published(vacancy: dict) -> datetime | None:
+        """Возвращает дату публикации вакансии."""
+        if not vacancy.get('date_published'):
+            return None
+        return datetime.fromtimestamp(vacancy['date_published'],
+                                      tz=timezone.utc)
+
+    def page_count(self, response: dict) -> int:
+        """
+        Возвращает количество страниц поиска,
+        рассчитанное по общему количеству вакансий из ответа API.
+        """
+        return math.ceil(response.get('total', 0) / self.per_page)
+
+    @staticmethod
+    def organize_rows(data_vacancy) -> Iterator[tuple]:
+        """
+        Организация данных по вакансиям.
+        Поочередно возвращает кортежи (title, link, salary, requirement).
+        """
+        for vacancy in data_vacancy:
+            title = vacancy['profession']
+            link = vacancy['link']
+            salary_from = vacancy.get('payment_from', None)
+            salary_to = vacancy.get('payment_to', None)
+            requirement = vacancy.get('candidat', None)
+
+            # Устанавливаем значение зарплаты.
+            # Если есть обе границы - устанавливаем минимальное значение.
+            # В ином случае, устанавливаем то значение, которое существует.
+            if salary_from and salary_to:
+                salary = min(salary_from, salary_to)
+            else:
+                salary = salary_from or salary_to
+
+            # Устанавливаем значение требований.
+            # Если значение есть - приводим его к нижнему регистру.
+            # В ином случае, устанавливаем значение, что данных нет.
+            if requirement:
+                requirement = requirement.lower()
+            else:
+                requirement = 'Нет данных.'
+
+            # Проводим проверку, чтобы добавлялись лишь те вакансии, у которых
+            # значение зарплаты больше 1000.
+            # Возвращаем сформированные данные.
+            if salary > 1000:
+                yield title, link, salary, requirement
@@ -0,0 +1,222 @@
+from contextlib import contextmanager
+import sqlite3
+from jsonsaver import SaveWorker
+from vacancybatch import VacancyBatch
+from textindex import KeywordMatcher, EXACT, PREFIX
+
+
+class SQLiteSaver(SaveWorker):
+    """
+    Класс для сохранения информации о вакансиях в базу данных SQLite.
+    Зарплата и ссылка проиндексированы, требования ищутся
+    через полнотекстовый индекс FTS5, поэтому фильтрация
+    не требует полного перебора вакансий.
+    """
+
+    def __init__(self, filename) -> None:
+        """
+        Создание экземпляра класса SQLiteSaver.
+
+        :param filename: Файл базы данных с вакансиями.
+        """
+        self.filename = filename
+        self._batch_depth = 0
+        self.connection = sqlite3.connect(filename)
+        self.connection.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS vacancies (
+                id INTEGER PRIMARY KEY,
+                title TEXT NOT NULL,
+                link TEXT NOT NULL UNIQUE,
+                salary INTEGER NOT NULL,
+                requirement TEXT
+            );
+            CREATE INDEX IF NOT EXISTS vacancies_salary
+                ON vacancies (salary);
+            CREATE VIRTUAL TABLE IF NOT EXISTS vacancies_fts USING fts5(
+                requirement, content='vacancies', content_rowid='id'
+            );
+            CREATE TRIGGER IF NOT EXISTS vacancies_ai AFTER INSERT
+            ON vacancies BEGIN
+                INSERT INTO vacancies_fts (rowid, requirement)
+                VALUES (new.id, new.requirement);
+            END;
+            CREATE TRIGGER IF NOT EXISTS vacancies_ad AFTER DELETE
+            ON vacancies BEGIN
+                INSERT INTO vacancies_fts (vacancies_fts, rowid, requirement)
+                VALUES ('delete', old.id, old.requirement);
+            END;
+            CREATE TRIGGER IF NOT EXISTS vacancies_au AFTER UPDATE
+            ON vacancies BEGIN
+                INSERT INTO vacancies_fts (vacancies_fts, rowid, requirement)
+                VALUES ('delete', old.id, old.requirement);
+                INSERT INTO vacancies_fts (rowid, requirement)
+                VALUES (new.id, new.requirement);
+            END;
+        """)
+
+    @property
+    def data(self) -> list[dict]:
+        """Возвращает список словарей со всеми вакансиями из базы."""
+        rows = self.connection.execute(
+            "SELECT title, link, salary, requirement FROM vacancies "
+            "ORDER BY id"
+        )
+        return [{'title': title, 'link': link, 'salary': salary,
+                 'requirement': requirement}
+                for title, link, salary, requirement in rows]
+
+    def load_data(self) -> None:
+        """Данные читаются из базы по запросу, загрузка не требуется."""
+        pass
+
+    def save_data(self) -> None:
+        """
+        Фиксирует изменения в базе.
+        Внутри пакетного режима фиксация откладывается до выхода из batch().
+        """
+        if not self._batch_depth:
+            self.connection.commit()
+
+    def flush(self) -> None:
+        """Фиксирует изменения, накопленные в пакетном режиме."""
+        self.connection.commit()
+
+    @contextmanager
+    def batch(self):
+        """
+        Контекстный менеджер пакетного режима: все изменения
+        выполняются в одной транзакции.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if self._batch_depth == 1:
+                self.connection.rollback()
+            raise
+        finally:
+            self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()
+
+    def add_vacancy(self, vacancies: list | VacancyBatch) -> None:
+        """
+        Добавляет вакансии в базу одним пакетным запросом.
+        Принимает список экземпляров Vacancy или VacancyBatch.
+        Вакансия с уже существующей ссылкой обновляется.
+        """
+        if isinstance(vacancies, VacancyBatch):
+            rows = vacancies.rows()
+        else:
+            rows = ((vacancy.title, vacancy.link, vacancy.salary,
+                     vacancy.requirement) for vacancy in vacancies)
+        self.connection.executemany(
+            "INSERT INTO vacancies (title, link, salary, requirement) "
+            "VALUES (?, ?, ?, ?) ON CONFLICT (link) DO UPDATE SET "
+            "title = excluded.title, salary = excluded.salary, "
+            "requirement = excluded.requirement", rows
+        )
+        self.save_data()
+
+    def upsert_vacancy(self, vacancies: list | VacancyBatch) -> None:
+        """
+        Добавляет новые вакансии и обновляет уже сохраненные
+        с той же ссылкой (add_vacancy уже работает как upsert).
+        """
+        self.add_vacancy(vacancies)
+
+    def get_requirement(self, criteria_list: list[str],
+                        whole_words: bool = False) -> None:
+        """
+        Получает список со словами, фильтрует по ним критерий требований,
+        сохраняет полученные вакансии в базу.
+        Правила совпадения - как у KeywordMatcher. Полнотекстовый индекс
+        отбирает кандидатов по словам, которые обязательно есть
+        в требованиях, затем каждый кандидат проверяется по тексту.
+        """
+        matcher = KeywordMatcher(criteria_list, whole_words)
+        if not matcher:
+            return
+        # Слова индекса экранируются; слова, которые могут быть концом
+        # или частью слова текста, индекс FTS5 искать не умеет.
+        terms = ['"{}"{}'.format(token.replace('"', '""'),
+                                 '*' if kind == PREFIX else '')
+                 for keyword in matcher.keywords
+                 for token, kind in matcher.terms(keyword)
+                 if kind in (EXACT, PREFIX)]
+        if terms:
+            self.connection.execute(
+                "DELETE FROM vacancies WHERE id NOT IN ("
+                "SELECT rowid FROM vacancies_fts WHERE vacancies_fts MATCH ?)",
+                (' AND '.join(terms),)
+            )
+        self.connection.create_function('requirement_matches', 1,
+                                        matcher.matches, deterministic=True)
+        self.connection.execute(
+            "DELETE FROM vacancies WHERE NOT requirement_matches(requirement)"
+        )
+        self.save_data()
+
+    def get_salary(self, salary: int, max_salary: int = None) -> None:
+        """
+        Получает значение зарплаты, фильтрует по нему критерий зарплаты,
+        сохраняет полученные вакансии в базу.
+
+        :param salary: Минимальная зарплата.
+        :param max_salary: Максимальная зарплата (необязательно).
+        """
+        self.connection.execute(
+            "DELETE FROM vacancies "
+            "WHERE salary < ? OR salary > COALESCE(?, salary)",
+            (salary, max_salary)
+        )
+        self.save_data()
+
+    def salary_range(self, min_salary: int = None,
+                     max_salary: int = None) -> list[dict]:
+        """
+        Возвращает вакансии с зарплатой в указанном диапазоне
+        в порядке возрастания зарплаты, не изменяя данные.
+        """
+        rows = self.connection.execute(
+            "SELECT title, link, salary, requirement FROM vacancies "
+            "WHERE salary >= COALESCE(?, salary) "
+            "AND salary <= COALESCE(?, salary) ORDER BY salary",
+            (min_salary, max_salary)
+        )
+        return [{'title': title, 'link': link, 'salary': salary,
+                 'requirement': requirement}
+                for title, link, salary, requirement in rows]
+
+    def top_salaries(self, top_n: int, reverse: bool = True) -> list[dict]:
+        """
+        Возвращает top_n вакансий с наибольшей зарплатой
+        (или наименьшей, если reverse=False) по индексу зарплат.
+        """
+        order = 'DESC' if reverse else 'ASC'
+        rows = self.connection.execute(
+            "SELECT title, link, salary, requirement FROM vacancies "
+            f"ORDER BY salary {order} LIMIT ?", (top_n,)
+        )
+        return [{'title': title, 'link': link, 'salary': salary,
+                 'requirement': requirement}
+                for title, link, salary, requirement in rows]
+
+    def delete_vacancy(self, vacancy_link: str) -> None:
+        """Удаляет вакансию из базы."""
+        self.connection.execute("DELETE FROM vacancies WHERE link = ?",
+                                (vacancy_link,))
+        self.save_data()
+
+    def delete_vacancies(self, vacancy_links: list[str]) -> None:
+        """Удаляет из базы все вакансии с указанными ссылками."""
+        self.connection.executemany("DELETE FROM vacancies WHERE link = ?",
+                                    ((link,) for link in vacancy_links))
+        self.save_data()
+
+    def close(self) -> None:
+        """Фиксирует изменения и закрывает соединение с базой."""
+        self.connection.commit()
+        self.connection.close()
@@ -0,0 +1,230 @@
+from bisect import bisect_left, insort
+import re
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# Виды слов индекса, которые следуют из ключевого слова: слово текста
+# совпадает с частью ключевого слова, начинается с нее, заканчивается ею
+# или содержит ее.
+EXACT, PREFIX, SUFFIX, INFIX = 'exact', 'prefix', 'suffix', 'infix'
+
+
+class KeywordMatcher:
+    """
+    Проверка требований на ключевые слова, общая для всех хранилищ,
+    конвейера и службы запросов.
+    По умолчанию ключевое слово ищется в тексте как подстрока, как
+    в исходной фильтрации ('python' находится и в 'cpython'),
+    в режиме whole_words - только как отдельное слово или фраза.
+    Регистр не учитывается, знаки ключевого слова сохраняются
+    ('c++' не совпадает с 'css'). Ключевые слова без букв и цифр
+    (например, '+') выборку не ограничивают.
+    """
+
+    def __init__(self, criteria_list: list[str],
+                 whole_words: bool = False) -> None:
+        """
+        Создание экземпляра класса KeywordMatcher.
+
+        :param criteria_list: Ключевые слова.
+        :param whole_words: Искать ключевые слова как отдельные слова.
+        """
+        self.whole_words = whole_words
+        self.keywords = list(dict.fromkeys(
+            keyword for keyword in (criteria.strip().lower()
+                                    for criteria in criteria_list)
+            if TOKEN_PATTERN.search(keyword)
+        ))
+        self._patterns = {keyword: self._pattern(keyword)
+                          for keyword in self.keywords} \
+            if whole_words else {}
+
+    def __bool__(self) -> bool:
+        """Истинно, если ключевые слова ограничивают выборку."""
+        return bool(self.keywords)
+
+    @staticmethod
+    def _is_word(char: str) -> bool:
+        """Проверяет, является ли символ буквой, цифрой или '_'."""
+        return TOKEN_PATTERN.match(char) is not None
+
+    def _pattern(self, keyword: str) -> re.Pattern:
+        """
+        Регулярное выражение для ключевого слова как отдельного слова:
+        до и после него не должно быть букв и цифр, если оно само
+        начинается или заканчивается буквой или цифрой.
+        """
+        pattern = re.escape(keyword)
+        if self._is_word(keyword[0]):
+            pattern = r'(?<!\w)' + pattern
+        if self._is_word(keyword[-1]):
+            pattern += r'(?!\w)'
+        return re.compile(pattern)
+
+    def match_keyword(self, keyword: str, text: str | None) -> bool:
+        """Проверяет, есть ли в тексте одно ключевое слово."""
+        if not text:
+            return False
+        text = text.lower()
+        if self.whole_words:
+            return self._patterns[keyword].search(text) is not None
+        return keyword in text
+
+    def matches(self, text: str | None) -> bool:
+        """Проверяет, есть ли в тексте все ключевые слова."""
+        if not self.keywords:
+            return True
+        if not text:
+            return False
+        return all(self.match_keyword(keyword, text)
+                   for keyword in self.keywords)
+
+    def terms(self, keyword: str) -> list[tuple[str, str]]:
+        """
+        Возвращает слова индекса, которые обязательно есть в тексте
+        с ключевым словом, и вид совпадения каждого из них.
+        В режиме подстроки первая часть ключевого слова может быть
+        концом слова текста, последняя - началом, а единственная -
+        любой его частью.
+        """
+        parts = InvertedIndex.tokenize(keyword)
+        if self.whole_words:
+            return [(part, EXACT) for part in parts]
+        starts_word = self._is_word(keyword[0])
+        ends_word = self._is_word(keyword[-1])
+        terms = []
+        for number, part in enumerate(parts):
+            first = number == 0 and starts_word
+            last = number == len(parts) - 1 and ends_word
+            if first and last:
+                terms.append((part, INFIX))
+            elif first:
+                terms.append((part, SUFFIX))
+            elif last:
+                terms.append((part, PREFIX))
+            else:
+                terms.append((part, EXACT))
+        return terms
+
+    def needs_check(self, keyword: str) -> bool:
+        """
+        Истинно, если слов индекса недостаточно и текст нужно проверить:
+        ключевое слово содержит знаки или состоит из нескольких слов.
+        """
+        return InvertedIndex.tokenize(keyword) != [keyword]
+
+
+class InvertedIndex:
+    """
+    Инвертированный индекс по словам текста требований.
+    Для каждого слова хранится множество идентификаторов записей,
+    поэтому фильтр по нескольким словам сводится к пересечению множеств.
+    """
+
+    def __init__(self) -> None:
+        """Создание пустого экземпляра класса InvertedIndex."""
+        self.postings = {}
+        # Слова каждой записи, чтобы не разбирать текст повторно при удалении.
+        self.documents = {}
+        # Тексты записей для проверки ключевых слов со знаками.
+        self.texts = {}
+        # Отсортированный словарь слов для поиска по префиксу.
+        self.vocabulary = []
+
+    @staticmethod
+    def tokenize(text: str) -> list[str]:
+        """Разбивает текст на слова в нижнем регистре."""
+        return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+    def add(self, doc_id: int, text: str) -> None:
+        """Добавляет запись с указанным текстом в индекс."""
+        tokens = frozenset(self.tokenize(text))
+        self.documents[doc_id] = tokens
+        self.texts[doc_id] = text
+        for token in tokens:
+            posting = self.postings.get(token)
+            if posting is None:
+                posting = self.postings[token] = set()
+                insort(self.vocabulary, token)
+            posting.add(doc_id)
+
+    def remove(self, doc_id: int) -> None:
+        """Удаляет запись из индекса."""
+        self.texts.pop(doc_id, None)
+        for token in self.documents.pop(doc_id, ()):
+            posting = self.postings[token]
+            posting.discard(doc_id)
+            if not posting:
+                del self.postings[token]
+                index = bisect_left(self.vocabulary, token)
+                del self.vocabulary[index]
+
+    def clear(self) -> None:
+        """Очищает индекс."""
+        self.postings.clear()
+        self.documents.clear()
+        self.texts.clear()
+        self.vocabulary.clear()
+
+    def _prefix_posting(self, prefix: str) -> set:
+        """Объединяет множества записей всех слов, начинающихся с prefix."""
+        result = set()
+        index = bisect_left(self.vocabulary, prefix)
+        while index < len(self.vocabulary) and \
+                self.vocabulary[index].startswith(prefix):
+            result |= self.postings[self.vocabulary[index]]
+            index += 1
+        return result
+
+    def _posting(self, token: str, kind: str) -> set:
+        """Возвращает множество записей со словом token вида kind."""
+        if kind == EXACT:
+            return self.postings.get(token, set())
+        if kind == PREFIX:
+            return self._prefix_posting(token)
+        # Конец или часть слова ищется перебором словаря,
+        # который намного меньше самих текстов.
+        if kind == SUFFIX:
+            words = (word for word in self.vocabulary if word.endswith(token))
+        else:
+            words = (word for word in self.vocabulary if token in word)
+        result = set()
+        for word in words:
+            result |= self.postings[word]
+        return result
+
+    def search(self, criteria_list: list[str],
+               whole_words: bool = False) -> set:
+        """
+        Возвращает идентификаторы записей, содержащих все ключевые слова
+        (см. KeywordMatcher). Если ключевые слова не ограничивают выборку,
+        возвращает все записи.
+
+        :param criteria_list: Ключевые слова для поиска.
+        :param whole_words: Искать ключевые слова как отдельные слова.
+        """
+        matcher = KeywordMatcher(criteria_list, whole_words)
+        if not matcher:
+            return set(self.documents)
+
+        postings = [self._posting(token, kind)
+                    for keyword in matcher.keywords
+                    for token, kind in matcher.terms(keyword)]
+
+        # Пересекаем множества начиная с самого маленького.
+        postings.sort(key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            if not result:
+                break
+            result &= posting
+
+        # Ключевые слова со знаками проверяются по тексту кандидатов.
+        checked = [keyword for keyword in matcher.keywords
+                   if matcher.needs_check(keyword)]
+        if checked:
+            result = {doc_id for doc_id in result
+                      if all(matcher.match_keyword(keyword,
+                                                   self.texts[doc_id])
+                             for keyword in checked)}
+        return result
@@ -0,0 +1,110 @@
+import threading
+from urllib.parse import urlsplit
+from settings import HTTP_POOL_MAXSIZE, HTTP_CONNECT_TIMEOUT, \
+    HTTP_READ_TIMEOUT
+
+
+def transient_errors() -> tuple:
+    """
+    Возвращает ошибки соединения, после которых запрос можно повторить.
+    Библиотека requests импортируется при первом обращении,
+    а не при запуске программы.
+    """
+    import requests
+    return requests.Timeout, requests.ConnectionError
+
+
+class HTTPTransport:
+    """
+    Общий HTTP-транспорт для клиентов PageAPI.
+    Для каждого хоста создается постоянная сессия со своим пулом
+    соединений, поэтому соединения переиспользуются между страницами,
+    поисковыми запросами и потоками.
+    """
+
+    def __init__(self, pool_maxsize: int = HTTP_POOL_MAXSIZE,
+                 connect_timeout: float = HTTP_CONNECT_TIMEOUT,
+                 read_timeout: float = HTTP_READ_TIMEOUT) -> None:
+        """
+        Создание экземпляра класса HTTPTransport.
+
+        :param pool_maxsize: Максимальное количество соединений с хостом.
+        :param connect_timeout: Таймаут установки соединения (секунды).
+        :param read_timeout: Таймаут чтения ответа (секунды).
+        """
+        self.pool_maxsize = pool_maxsize
+        self.timeout = (connect_timeout, read_timeout)
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def _session(self, url: str) -> 'requests.Session':
+        """Возвращает сессию хоста из url, создавая ее при первом вызове."""
+        host = urlsplit(url).netloc
+        session = self._sessions.get(host)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(host)
+                if session is None:
+                    # requests загружается только перед первым запросом.
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1,
+                                          pool_maxsize=self.pool_maxsize)
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    session.headers.update({
+                        'Accept-Encoding': 'gzip, deflate',
+                        'Connection': 'keep-alive'
+                    })
+                    self._sessions[host] = session
+        return session
+
+    def get(self, url: str, params: dict = None,
+            headers: dict = None) -> 'requests.Response':
+        """Выполняет GET-запрос через постоянную сессию хоста."""
+        return self._session(url).get(url, params=params, headers=headers,
+                                      timeout=self.timeout)
+
+    def stats(self) -> dict:
+        """
+        Возвращает счетчики выполненных запросов,
+        открытых и переиспользованных соединений.
+        """
+        requests_count = 0
+        opened = 0
+        for session in list(self._sessions.values()):
+            adapter = session.get_adapter('https://')
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is not None:
+                    requests_count += pool.num_requests
+                    opened += pool.num_connections
+
+        return {
+            'requests': requests_count,
+            'connections_opened': opened,
+            'connections_reused': requests_count - opened
+        }
+
+    def close(self) -> None:
+        """Закрывает все сессии и их соединения."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> HTTPTransport:
+    """Возвращает общий для всех платформ экземпляр HTTPTransport."""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = HTTPTransport()
+    return _transport
@@ -5,6 +5,8 @@ class Vacancy:
     валидацию данных, которыми инициализируются его атрибуты.
     """
 
+    __slots__ = ('_title', '_link', '_salary', '_requirement')
+
     def __init__(self, title: str, link: str, salary: int,
                  requirement: str) -> None:
         """
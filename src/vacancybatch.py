@@ -0,0 +1,155 @@
+from array import array
+import sys
+from typing import Iterable, Iterator
+from vacancy import Vacancy
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class VacancyBatch:
+    """
+    Колоночный контейнер для пачки вакансий.
+    Зарплаты хранятся в типизированном массиве, названия и ссылки -
+    в интернированных строковых столбцах, требования - в обычном
+    списке: длинные тексты требований почти не повторяются,
+    и интернирование только заполняло бы таблицу строк.
+    Проверка данных, маски по зарплате и сортировка выполняются
+    сразу над столбцами; при наличии NumPy - векторно.
+    """
+
+    __slots__ = ('titles', 'links', 'salaries', 'requirements')
+
+    def __init__(self, titles: list[str] = None, links: list[str] = None,
+                 salaries: Iterable[int] = (),
+                 requirements: list[str] = None) -> None:
+        """
+        Создание экземпляра класса VacancyBatch.
+
+        :param titles: Столбец названий вакансий.
+        :param links: Столбец ссылок на вакансии.
+        :param salaries: Столбец значений зарплаты.
+        :param requirements: Столбец описаний требований.
+        """
+        self.titles = titles if titles is not None else []
+        self.links = links if links is not None else []
+        self.salaries = array('q', salaries)
+        self.requirements = requirements if requirements is not None else []
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple]) -> 'VacancyBatch':
+        """
+        Создает пачку из кортежей (title, link, salary, requirement)
+        и проверяет все столбцы разом.
+        """
+        columns = list(zip(*rows))
+        if not columns:
+            return cls()
+        titles, links, salaries, requirements = columns
+        cls.validate(titles, links, salaries, requirements)
+
+        intern = sys.intern
+        return cls([intern(title) for title in titles],
+                   [intern(link) for link in links],
+                   salaries,
+                   list(requirements))
+
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict]) -> 'VacancyBatch':
+        """Создает пачку из словарей с данными о вакансиях."""
+        return cls.from_rows((item['title'], item['link'], item['salary'],
+                              item['requirement']) for item in items)
+
+    @staticmethod
+    def validate(titles, links, salaries, requirements) -> None:
+        """
+        Проверяет столбцы по тем же правилам, что и Vacancy,
+        и выбрасывает ValueError при первом нарушении.
+        """
+        if not all(isinstance(title, str) for title in titles):
+            raise ValueError("Название должно быть строкой.")
+        if not all(isinstance(link, str) for link in links):
+            raise ValueError("Ссылка должна быть строкой.")
+        if not all(isinstance(salary, int) for salary in salaries) or \
+                (salaries and min(salaries) < 0):
+            raise ValueError("Зарплата должна быть числом.")
+        if not all(isinstance(requirement, str)
+                   for requirement in requirements):
+            raise ValueError("Требования должны быть строкой")
+
+    def __len__(self) -> int:
+        """Возвращает количество вакансий в пачке."""
+        return len(self.salaries)
+
+    def __getitem__(self, index: int) -> Vacancy:
+        """Возвращает вакансию с указанным номером как экземпляр Vacancy."""
+        return Vacancy(self.titles[index], self.links[index],
+                       self.salaries[index], self.requirements[index])
+
+    def rows(self) -> Iterator[tuple]:
+        """Поочередно возвращает кортежи (title, link, salary, requirement)."""
+        return zip(self.titles, self.links, self.salaries, self.requirements)
+
+    def to_dicts(self) -> list[dict]:
+        """Переводит данные вакансий в список словарей."""
+        return [{'title': title, 'link': link, 'salary': salary,
+                 'requirement': requirement}
+                for title, link, salary, requirement in self.rows()]
+
+    def salary_mask(self, min_salary: int = None,
+                    max_salary: int = None) -> list[bool]:
+        """
+        Возвращает маску вакансий с зарплатой от min_salary
+        до max_salary включительно.
+        """
+        if np is not None:
+            salaries = np.frombuffer(self.salaries, dtype=np.int64)
+            mask = np.ones(len(salaries), dtype=bool)
+            if min_salary is not None:
+                mask &= salaries >= min_salary
+            if max_salary is not None:
+                mask &= salaries <= max_salary
+            return mask
+
+        low = min_salary if min_salary is not None else -sys.maxsize
+        high = max_salary if max_salary is not None else sys.maxsize
+        return [low <= salary <= high for salary in self.salaries]
+
+    def filter(self, mask) -> 'VacancyBatch':
+        """Возвращает новую пачку из вакансий, отмеченных в маске."""
+        positions = [position for position, keep in enumerate(mask) if keep]
+        return self.take(positions)
+
+    def take(self, positions) -> 'VacancyBatch':
+        """Возвращает новую пачку из вакансий с указанными номерами."""
+        return VacancyBatch([self.titles[i] for i in positions],
+                            [self.links[i] for i in positions],
+                            [self.salaries[i] for i in positions],
+                            [self.requirements[i] for i in positions])
+
+    def argsort(self, reverse: bool = False) -> list[int]:
+        """Возвращает номера вакансий в порядке сортировки по зарплате."""
+        if np is not None:
+            salaries = np.frombuffer(self.salaries, dtype=np.int64)
+            order = np.argsort(-salaries if reverse else salaries,
+                               kind='stable')
+            return order.tolist()
+        return sorted(range(len(self.salaries)),
+                      key=self.salaries.__getitem__, reverse=reverse)
+
+    def sort(self, reverse: bool = False) -> 'VacancyBatch':
+        """Возвращает новую пачку, отсортированную по зарплате."""
+        return self.take(self.argsort(reverse))
+
+    def extend(self, other: 'VacancyBatch') -> None:
+        """Добавляет в пачку вакансии из другой пачки."""
+        self.titles.extend(other.titles)
+        self.links.extend(other.links)
+        self.salaries.extend(other.salaries)
+        self.requirements.extend(other.requirements)
+
+    def __repr__(self) -> str:
+        """Возвращает информацию об объекте класса в режиме отладки."""
+        return f"{self.__class__.__name__}(size={len(self)})."
@@ -0,0 +1,48 @@
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path[:0] = [ROOT_DIR, os.path.join(ROOT_DIR, 'src'),
+                os.path.join(ROOT_DIR, 'benchmarks')]
+
+from mockapi import MockAPIServer  # noqa: E402
+from transport import HTTPTransport  # noqa: E402
+from cache import ResponseCache  # noqa: E402
+from scheduler import RequestScheduler  # noqa: E402
+
+# Задержка ответа заглушки API и количество страниц поиска.
+LATENCY = 0.1
+PAGES = 8
+
+
+@pytest.fixture(scope='module')
+def mock_api():
+    """Заглушка API HeadHunter и SuperJob с задержкой ответа."""
+    with MockAPIServer(latency=LATENCY, pages=PAGES) as server:
+        yield server
+
+
+@pytest.fixture
+def make_api(mock_api, tmp_path):
+    """
+    Возвращает функцию, создающую клиент API платформы для заглушки:
+    собственный транспорт, пустой кэш и планировщик без ограничения
+    частоты, чтобы замерялась только загрузка страниц.
+    """
+    transports = []
+
+    def make(api_class, max_workers: int):
+        transport = HTTPTransport()
+        transports.append(transport)
+        cache = ResponseCache(tmp_path / f"cache-{len(transports)}.sqlite")
+        scheduler = RequestScheduler(rate_limits={'hh': 1e9, 'sj': 1e9})
+        api = api_class(max_workers=max_workers, transport=transport,
+                        cache=cache, scheduler=scheduler)
+        api.url = mock_api.url
+        return api
+
+    yield make
+    for transport in transports:
+        transport.close()
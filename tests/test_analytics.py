@@ -0,0 +1,23 @@
+from analytics import SalaryAnalytics, ingest_context
+from jsonsaver import JSONSaver
+from vacancybatch import VacancyBatch
+
+
+def batch(*salaries: int) -> VacancyBatch:
+    return VacancyBatch.from_rows(
+        (f"Вакансия {number}", f"https://hh.ru/vacancy/{number}", salary,
+         'python') for number, salary in enumerate(salaries)
+    )
+
+
+def test_refetched_vacancies_counted_once(tmp_path):
+    analytics = SalaryAnalytics()
+    saver = JSONSaver(tmp_path / 'vacancies.json', analytics=analytics)
+    with ingest_context('python', {'hh': 1}):
+        saver.add_vacancy(batch(100_000, 200_000))
+        saver.add_vacancy(batch(100_000, 200_000))
+        saver.upsert_vacancy(batch(120_000, 220_000, 300_000))
+
+    stats = analytics.stats('hh', 1, 'python')
+    assert stats.count == 3
+    assert stats.total == 600_000
@@ -0,0 +1,81 @@
+import threading
+import time
+
+from asyncfetch import search_platforms, stream_pages
+from conftest import LATENCY, PAGES
+from hhapi import HeadHunterAPI
+from sjapi import SuperJobAPI
+
+AREAS = {'hh': 1, 'sj': 4}
+
+
+class CountingAPI:
+    """Подмешивает к клиенту API подсчет одновременных запросов."""
+
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def get_page(self, *args, **kwargs):
+        cls = CountingAPI
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        try:
+            return super().get_page(*args, **kwargs)
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+
+class CountingHH(CountingAPI, HeadHunterAPI):
+    pass
+
+
+class CountingSJ(CountingAPI, SuperJobAPI):
+    pass
+
+
+def test_search_platforms_matches_sequential(make_api):
+    api_list = [make_api(HeadHunterAPI, 1), make_api(SuperJobAPI, 1)]
+    expected = [api.get_vacancies('python', AREAS[api.platform])
+                for api in api_list]
+
+    api_list = [make_api(HeadHunterAPI, 1), make_api(SuperJobAPI, 1)]
+    assert search_platforms(api_list, 'python', AREAS) == expected
+
+
+def test_search_platforms_close_to_slowest_request(make_api):
+    api_list = [make_api(HeadHunterAPI, 1), make_api(SuperJobAPI, 1)]
+    start = time.perf_counter()
+    search_platforms(api_list, 'python', AREAS, concurrency=2 * PAGES)
+    # Первая страница и все остальные одновременно: два круга запросов
+    # вместо 2 * PAGES последовательных.
+    assert time.perf_counter() - start < 4 * LATENCY
+
+
+def test_stream_pages_shares_concurrency_limit(make_api):
+    CountingAPI.peak = 0
+    received = []
+
+    def emit(api, items) -> bool:
+        assert not isinstance(items, Exception)
+        received.append((api.platform, len(items)))
+        return True
+
+    stream_pages([make_api(CountingHH, 8), make_api(CountingSJ, 8)],
+                 'python', AREAS, emit, concurrency=3)
+    assert len(received) == 2 * PAGES
+    assert CountingAPI.peak == 3
+
+
+def test_stream_pages_stops_when_emit_refuses(make_api):
+    received = []
+
+    def emit(api, items) -> bool:
+        received.append(api.platform)
+        return len(received) < 3
+
+    stream_pages([make_api(HeadHunterAPI, 1), make_api(SuperJobAPI, 1)],
+                 'python', AREAS, emit, concurrency=4)
+    assert len(received) < 2 * PAGES
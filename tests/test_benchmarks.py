@@ -0,0 +1,54 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT_DIR
+
+SUITE = os.path.join(ROOT_DIR, 'benchmarks', 'suite.py')
+SORT = 'main_utils.sort_vacancies.full'
+
+
+def suite(*arguments) -> subprocess.CompletedProcess:
+    """Запускает набор замеров как команду из корня проекта."""
+    return subprocess.run([sys.executable, SUITE, *arguments], cwd=ROOT_DIR,
+                          capture_output=True, text=True, timeout=120)
+
+
+def write_results(path, medians: dict) -> str:
+    """Сохраняет файл результатов с заданными медианами сценариев."""
+    results = {name: {'min': median, 'median': median, 'mean': median,
+                      'repeat': 1}
+               for name, median in medians.items()}
+    path.write_text(json.dumps({'meta': {}, 'results': results}),
+                    encoding='utf-8')
+    return str(path)
+
+
+def test_run_smoke(tmp_path):
+    output = tmp_path / 'results.json'
+    process = suite('run', '--size', '50', '--repeat', '1',
+                    '--only', 'vacancy.init', 'sort_vacancies',
+                    '--output', str(output))
+    assert process.returncode == 0, process.stderr
+
+    report = json.loads(output.read_text(encoding='utf-8'))
+    assert report['meta']['size'] == 50
+    assert {'vacancy.init', SORT} <= report['results'].keys()
+    assert all(result['repeat'] == 1
+               for result in report['results'].values())
+
+
+@pytest.mark.parametrize('current, code', [
+    ({SORT: 0.0105, 'vacancy.init': 0.005}, 0),
+    ({SORT: 0.0150, 'vacancy.init': 0.005}, 1),
+    ({SORT: 0.0050, 'vacancy.init': 0.005}, 0),
+])
+def test_compare_exit_code(tmp_path, current, code):
+    baseline = write_results(tmp_path / 'baseline.json',
+                             {SORT: 0.010, 'vacancy.init': 0.005})
+    current = write_results(tmp_path / 'current.json', current)
+    process = suite('compare', baseline, current, '--tolerance', '0.1')
+    assert process.returncode == code, process.stdout
@@ -0,0 +1,59 @@
+from dedupe import NearDuplicateIndex
+from jsonsaver import JSONSaver
+from vacancybatch import VacancyBatch
+
+REQUIREMENT = ("опыт коммерческой разработки на python от 3 лет, "
+               "знание django, postgresql и docker")
+
+
+def test_cross_platform_copy_is_duplicate():
+    index = NearDuplicateIndex()
+    assert index.add('https://hh.ru/vacancy/1', 'Python-разработчик',
+                     REQUIREMENT, 150_000) is None
+    assert index.add('https://www.superjob.ru/vakansii/1.html',
+                     'Python разработчик', REQUIREMENT + '.',
+                     150_000) == 'https://hh.ru/vacancy/1'
+
+
+def test_same_platform_postings_are_kept():
+    index = NearDuplicateIndex()
+    assert index.add('https://hh.ru/vacancy/1', 'Python-разработчик',
+                     'Нет данных.', 150_000) is None
+    assert index.add('https://hh.ru/vacancy/2', 'Python-разработчик',
+                     'Нет данных.', 150_000) is None
+    assert index.add('https://hh.ru/vacancy/3', 'Python-разработчик',
+                     REQUIREMENT, 150_000) is None
+    assert index.add('https://hh.ru/vacancy/4', 'Python-разработчик',
+                     REQUIREMENT.replace('от 3 лет', 'от 2 лет'),
+                     150_000) is None
+
+
+def test_different_salary_or_employer_is_kept():
+    index = NearDuplicateIndex()
+    index.add('https://hh.ru/vacancy/1', 'Python-разработчик', REQUIREMENT,
+              150_000, 'ООО Ромашка')
+    assert index.add('https://www.superjob.ru/vakansii/1.html',
+                     'Python-разработчик', REQUIREMENT, 180_000,
+                     'ООО Ромашка') is None
+    assert index.add('https://www.superjob.ru/vakansii/2.html',
+                     'Python-разработчик', REQUIREMENT, 150_000,
+                     'АО Лютик') is None
+    assert index.add('https://www.superjob.ru/vakansii/3.html',
+                     'Python-разработчик', REQUIREMENT, 150_000,
+                     'ооо "Ромашка"') == 'https://hh.ru/vacancy/1'
+
+
+def test_store_keeps_distinct_postings(tmp_path):
+    saver = JSONSaver(tmp_path / 'vacancies.json',
+                      deduplicator=NearDuplicateIndex())
+    saver.add_vacancy(VacancyBatch.from_rows([
+        ('Python-разработчик', 'https://hh.ru/vacancy/1', 150_000,
+         'нет данных.'),
+        ('Python-разработчик', 'https://hh.ru/vacancy/2', 150_000,
+         'нет данных.'),
+        ('Python-разработчик', 'https://hh.ru/vacancy/3', 120_000,
+         REQUIREMENT),
+        ('Python-разработчик', 'https://www.superjob.ru/vakansii/3.html',
+         120_000, REQUIREMENT),
+    ]))
+    assert [item['link'][-1] for item in saver.data] == ['1', '2', '3']
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from jsonlsaver import JSONLSaver
+from jsonsaver import JSONSaver
+from vacancy import Vacancy
+
+ITEMS = [Vacancy('Разработчик C++', 'https://hh.ru/vacancy/1', 150_000,
+                 'знание c++ и python'),
+         Vacancy('Верстальщик', 'https://hh.ru/vacancy/2', 90_000,
+                 'css и html'),
+         Vacancy('Разработчик', 'https://hh.ru/vacancy/3', 200_000,
+                 'cpython internals')]
+
+
+def test_import_json(tmp_path):
+    json_saver = JSONSaver(tmp_path / 'vacancies.json')
+    json_saver.add_vacancy(ITEMS)
+
+    saver = JSONLSaver(tmp_path / 'vacancies.jsonl', background=False)
+    assert saver.import_json(tmp_path / 'vacancies.json') == len(ITEMS)
+    # Повторный перенос заменяет вакансии с теми же ссылками.
+    assert saver.import_json(tmp_path / 'vacancies.json') == len(ITEMS)
+
+    loaded = JSONLSaver(tmp_path / 'vacancies.jsonl')
+    loaded.load_data()
+    assert loaded.data == json_saver.data
+
+
+@pytest.mark.parametrize('body', ['[{"title"', '{"title": "x"}',
+                                  '[{"title": "x"}]'])
+def test_import_json_rejects_broken_file(tmp_path, body):
+    (tmp_path / 'broken.json').write_text(body, encoding='utf-8')
+    saver = JSONLSaver(tmp_path / 'vacancies.jsonl', background=False)
+    with pytest.raises(ValueError):
+        saver.import_json(tmp_path / 'broken.json')
+    assert saver.data == []
+    assert not (tmp_path / 'vacancies.jsonl').exists()
+
+
+@pytest.mark.parametrize('criteria_list, expected', [
+    (['c++'], {'https://hh.ru/vacancy/1'}),
+    (['python'], {'https://hh.ru/vacancy/1', 'https://hh.ru/vacancy/3'}),
+    (['+'], {'https://hh.ru/vacancy/1', 'https://hh.ru/vacancy/2',
+             'https://hh.ru/vacancy/3'}),
+])
+def test_get_requirement(tmp_path, criteria_list, expected):
+    saver = JSONLSaver(tmp_path / 'vacancies.jsonl', background=False)
+    saver.add_vacancy(ITEMS)
+    saver.get_requirement(criteria_list)
+    assert {item['link'] for item in saver.data} == expected
+
+    lines = (tmp_path / 'vacancies.jsonl').read_text(encoding='utf-8')
+    assert all(json.loads(line) for line in lines.splitlines())
+
+
+def test_load_data_skips_torn_line(tmp_path):
+    filename = tmp_path / 'vacancies.jsonl'
+    saver = JSONLSaver(filename, background=False)
+    saver.add_vacancy(ITEMS)
+    saver.delete_vacancy(ITEMS[1].link)
+    # Сбой записи оставил в конце файла оборванную строку.
+    with open(filename, 'ab') as file:
+        file.write('{"title": "Обор'.encode())
+
+    loaded = JSONLSaver(filename, background=False)
+    loaded.load_data()
+    assert loaded.data == saver.data
+    assert 'Разработчик C++' in filename.read_text(encoding='utf-8')
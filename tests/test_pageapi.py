@@ -0,0 +1,47 @@
+import time
+
+import pytest
+
+from hhapi import HeadHunterAPI
+from sjapi import SuperJobAPI
+from conftest import LATENCY, PAGES
+
+
+def timed(func, *args):
+    """Возвращает результат функции и время ее выполнения."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+@pytest.mark.parametrize('api_class', [HeadHunterAPI, SuperJobAPI])
+def test_fetch_pages_matches_sequential(make_api, api_class):
+    api = make_api(api_class, 4)
+    sequential = [make_api(api_class, 1).get_page('python', 1, page)
+                  for page in range(PAGES)]
+    assert api.fetch_pages('python', 1, range(PAGES)) == sequential
+
+
+@pytest.mark.parametrize('api_class', [HeadHunterAPI, SuperJobAPI])
+def test_fetch_pages_scales_with_workers(make_api, api_class):
+    _, one_worker = timed(make_api(api_class, 1).fetch_pages,
+                          'python', 1, range(PAGES))
+    _, four_workers = timed(make_api(api_class, 4).fetch_pages,
+                            'python', 1, range(PAGES))
+    assert one_worker >= PAGES * LATENCY
+    assert four_workers < one_worker / 2
+
+
+@pytest.mark.parametrize('api_class', [HeadHunterAPI, SuperJobAPI])
+def test_get_vacancies_matches_sequential(make_api, api_class):
+    sequential, one_worker = timed(make_api(api_class, 1).get_vacancies,
+                                   'python', 1)
+    parallel, four_workers = timed(make_api(api_class, 4).get_vacancies,
+                                   'python', 1)
+    assert parallel == sequential
+    assert len(parallel) > 0
+    assert four_workers < one_worker / 2
+
+
+def test_fetch_pages_empty_range(make_api):
+    assert make_api(HeadHunterAPI, 4).fetch_pages('python', 1, range(0)) == []
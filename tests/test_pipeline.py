@@ -0,0 +1,74 @@
+import threading
+import time
+
+import pytest
+
+from hhapi import HeadHunterAPI
+from sjapi import SuperJobAPI
+from pageapi import ErrorResponse
+from pipeline import run_pipeline, source, dedupe
+from jsonsaver import JSONSaver
+
+AREAS = {'hh': 1, 'sj': 4}
+
+
+@pytest.mark.parametrize('criteria_list', [['sql'], ['ci/cd', 'python'],
+                                           ['+']])
+def test_ingest_filter_matches_store_filter(make_api, tmp_path,
+                                            criteria_list):
+    filtered = JSONSaver(tmp_path / 'filtered.json')
+    with filtered.batch():
+        run_pipeline([make_api(HeadHunterAPI, 4), make_api(SuperJobAPI, 4)],
+                     'python', AREAS, filtered, 100_000, criteria_list)
+
+    stored = JSONSaver(tmp_path / 'stored.json')
+    with stored.batch():
+        run_pipeline([make_api(HeadHunterAPI, 4), make_api(SuperJobAPI, 4)],
+                     'python', AREAS, stored, 100_000)
+        stored.get_requirement(criteria_list)
+
+    assert filtered.data
+    assert sorted(item['link'] for item in filtered.data) == \
+        sorted(item['link'] for item in stored.data)
+
+
+def source_threads() -> list[threading.Thread]:
+    return [thread for thread in threading.enumerate()
+            if thread.name.startswith('pipeline-source')]
+
+
+def wait_for_producers(timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while source_threads() and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+def test_source_stops_producers_on_close(make_api):
+    pages = source([make_api(HeadHunterAPI, 4), make_api(SuperJobAPI, 4)],
+                   'python', AREAS, buffer=1)
+    next(pages)
+    pages.close()
+    wait_for_producers()
+    assert not source_threads()
+
+
+def test_source_stops_producers_on_error(make_api):
+    class BrokenAPI(SuperJobAPI):
+        def get_page(self, search_query, search_area, page, since=None):
+            if page == 2:
+                raise ErrorResponse("Ошибка при выполнении запроса: 500")
+            return super().get_page(search_query, search_area, page, since)
+
+    with pytest.raises(ErrorResponse):
+        for _ in source([make_api(HeadHunterAPI, 4), make_api(BrokenAPI, 4)],
+                        'python', AREAS, buffer=1):
+            pass
+    wait_for_producers()
+    assert not source_threads()
+
+
+def test_dedupe_window():
+    rows = [('a', link, 1, 'x') for link in ('1', '2', '1', '3', '1')]
+    assert [row[1] for row in dedupe(rows)] == ['1', '2', '3']
+    assert [row[1] for row in dedupe(rows, window=1)] == \
+        ['1', '2', '1', '3', '1']
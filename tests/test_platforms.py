@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT_DIR
+from platforms import platforms
+
+
+def loaded_modules(statement: str) -> set[str]:
+    """Выполняет statement в новом процессе и возвращает его модули."""
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        [ROOT_DIR, os.path.join(ROOT_DIR, 'src')]))
+    output = subprocess.run(
+        [sys.executable, '-c',
+         f"{statement}; import sys; print(' '.join(sys.modules))"],
+        env=environment, capture_output=True, text=True, check=True
+    ).stdout
+    return set(output.split())
+
+
+def test_only_selected_platform_is_imported():
+    modules = loaded_modules("from platforms import platforms; "
+                             "platforms.resolve('hh'); platforms.aliases(); "
+                             "platforms.get_class('HeadHunter')")
+    assert 'hhapi' in modules
+    assert 'sjapi' not in modules
+    assert 'dotenv' not in modules
+
+
+def test_resolve_does_not_import():
+    modules = loaded_modules("from platforms import platforms; "
+                             "platforms.resolve('superjob')")
+    assert not {'hhapi', 'sjapi', 'pageapi'} & modules
+
+
+def test_aliases():
+    assert platforms.resolve(' SuperJob ') == 'sj'
+    assert platforms.resolve('avito') is None
+    assert platforms.get_class('headhunter').platform == 'hh'
+    with pytest.raises(KeyError):
+        platforms.get_class('avito')
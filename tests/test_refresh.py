@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from conftest import PAGES
+from jsonsaver import JSONSaver
+from hhapi import HeadHunterAPI
+from sjapi import SuperJobAPI
+from refresh import Watermarks, refresh_all
+
+AREAS = {'hh': 1, 'sj': 4}
+
+
+def test_marks_saved_after_store(make_api, tmp_path):
+    saver = JSONSaver(tmp_path / 'vacancies.json')
+    api_list = [make_api(HeadHunterAPI, 4), make_api(SuperJobAPI, 4)]
+
+    assert refresh_all(api_list, 'python', AREAS, saver) > 0
+    watermarks = Watermarks.for_saver(saver)
+    assert watermarks.get('hh', 'python', 1) is not None
+    assert watermarks.get('sj', 'python', 4) is not None
+
+
+def test_marks_not_saved_when_store_fails(make_api, tmp_path, monkeypatch):
+    saver = JSONSaver(tmp_path / 'vacancies.json')
+
+    def fail() -> None:
+        raise OSError("Диск переполнен")
+
+    monkeypatch.setattr(saver, 'flush', fail)
+    with pytest.raises(OSError):
+        refresh_all([make_api(HeadHunterAPI, 4)], 'python', AREAS, saver)
+    assert not Watermarks.for_saver(saver).marks
+
+
+def test_mark_kept_at_page_limit(make_api, tmp_path):
+    saver = JSONSaver(tmp_path / 'vacancies.json')
+    api = make_api(HeadHunterAPI, 4)
+    api.max_pages = PAGES - 1
+
+    assert refresh_all([api], 'python', AREAS, saver) > 0
+    assert Watermarks.for_saver(saver).get('hh', 'python', 1) is None
+
+
+@pytest.mark.parametrize('api_class', [HeadHunterAPI, SuperJobAPI])
+def test_incremental_pages_revalidated(make_api, mock_api, api_class):
+    api = make_api(api_class, 1)
+    since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    start = mock_api.requests
+    api.get_page('python', AREAS[api.platform], 0)
+    api.get_page('python', AREAS[api.platform], 0)
+    assert mock_api.requests - start == 1
+
+    start = mock_api.requests
+    api.get_page('python', AREAS[api.platform], 0, since)
+    api.get_page('python', AREAS[api.platform], 0, since)
+    assert mock_api.requests - start == 2
@@ -0,0 +1,82 @@
+import multiprocessing
+import sqlite3
+
+import pytest
+
+import cache
+import regions
+from analytics import SalaryAnalytics
+from arearesolver import Area
+from hhapi import HeadHunterAPI
+from jsonsaver import JSONSaver
+from regions import merge_shards, shard_scheduler, store_rows
+from settings import RATE_LIMITS
+from sjapi import SuperJobAPI
+
+
+def row(number: int, salary: int, area: tuple) -> tuple:
+    return (f"Вакансия {number}", f"https://hh.ru/vacancy/{number}",
+            salary, 'python', area)
+
+
+def test_store_rows_updates_saved_vacancies(tmp_path):
+    saver = JSONSaver(tmp_path / 'vacancies.json',
+                      analytics=SalaryAnalytics())
+    with saver.batch():
+        store_rows([row(1, 100, (1, 4)), row(2, 200, (1, 4))],
+                   saver, 'python')
+    runs = [[row(1, 150, (1, 4))], [row(2, 250, (2, 14)), row(3, 300,
+                                                              (2, 14))]]
+    with saver.batch():
+        assert store_rows(merge_shards(runs), saver, 'python') == 3
+
+    salaries = {item['link'][-1]: item['salary'] for item in saver.data}
+    assert salaries == {'1': 150, '2': 250, '3': 300}
+
+
+def test_store_rows_counts_salaries_by_area(tmp_path):
+    analytics = SalaryAnalytics()
+    saver = JSONSaver(tmp_path / 'vacancies.json', analytics=analytics)
+    with saver.batch():
+        store_rows([row(1, 100, (1, 4)), row(2, 200, (2, 14)),
+                    row(3, 300, (1, 4))], saver, 'Python', chunk_size=1)
+
+    assert analytics.stats('hh', 1, 'python').count == 2
+    assert analytics.stats('hh', 2, 'python').count == 1
+
+
+def test_shard_scheduler_divides_rate_limits():
+    scheduler = shard_scheduler(['HeadHunter', 'sj'], 4)
+    assert scheduler.rate_limits == {name: rate / 4
+                                     for name, rate in RATE_LIMITS.items()}
+
+
+class StubResolver:
+    def areas(self) -> list[Area]:
+        return [Area(f"Город {number}", number, number + 100)
+                for number in range(1, 7)]
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                    reason="части наследуют настройки заглушки через fork")
+def test_shards_share_response_cache(mock_api, tmp_path, monkeypatch):
+    cache_file = tmp_path / 'responses.sqlite'
+    monkeypatch.setattr(cache, 'PATH_CACHE_FILE', cache_file)
+    monkeypatch.setattr(cache, '_cache', None)
+    monkeypatch.setattr(regions, 'RATE_LIMITS', {'hh': 1e9, 'sj': 1e9})
+    monkeypatch.setattr(regions, 'get_area_resolver', StubResolver)
+    for api_class in (HeadHunterAPI, SuperJobAPI):
+        def init(self, *args, __init__=api_class.__init__, **kwargs):
+            __init__(self, *args, **kwargs)
+            self.url = mock_api.url
+        monkeypatch.setattr(api_class, '__init__', init)
+
+    saver = JSONSaver(tmp_path / 'vacancies.json')
+    assert regions.crawl_regions('python', saver, shards=3) > 0
+    assert len({item['link'] for item in saver.data}) == len(saver.data)
+
+    with sqlite3.connect(cache_file) as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == \
+            'wal'
+        assert connection.execute(
+            "SELECT COUNT(*) FROM responses").fetchone()[0] > 0
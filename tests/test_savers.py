@@ -0,0 +1,30 @@
+import pytest
+
+from jsonlsaver import JSONLSaver
+from jsonsaver import JSONSaver
+from sqlitesaver import SQLiteSaver
+from vacancybatch import VacancyBatch
+
+SALARIES = [50_000, 100_000, 150_000, 200_000, 250_000]
+
+
+@pytest.fixture(params=[JSONSaver, SQLiteSaver, JSONLSaver])
+def saver(request, tmp_path):
+    saver = request.param(tmp_path / 'vacancies')
+    saver.load_data()
+    saver.add_vacancy(VacancyBatch.from_rows(
+        (f"Вакансия {salary}", f"https://hh.ru/vacancy/{salary}", salary,
+         'python') for salary in SALARIES
+    ))
+    return saver
+
+
+@pytest.mark.parametrize('min_salary, max_salary, expected', [
+    (100_000, None, SALARIES[1:]),
+    (100_000, 200_000, SALARIES[1:4]),
+    (0, 100_000, SALARIES[:2]),
+    (300_000, None, []),
+])
+def test_get_salary(saver, min_salary, max_salary, expected):
+    saver.get_salary(min_salary, max_salary)
+    assert sorted(item['salary'] for item in saver.data) == expected
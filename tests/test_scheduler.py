@@ -0,0 +1,102 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from scheduler import TokenBucket, RequestScheduler, parse_retry_after, \
+    PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND
+
+
+class StubResponse:
+    def __init__(self, status_code: int, headers: dict = None) -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class StubServer:
+    """Отдает заданные ответы по очереди и запоминает время запросов."""
+
+    def __init__(self, *responses: StubResponse) -> None:
+        self.responses = list(responses)
+        self.times = []
+
+    def send(self) -> StubResponse:
+        self.times.append(time.monotonic())
+        return self.responses[min(len(self.times),
+                                  len(self.responses)) - 1]
+
+
+def make_scheduler(max_retries: int = 3) -> RequestScheduler:
+    return RequestScheduler(rate_limits={'hh': 1000}, max_retries=max_retries,
+                            base_delay=0.05, max_delay=1)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('2') == 2.0
+    assert parse_retry_after('-1') == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('soon') is None
+    date = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < parse_retry_after(format_datetime(date, usegmt=True)) <= 30
+
+
+def test_retry_after_delays_next_request():
+    server = StubServer(StubResponse(429, {'Retry-After': '0.3'}),
+                        StubResponse(200))
+    scheduler = make_scheduler()
+
+    assert scheduler.request('hh', server.send).status_code == 200
+    assert len(server.times) == 2
+    assert server.times[1] - server.times[0] >= 0.3
+    assert scheduler.stats['throttled'] == 1
+    assert scheduler.buckets['hh'].rate < 1000
+
+
+def test_server_errors_retried_with_backoff():
+    server = StubServer(StubResponse(503), StubResponse(502),
+                        StubResponse(200))
+    scheduler = make_scheduler()
+
+    assert scheduler.request('hh', server.send).status_code == 200
+    assert len(server.times) == 3
+    # Задержка перед повтором - не меньше половины base_delay * 2 ** attempt.
+    assert server.times[1] - server.times[0] >= 0.025
+    assert server.times[2] - server.times[1] >= 0.05
+    assert scheduler.stats['retries'] == 2
+
+
+@pytest.mark.parametrize('status_code', [429, 500])
+def test_retries_stop_at_limit(status_code):
+    server = StubServer(StubResponse(status_code, {'Retry-After': '0'}))
+    scheduler = make_scheduler(max_retries=2)
+
+    response = scheduler.request('hh', server.send)
+    assert response.status_code == status_code
+    assert len(server.times) == 3
+    assert scheduler.stats['requests'] == 3
+
+
+def test_interactive_requests_overtake_background():
+    bucket = TokenBucket(rate=100, capacity=1)
+    bucket.throttle(0.3)
+    order = []
+
+    def take(name: str, priority: int) -> None:
+        bucket.acquire(priority)
+        order.append(name)
+
+    def start(name: str, priority: int, waiters: int) -> threading.Thread:
+        thread = threading.Thread(target=take, args=(name, priority))
+        thread.start()
+        while len(bucket._waiters) < waiters:
+            time.sleep(0.001)
+        return thread
+
+    threads = [start('background', PRIORITY_BACKGROUND, 1),
+               start('interactive', PRIORITY_INTERACTIVE, 2)]
+    for thread in threads:
+        thread.join(5)
+
+    assert order == ['interactive', 'background']
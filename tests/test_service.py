@@ -0,0 +1,51 @@
+import json
+import threading
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+
+from service import VacancyServer
+from settings import SERVICE_MAX_RESULTS
+
+
+@pytest.fixture
+def service_url(tmp_path):
+    """Служба запросов к хранилищу из 300 вакансий."""
+    filename = tmp_path / 'vacancies.json'
+    filename.write_text(json.dumps([
+        {'title': f"Вакансия {number}",
+         'link': f"https://hh.ru/vacancy/{number}",
+         'salary': 50_000 + number * 1000, 'requirement': 'python, sql'}
+        for number in range(300)
+    ]), encoding='utf-8')
+    server = VacancyServer(filename, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def get(url: str) -> tuple[int, dict]:
+    try:
+        with urlopen(url) as response:
+            return response.status, json.load(response)
+    except HTTPError as error:
+        return error.code, json.load(error)
+
+
+@pytest.mark.parametrize('query', ['/salary?limit=-1', '/salary?limit=0',
+                                   '/search?q=python&limit=-5', '/top?n=0',
+                                   '/top?n=-3', '/salary?limit=abc'])
+def test_invalid_counts_rejected(service_url, query):
+    status, _ = get(service_url + query)
+    assert status == 400
+
+
+@pytest.mark.parametrize('query', ['/salary?limit=1000', '/top?n=1000',
+                                   '/search?q=python&limit=1000'])
+def test_counts_capped(service_url, query):
+    status, payload = get(service_url + query)
+    assert status == 200
+    assert len(payload['items']) == SERVICE_MAX_RESULTS
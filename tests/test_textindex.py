@@ -0,0 +1,92 @@
+import pytest
+
+from textindex import InvertedIndex, KeywordMatcher
+from jsonsaver import JSONSaver
+from sqlitesaver import SQLiteSaver
+from extsort import filter_requirement
+from vacancy import Vacancy
+
+TEXTS = ['css и html', 'знание c++ и python', 'c# и .net', 'cpython internals',
+         'опыт ci/cd', 'python3, django', 'Нет данных.']
+
+
+def search(criteria_list, whole_words=False) -> set:
+    """Ищет ключевые слова по индексу текстов TEXTS."""
+    index = InvertedIndex()
+    for number, text in enumerate(TEXTS):
+        index.add(number, text)
+    return {TEXTS[number]
+            for number in index.search(criteria_list, whole_words)}
+
+
+def substring(criteria_list) -> set:
+    """Исходная фильтрация: все ключевые слова - подстроки текста."""
+    return {text for text in TEXTS
+            if all(criteria in text.lower() for criteria in criteria_list)}
+
+
+@pytest.mark.parametrize('criteria_list', [
+    ['c++'], ['c#'], ['python'], ['cpython'], ['.net'], ['ci/cd'],
+    ['i/c'], ['c'], ['pyth', 'django'], ['и', 'html'], ['нет'], ['java'],
+])
+def test_search_matches_substring_baseline(criteria_list):
+    assert search(criteria_list) == substring(criteria_list)
+
+
+def test_search_keeps_keyword_symbols():
+    assert search(['c++']) == {'знание c++ и python'}
+    assert search(['c#']) == {'c# и .net'}
+    assert search(['python']) == {'знание c++ и python', 'cpython internals',
+                                  'python3, django'}
+
+
+def test_search_whole_words():
+    assert search(['python'], whole_words=True) == {'знание c++ и python'}
+    assert search(['c++'], whole_words=True) == {'знание c++ и python'}
+    assert search(['ci/cd'], whole_words=True) == {'опыт ci/cd'}
+    assert search(['pyth'], whole_words=True) == set()
+
+
+@pytest.mark.parametrize('criteria_list', [[], ['+'], ['  ', '-']])
+def test_search_without_tokens_does_not_filter(criteria_list):
+    assert search(criteria_list) == set(TEXTS)
+    assert not KeywordMatcher(criteria_list)
+
+
+def test_search_after_remove():
+    index = InvertedIndex()
+    for number, text in enumerate(TEXTS):
+        index.add(number, text)
+    index.remove(1)
+    assert index.search(['c++']) == set()
+    assert not index.texts.get(1)
+
+
+def vacancies() -> list[Vacancy]:
+    """Вакансии с требованиями из TEXTS."""
+    return [Vacancy(f"Вакансия {number}", f"https://hh.ru/vacancy/{number}",
+                    100_000 + number, text)
+            for number, text in enumerate(TEXTS)]
+
+
+@pytest.mark.parametrize('criteria_list', [
+    ['c++'], ['c#'], ['python'], ['ci/cd'], ['+'], ['python', 'django'],
+])
+def test_savers_share_matching(tmp_path, criteria_list):
+    expected = {vacancy.requirement for vacancy in vacancies()
+                if KeywordMatcher(criteria_list).matches(vacancy.requirement)}
+
+    json_saver = JSONSaver(tmp_path / 'vacancies.json')
+    json_saver.add_vacancy(vacancies())
+    json_saver.get_requirement(criteria_list)
+    assert {item['requirement'] for item in json_saver.data} == expected
+
+    sqlite_saver = SQLiteSaver(tmp_path / 'vacancies.sqlite')
+    sqlite_saver.add_vacancy(vacancies())
+    sqlite_saver.get_requirement(criteria_list)
+    assert {item['requirement']
+            for item in sqlite_saver.salary_range()} == expected
+
+    items = [vacancy.to_dict() for vacancy in vacancies()]
+    assert {item['requirement']
+            for item in filter_requirement(items, criteria_list)} == expected